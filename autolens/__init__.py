@@ -49,12 +49,28 @@ from autogalaxy.util import convert
 from . import aggregator as agg
 from . import plot
 from .dataset.imaging import MaskedImaging, SimulatorImaging
-from .dataset.interferometer import MaskedInterferometer, SimulatorInterferometer
-from .fit.fit import FitImaging, FitInterferometer
+from .dataset.interferometer import (
+    InterferometerChunks,
+    MaskedInterferometer,
+    MaskedInterferometerChunks,
+    SimulatorInterferometer,
+    VisibilitiesBinning,
+)
+from .fit.fit import (
+    FitImaging,
+    FitImagingWorkspace,
+    FitInterferometer,
+    FitInterferometerChunks,
+    FitInterferometerWorkspace,
+)
 from .fit.fit_positions import FitPositionsSourcePlaneMaxSeparation
 from .lens.settings import SettingsLens
-from .lens.ray_tracing import Tracer
-from .lens.positions_solver import PositionsFinder
+from .lens.ray_tracing import Tracer, BatchTracer
+from .lens.positions_solver import (
+    PositionsFinder,
+    PositionsSolverNewton,
+    PositionsSolverTriangles,
+)
 from .pipeline.setup import SetupPipeline
 from .pipeline import slam
 from .pipeline.phase.settings import SettingsPhaseImaging
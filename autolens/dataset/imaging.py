@@ -3,6 +3,7 @@ import copy
 from autoarray.dataset import imaging
 from autoarray.structures import grids
 from autogalaxy.dataset import imaging as im
+from autolens.dataset import shared
 from autolens.lens import ray_tracing
 
 
@@ -42,6 +43,22 @@ class MaskedImaging(imaging.MaskedImaging):
             imaging=imaging, mask=mask, settings=settings
         )
 
+    def export_to_shared_memory(self, directory=None):
+        """
+        Export the arrays of the masked imaging (image, noise-map, grids, convolver, etc.) to a memory-mapped file, \
+        returning a *SharedDataset* which is cheap to pickle and which other processes *attach* to in order to \
+        rebuild this masked imaging without copying its arrays.
+
+        The process which exports the masked imaging should call *unlink* on the *SharedDataset* once it is no \
+        longer used.
+
+        Parameters
+        ----------
+        directory : str or None
+            The directory the memory-mapped file is written to, which defaults to /dev/shm where it exists.
+        """
+        return shared.SharedDataset.from_dataset(dataset=self, directory=directory)
+
 
 class SimulatorImaging(imaging.SimulatorImaging):
     def __init__(
@@ -1,8 +1,14 @@
 import copy
 
+import numpy as np
+
+from autoarray import exc
 from autoarray.dataset import interferometer
+from autoarray.mask import mask as msk
 from autoarray.operators import transformer
 from autoarray.structures import grids
+from autoarray.structures import visibilities as vis
+from autoarray.util import transformer_util
 from autogalaxy.dataset import interferometer as inter
 from autolens.lens import ray_tracing
 
@@ -50,6 +56,445 @@ class MaskedInterferometer(interferometer.MaskedInterferometer):
         )
 
 
+class VisibilitiesBinning:
+    def __init__(
+        self,
+        interferometer,
+        binned_interferometer,
+        bin_indexes,
+        uv_wavelengths,
+        visibilities,
+        uv_pixel_scale,
+    ):
+        """
+        An interferometer dataset whose visibilities are binned onto a regular grid in the uv-plane, reducing the \
+        number of visibilities that are fitted, alongside a report of the accuracy lost by binning them.
+
+        Visibilities are first folded onto the upper half of the uv-plane using V(-u, -v) = V*(u, v) (which holds \
+        for the visibilities of a real image), such that a visibility and its conjugate share a bin. Every bin is \
+        then replaced by a single visibility, whose real and imaginary components are the inverse-variance \
+        weighted means of the components in the bin, with noise equal to the inverse square root of the summed \
+        weights. The binned visibility is placed at the weighted mean (u, v) of the bin, rather than its centre.
+
+        For a model whose visibilities are constant within each bin the chi-squared of the binned dataset is that \
+        of the unbinned dataset minus *chi_squared_offset* (the scatter of the visibilities within their bins), \
+        which does not depend on the model and therefore does not bias the fit. The model visibilities vary within \
+        a bin by at most a phase of *maximum_phase_error_from_real_space_mask*, which is the accuracy traded for a \
+        smaller dataset via the *uv_pixel_scale*. The resulting bias of the chi-squared of a specific model is \
+        computed via *chi_squared_bias_from_image*.
+
+        A *VisibilitiesBinning* is created via the *from_interferometer* or *from_masked_interferometer* methods.
+
+        Parameters
+        ----------
+        interferometer : interferometer.Interferometer
+            The unbinned interferometer dataset.
+        binned_interferometer : interferometer.Interferometer
+            The binned interferometer dataset.
+        bin_indexes : np.ndarray
+            The index of the bin (binned visibility) of every unbinned visibility.
+        uv_wavelengths : np.ndarray
+            The uv-wavelengths of the unbinned visibilities, folded onto the upper half of the uv-plane.
+        visibilities : np.ndarray
+            The unbinned visibilities, folded onto the upper half of the uv-plane.
+        uv_pixel_scale : float
+            The size of every (square) bin in the uv-plane in wavelengths.
+        """
+
+        self.interferometer = interferometer
+        self.binned_interferometer = binned_interferometer
+        self.bin_indexes = bin_indexes
+        self.uv_wavelengths = uv_wavelengths
+        self.visibilities = visibilities
+        self.uv_pixel_scale = uv_pixel_scale
+
+    @classmethod
+    def from_interferometer(cls, interferometer, uv_pixel_scale):
+        """
+        Bin the visibilities of an interferometer dataset onto a grid in the uv-plane with bins of size \
+        *uv_pixel_scale* (in wavelengths).
+        """
+
+        uv_wavelengths = np.array(interferometer.uv_wavelengths, dtype="float")
+        visibilities = np.array(interferometer.visibilities)
+        weights = 1.0 / np.asarray(interferometer.noise_map) ** 2.0
+
+        fold = (uv_wavelengths[:, 1] < 0.0) | (
+            (uv_wavelengths[:, 1] == 0.0) & (uv_wavelengths[:, 0] < 0.0)
+        )
+
+        uv_wavelengths[fold] *= -1.0
+        visibilities[fold, 1] *= -1.0
+
+        bin_indexes = np.unique(
+            np.floor(uv_wavelengths / uv_pixel_scale).astype("int"),
+            axis=0,
+            return_inverse=True,
+        )[1].reshape(-1)
+
+        total_bins = np.max(bin_indexes) + 1
+
+        binned_weights = np.stack(
+            [
+                np.bincount(bin_indexes, weights=weights[:, component])
+                for component in range(2)
+            ],
+            axis=1,
+        )
+
+        binned_visibilities = (
+            np.stack(
+                [
+                    np.bincount(
+                        bin_indexes,
+                        weights=weights[:, component] * visibilities[:, component],
+                    )
+                    for component in range(2)
+                ],
+                axis=1,
+            )
+            / binned_weights
+        )
+
+        uv_weights = np.sum(weights, axis=1)
+
+        binned_uv_wavelengths = (
+            np.stack(
+                [
+                    np.bincount(
+                        bin_indexes, weights=uv_weights * uv_wavelengths[:, component]
+                    )
+                    for component in range(2)
+                ],
+                axis=1,
+            )
+            / np.bincount(bin_indexes, weights=uv_weights, minlength=total_bins)[
+                :, None
+            ]
+        )
+
+        binned_interferometer = type(interferometer)(
+            visibilities=vis.Visibilities.manual_1d(visibilities=binned_visibilities),
+            noise_map=vis.VisibilitiesNoiseMap.manual_1d(
+                visibilities=1.0 / np.sqrt(binned_weights)
+            ),
+            uv_wavelengths=binned_uv_wavelengths,
+            positions=interferometer.positions,
+            name=interferometer.name,
+        )
+
+        return VisibilitiesBinning(
+            interferometer=interferometer,
+            binned_interferometer=binned_interferometer,
+            bin_indexes=bin_indexes,
+            uv_wavelengths=uv_wavelengths,
+            visibilities=visibilities,
+            uv_pixel_scale=uv_pixel_scale,
+        )
+
+    @classmethod
+    def from_masked_interferometer(cls, masked_interferometer, maximum_phase_error=0.1):
+        """
+        Bin the visibilities of a masked interferometer dataset, choosing the *uv_pixel_scale* such that the model \
+        visibilities of any image within its real-space mask vary by at most a phase of *maximum_phase_error* \
+        (in radians) within every bin.
+
+        The phase of the visibility of an image pixel at x (radians) varies across a bin by 2 pi |du| |x|, where \
+        du is the offset from the bin's (u, v), which is at most the diagonal of the bin.
+        """
+
+        uv_pixel_scale = maximum_phase_error / (
+            2.0
+            * np.pi
+            * np.sqrt(2.0)
+            * radius_of_real_space_mask_radians_from(
+                real_space_mask=masked_interferometer.real_space_mask
+            )
+        )
+
+        return cls.from_interferometer(
+            interferometer=masked_interferometer.interferometer,
+            uv_pixel_scale=uv_pixel_scale,
+        )
+
+    def masked_interferometer_from(self, masked_interferometer):
+        """
+        Returns a masked interferometer of the binned dataset, with the same real-space mask and settings as an \
+        input masked interferometer of the unbinned dataset.
+        """
+        return MaskedInterferometer(
+            interferometer=self.binned_interferometer,
+            visibilities_mask=np.full(
+                fill_value=False, shape=self.binned_interferometer.visibilities.shape
+            ),
+            real_space_mask=masked_interferometer.real_space_mask,
+            settings=masked_interferometer.settings,
+        )
+
+    @property
+    def total_visibilities(self):
+        return self.visibilities.shape[0]
+
+    @property
+    def total_binned_visibilities(self):
+        return self.binned_interferometer.visibilities.shape[0]
+
+    @property
+    def compression(self):
+        """
+        The factor by which binning reduces the number of visibilities.
+        """
+        return self.total_visibilities / self.total_binned_visibilities
+
+    @property
+    def chi_squared_offset(self):
+        """
+        The chi-squared of the unbinned visibilities about the binned visibility of their bin, which is the \
+        (model independent) difference between the chi-squared of the unbinned and binned datasets.
+        """
+        weights = 1.0 / np.asarray(self.interferometer.noise_map) ** 2.0
+
+        return np.sum(
+            weights
+            * (
+                self.visibilities
+                - np.asarray(self.binned_interferometer.visibilities)[self.bin_indexes]
+            )
+            ** 2.0
+        )
+
+    def maximum_phase_error_from_real_space_mask(self, real_space_mask):
+        """
+        The maximum phase (in radians) by which the visibility of an image pixel within the real-space mask varies \
+        between an unbinned visibility and its binned visibility.
+        """
+        uv_offsets = (
+            self.uv_wavelengths
+            - np.asarray(self.binned_interferometer.uv_wavelengths)[self.bin_indexes]
+        )
+
+        return (
+            2.0
+            * np.pi
+            * np.max(np.sqrt(np.sum(uv_offsets ** 2.0, axis=1)))
+            * radius_of_real_space_mask_radians_from(real_space_mask=real_space_mask)
+        )
+
+    def chi_squared_bias_from_image(self, image):
+        """
+        The bias that binning introduces to the chi-squared of a model image, which is the chi-squared of the \
+        image's visibilities fitted to the unbinned dataset minus that fitted to the binned dataset and the \
+        *chi_squared_offset*.
+
+        The image is transformed to the uv-plane via a direct Fourier transform, such that this is only feasible \
+        for datasets which can be fitted without binning.
+        """
+
+        image_1d = np.asarray(image.in_1d_binned)
+        grid_radians = np.asarray(
+            image.mask.mask_sub_1.geometry.masked_grid_sub_1.in_1d_binned.in_radians
+        )
+
+        def chi_squared_from(visibilities, noise_map, uv_wavelengths):
+
+            model_visibilities = np.stack(
+                [
+                    transformer_util.real_visibilities_jit(
+                        image_1d=image_1d,
+                        grid_radians=grid_radians,
+                        uv_wavelengths=uv_wavelengths,
+                    ),
+                    transformer_util.imag_visibilities_jit(
+                        image_1d=image_1d,
+                        grid_radians=grid_radians,
+                        uv_wavelengths=uv_wavelengths,
+                    ),
+                ],
+                axis=1,
+            )
+
+            return np.sum(
+                ((visibilities - model_visibilities) / np.asarray(noise_map)) ** 2.0
+            )
+
+        chi_squared = chi_squared_from(
+            visibilities=self.visibilities,
+            noise_map=self.interferometer.noise_map,
+            uv_wavelengths=self.uv_wavelengths,
+        )
+
+        binned_chi_squared = chi_squared_from(
+            visibilities=np.asarray(self.binned_interferometer.visibilities),
+            noise_map=self.binned_interferometer.noise_map,
+            uv_wavelengths=np.asarray(self.binned_interferometer.uv_wavelengths),
+        )
+
+        return chi_squared - binned_chi_squared - self.chi_squared_offset
+
+
+def radius_of_real_space_mask_radians_from(real_space_mask):
+    """
+    The distance (in radians) of the furthest unmasked pixel of a real-space mask from the origin of its grid.
+    """
+    grid_radians = np.asarray(
+        real_space_mask.mask_sub_1.geometry.masked_grid_sub_1.in_1d_binned.in_radians
+    )
+
+    return np.max(np.sqrt(np.sum(grid_radians ** 2.0, axis=1)))
+
+
+class InterferometerChunks:
+    def __init__(self, visibilities, noise_map, uv_wavelengths, chunk_size=100000):
+        """
+        The visibilities, noise-map and uv-wavelengths of an interferometer dataset which is too large to hold in \
+        memory, and is therefore fitted in chunks of visibilities (see *FitInterferometerChunks*).
+
+        The arrays are typically memory-mapped .npy files (see *from_npy*), such that only the chunk of visibilities \
+        being fitted is read into memory. Each array has shape [total_visibilities, 2], where the two columns are \
+        the real and imaginary components.
+
+        Parameters
+        ----------
+        visibilities : np.ndarray
+            The (real and imaginary) visibilities of the dataset.
+        noise_map : np.ndarray
+            The (real and imaginary) noise-map of the visibilities.
+        uv_wavelengths : np.ndarray
+            The (u, v) baselines of the visibilities in wavelengths.
+        chunk_size : int
+            The number of visibilities which are read into memory and fitted at once.
+        """
+
+        if not (visibilities.shape == noise_map.shape == uv_wavelengths.shape):
+            raise exc.DataException(
+                "The visibilities, noise-map and uv-wavelengths of an InterferometerChunks must have the same shape"
+            )
+
+        self.visibilities = visibilities
+        self.noise_map = noise_map
+        self.uv_wavelengths = uv_wavelengths
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def from_interferometer(cls, interferometer, chunk_size=100000):
+        return InterferometerChunks(
+            visibilities=np.asarray(interferometer.visibilities),
+            noise_map=np.asarray(interferometer.noise_map),
+            uv_wavelengths=np.asarray(interferometer.uv_wavelengths, dtype="float"),
+            chunk_size=chunk_size,
+        )
+
+    @classmethod
+    def from_npy(
+        cls, visibilities_path, noise_map_path, uv_wavelengths_path, chunk_size=100000
+    ):
+        """
+        Load the dataset from .npy files, which are memory-mapped rather than read into memory.
+        """
+        return InterferometerChunks(
+            visibilities=np.load(visibilities_path, mmap_mode="r"),
+            noise_map=np.load(noise_map_path, mmap_mode="r"),
+            uv_wavelengths=np.load(uv_wavelengths_path, mmap_mode="r"),
+            chunk_size=chunk_size,
+        )
+
+    def output_to_npy(self, visibilities_path, noise_map_path, uv_wavelengths_path):
+        np.save(visibilities_path, self.visibilities)
+        np.save(noise_map_path, self.noise_map)
+        np.save(uv_wavelengths_path, self.uv_wavelengths)
+
+    @property
+    def total_visibilities(self):
+        return self.visibilities.shape[0]
+
+    @property
+    def chunks(self):
+        """
+        The slices of the visibilities in each chunk of the dataset.
+        """
+        return [
+            slice(start, min(start + self.chunk_size, self.total_visibilities))
+            for start in range(0, self.total_visibilities, self.chunk_size)
+        ]
+
+
+class MaskedInterferometerChunks:
+    def __init__(
+        self,
+        interferometer_chunks,
+        real_space_mask,
+        settings=inter.SettingsMaskedInterferometer(),
+    ):
+        """
+        An *InterferometerChunks* dataset and the real-space mask and grids used to fit it, which is the chunked \
+        equivalent of a *MaskedInterferometer*.
+
+        A *MaskedInterferometer* creates a transformer which (for a *TransformerDFT*) holds the Fourier transform \
+        of every image pixel to every visibility in memory. Instead, the Fourier transforms of the image pixels to \
+        the visibilities of one chunk are computed when the chunk is fitted (see *transforms_from_chunk*), so the \
+        memory used to fit the dataset is independent of its number of visibilities. The *transformer_class* of the \
+        settings is therefore not used.
+
+        Parameters
+        ----------
+        interferometer_chunks : InterferometerChunks
+            The visibilities, noise-map and uv-wavelengths of the dataset.
+        real_space_mask : msk.Mask
+            The 2D mask that is applied to the real-space image.
+        """
+
+        if real_space_mask.sub_size != settings.sub_size:
+            real_space_mask = msk.Mask.manual(
+                mask=real_space_mask,
+                pixel_scales=real_space_mask.pixel_scales,
+                sub_size=settings.sub_size,
+                origin=real_space_mask.origin,
+            )
+
+        self.interferometer_chunks = interferometer_chunks
+        self.real_space_mask = real_space_mask
+        self.settings = settings
+
+        self.grid = settings.grid_from_mask(mask=real_space_mask)
+        self.grid_inversion = settings.grid_inversion_from_mask(mask=real_space_mask)
+
+        self.grid_radians = np.asarray(
+            real_space_mask.geometry.masked_grid_sub_1.in_1d_binned.in_radians
+        )
+
+    @property
+    def chunks(self):
+        return self.interferometer_chunks.chunks
+
+    @property
+    def total_visibilities(self):
+        return self.interferometer_chunks.total_visibilities
+
+    def transforms_from_chunk(self, chunk):
+        """
+        Returns the real and imaginary Fourier transforms of every (binned) image pixel to the visibilities of a \
+        chunk, as arrays of shape [total_image_pixels, chunk_size], such that the (real and imaginary) visibilities \
+        of an image are np.dot(image, transforms[0]) and np.dot(image, transforms[1]).
+
+        These are the same transforms as a *TransformerDFT*, but are computed with numpy, which releases the GIL \
+        such that chunks can be fitted in parallel threads.
+        """
+        uv_wavelengths = np.asarray(
+            self.interferometer_chunks.uv_wavelengths[chunk], dtype="float"
+        )
+
+        phases = (
+            -2.0
+            * np.pi
+            * (
+                np.outer(self.grid_radians[:, 1], uv_wavelengths[:, 0])
+                + np.outer(self.grid_radians[:, 0], uv_wavelengths[:, 1])
+            )
+        )
+
+        return np.cos(phases), np.sin(phases)
+
+
 class SimulatorInterferometer(interferometer.SimulatorInterferometer):
     def __init__(
         self,
@@ -0,0 +1,147 @@
+import io
+import os
+import pickle
+import tempfile
+
+import numpy as np
+
+
+class SharedDataset:
+    def __init__(self, file_path, skeleton):
+        """
+        A dataset (e.g. a *MaskedImaging*) whose arrays are stored in a memory-mapped file, such that processes which \
+        attach to it view the same memory instead of each holding their own copy.
+
+        A *SharedDataset* is created via the *from_dataset* method, which writes every large array of the dataset \
+        (the image, noise-map, grids, convolver index tables, etc.) to the file and pickles the remainder of the \
+        dataset as a small 'skeleton' which refers to the arrays by their offset in the file. The *SharedDataset* \
+        itself is therefore cheap to pickle and send to other processes, which call *attach* to rebuild the dataset \
+        with its arrays as read-only views of the file.
+
+        Any picklable object can be shared this way, for example an *Analysis* holding a masked dataset.
+
+        On Linux the file is placed in /dev/shm by default, so the arrays live in shared memory and are never written \
+        to disk.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the memory-mapped file containing the arrays of the dataset.
+        skeleton : bytes
+            The pickled dataset, with its arrays replaced by references to their location in the file.
+        """
+        self.file_path = file_path
+        self.skeleton = skeleton
+
+    @classmethod
+    def from_dataset(cls, dataset, directory=None, minimum_bytes=1024):
+        """
+        Write the arrays of a dataset to a memory-mapped file and return the *SharedDataset* used to attach to it.
+
+        The process calling this method owns the file and should call *unlink* once the dataset is no longer used.
+
+        Parameters
+        ----------
+        dataset : object
+            The dataset (or any other picklable object) whose arrays are shared.
+        directory : str or None
+            The directory the file is written to, which defaults to /dev/shm where it exists and the system's \
+            temporary directory otherwise.
+        minimum_bytes : int
+            Arrays smaller than this number of bytes are pickled with the skeleton instead of being shared.
+        """
+
+        if directory is None:
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+        buffer = io.BytesIO()
+        pickler = _SharedPickler(file=buffer, minimum_bytes=minimum_bytes)
+        pickler.dump(dataset)
+
+        file_descriptor, file_path = tempfile.mkstemp(
+            prefix="autolens_shared_", suffix=".bin", dir=directory
+        )
+
+        with os.fdopen(file_descriptor, "wb") as f:
+            for offset, array in pickler.arrays:
+                f.seek(offset)
+                f.write(np.ascontiguousarray(array).data)
+
+        return SharedDataset(file_path=file_path, skeleton=buffer.getvalue())
+
+    def attach(self):
+        """
+        Rebuild the shared dataset, with every shared array a read-only view of the memory-mapped file.
+        """
+
+        if os.path.getsize(self.file_path) > 0:
+            memmap = np.memmap(self.file_path, dtype="uint8", mode="r")
+        else:
+            memmap = None
+
+        return _SharedUnpickler(file=io.BytesIO(self.skeleton), memmap=memmap).load()
+
+    def unlink(self):
+        """
+        Remove the memory-mapped file. Datasets which are already attached remain valid until they are deleted.
+        """
+        if os.path.exists(self.file_path):
+            os.remove(self.file_path)
+
+
+class _SharedPickler(pickle.Pickler):
+    def __init__(self, file, minimum_bytes):
+
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.minimum_bytes = minimum_bytes
+        self.arrays = []
+        self.offsets = {}
+        self.size = 0
+
+    def persistent_id(self, obj):
+
+        if (
+            not isinstance(obj, np.ndarray)
+            or obj.dtype.hasobject
+            or obj.nbytes < self.minimum_bytes
+        ):
+            return None
+
+        if id(obj) not in self.offsets:
+            offset = -(-self.size // 64) * 64
+            self.offsets[id(obj)] = offset
+            self.arrays.append((offset, obj))
+            self.size = offset + obj.nbytes
+
+        return (
+            self.offsets[id(obj)],
+            obj.shape,
+            obj.dtype.str,
+            type(obj),
+            getattr(obj, "__dict__", None),
+        )
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    def __init__(self, file, memmap):
+
+        super().__init__(file)
+
+        self.memmap = memmap
+
+    def persistent_load(self, pid):
+
+        offset, shape, dtype, cls, state = pid
+
+        array = np.ndarray(
+            shape=shape, dtype=np.dtype(dtype), buffer=self.memmap, offset=offset
+        )
+
+        if cls is not np.ndarray:
+            array = array.view(cls)
+
+        if state:
+            array.__dict__.update(state)
+
+        return array
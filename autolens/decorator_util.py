@@ -28,3 +28,32 @@ def jit(nopython=nopython, cache=cache, parallel=parallel):
         return numba.jit(func, nopython=nopython, cache=cache, parallel=parallel)
 
     return wrapper
+
+
+class cached_property:
+    def __init__(self, func):
+        """
+        A property whose value is computed the first time it is accessed and then stored in the instance's \
+        __dict__, such that every later access returns the stored value without calling the function again.
+
+        This is used for expensive quantities of objects which do not change after they are created (e.g. the \
+        maximum log likelihood fit of a *Result*). Deleting the attribute (e.g. *del result.max_log_likelihood_fit*) \
+        clears the stored value, such that it is recomputed on the next access.
+
+        Parameters
+        ----------
+        func : function
+            The method which computes the value of the property.
+        """
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+
+        if instance is None:
+            return self
+
+        value = self.func(instance)
+        instance.__dict__[self.name] = value
+        return value
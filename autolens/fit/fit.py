@@ -1,8 +1,18 @@
+from concurrent import futures
+
 import numpy as np
 
+from autoarray.exc import InversionException
 from autoarray.fit import fit as aa_fit
+from autoarray.operators import transformer as trans
+from autoarray.structures import arrays, grids
+from autoarray.structures import visibilities as vis
+from autoarray.util import fit_util, inversion_util, transformer_util
 from autoarray.inversion import pixelizations as pix, inversions as inv
 from autogalaxy.galaxy import galaxy as g
+from autolens import decorator_util
+from autolens import exc
+from autolens.lens import ray_tracing
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -147,6 +157,697 @@ class FitImaging(aa_fit.FitImaging):
         return len(list(filter(None, self.tracer.regularizations_of_planes)))
 
 
+class FitImagingWorkspace:
+    def __init__(
+        self,
+        masked_imaging,
+        settings_pixelization=pix.SettingsPixelization(),
+        settings_inversion=inv.SettingsInversion(),
+    ):
+        """
+        A workspace which computes the figure of merit of fits of tracers to a masked imaging dataset, without \
+        creating a *FitImaging* object for every fit.
+
+        The hyper image, hyper noise-map and model image buffers are allocated once when the workspace is created and \
+        are overwritten in place by every call to *figure_of_merit_from_tracer*. The residuals, chi-squared and noise \
+        normalization are summed in a single pass over the image without creating the residual-map or \
+        chi-squared-map. The masked imaging is never copied and the noise normalization of the unmodified noise-map \
+        is computed once. \
+        This is how a non-linear search computes the log likelihood of each model it samples, where the fit itself \
+        is discarded.
+
+        When a full fit is required (e.g. for visualization or a phase's result), *fit_from_tracer* returns the \
+        corresponding *FitImaging*.
+
+        Parameters
+        -----------
+        masked_imaging : imaging.MaskedImaging
+            The masked imaging dataset that is fitted.
+        """
+
+        self.masked_imaging = masked_imaging
+        self.settings_pixelization = settings_pixelization
+        self.settings_inversion = settings_inversion
+
+        self.image = masked_imaging.image.copy()
+        self.noise_map = masked_imaging.noise_map.copy()
+        self.profile_subtracted_image = masked_imaging.image.copy()
+        self.model_image = masked_imaging.image.copy()
+
+        self.noise_normalization = fit_util.noise_normalization_from(
+            noise_map=masked_imaging.noise_map
+        )
+
+    def fit_from_tracer(
+        self, tracer, hyper_image_sky=None, hyper_background_noise=None
+    ):
+        return FitImaging(
+            masked_imaging=self.masked_imaging,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+            settings_pixelization=self.settings_pixelization,
+            settings_inversion=self.settings_inversion,
+        )
+
+    def figure_of_merit_from_tracer(
+        self, tracer, hyper_image_sky=None, hyper_background_noise=None
+    ):
+        """
+        Returns the figure of merit of the fit of a tracer to the masked imaging, which is the same value as the \
+        *figure_of_merit* of the corresponding *FitImaging* (its log likelihood, or its log evidence if the tracer \
+        has a pixelization).
+        """
+
+        image = self.hyper_image_from_hyper_image_sky(hyper_image_sky=hyper_image_sky)
+
+        noise_map = self.hyper_noise_map_from_tracer_and_hyper_background_noise(
+            tracer=tracer, hyper_background_noise=hyper_background_noise
+        )
+
+        blurred_image = tracer.blurred_image_from_grid_and_convolver(
+            grid=self.masked_imaging.grid,
+            convolver=self.masked_imaging.convolver,
+            blurring_grid=self.masked_imaging.blurring_grid,
+        )
+
+        if not tracer.has_pixelization:
+
+            inversion = None
+            model_image = blurred_image
+
+        else:
+
+            np.subtract(image, blurred_image, out=self.profile_subtracted_image)
+
+            inversion = tracer.inversion_imaging_from_grid_and_data(
+                grid=self.masked_imaging.grid_inversion,
+                image=self.profile_subtracted_image,
+                noise_map=noise_map,
+                convolver=self.masked_imaging.convolver,
+                settings_pixelization=self.settings_pixelization,
+                settings_inversion=self.settings_inversion,
+            )
+
+            model_image = np.add(
+                blurred_image,
+                inversion.mapped_reconstructed_image,
+                out=self.model_image,
+            )
+
+        if noise_map is self.masked_imaging.noise_map:
+
+            noise_normalization = self.noise_normalization
+
+            chi_squared = chi_squared_from(
+                image=np.asarray(image),
+                model_image=np.asarray(model_image),
+                noise_map=np.asarray(noise_map),
+            )
+
+        else:
+
+            chi_squared, noise_normalization = chi_squared_and_noise_normalization_from(
+                image=np.asarray(image),
+                model_image=np.asarray(model_image),
+                noise_map=np.asarray(noise_map),
+            )
+
+        if inversion is None:
+            return fit_util.log_likelihood_from(
+                chi_squared=chi_squared, noise_normalization=noise_normalization
+            )
+
+        return fit_util.log_evidence_from(
+            chi_squared=chi_squared,
+            regularization_term=inversion.regularization_term,
+            log_curvature_regularization_term=inversion.log_det_curvature_reg_matrix_term,
+            log_regularization_term=inversion.log_det_regularization_matrix_term,
+            noise_normalization=noise_normalization,
+        )
+
+    def hyper_image_from_hyper_image_sky(self, hyper_image_sky):
+        """
+        Returns the image that is fitted, which is the masked imaging's image if there is no *HyperImageSky* and the \
+        image buffer with the sky added otherwise.
+        """
+        if hyper_image_sky is None:
+            return self.masked_imaging.image
+
+        np.add(self.masked_imaging.image, hyper_image_sky.sky_scale, out=self.image)
+
+        return self.image
+
+    def hyper_noise_map_from_tracer_and_hyper_background_noise(
+        self, tracer, hyper_background_noise
+    ):
+        """
+        Returns the noise-map that is fitted, which is the masked imaging's noise-map if neither the tracer's hyper \
+        galaxies nor a *HyperBackgroundNoise* scale it and the noise-map buffer with these terms added otherwise.
+        """
+        if not tracer.has_hyper_galaxy and hyper_background_noise is None:
+            return self.masked_imaging.noise_map
+
+        self.noise_map[:] = self.masked_imaging.noise_map
+
+        if hyper_background_noise is not None:
+            self.noise_map += hyper_background_noise.noise_scale
+
+        if tracer.has_hyper_galaxy:
+            self.noise_map += tracer.hyper_noise_map_from_noise_map(
+                noise_map=self.masked_imaging.noise_map
+            )
+
+        return self.noise_map
+
+
+class FitInterferometerWorkspace:
+    def __init__(
+        self,
+        masked_interferometer,
+        settings_pixelization=pix.SettingsPixelization(),
+        settings_inversion=inv.SettingsInversion(),
+        visibilities_chunk_size=10000,
+    ):
+        """
+        A workspace which computes the figure of merit of fits of tracers to a masked interferometer dataset, \
+        without transforming every model image to the uv-plane.
+
+        For a parametric fit (a tracer without a pixelization) the chi-squared of model visibilities V' = A x, where \
+        x is the model image and A the (real and imaginary) Fourier transform to the uv-plane, can be computed in \
+        image space as:
+
+        chi_squared = sum(W V^2) - 2 x^T D + x^T C x
+
+        where W are the inverse variances of the visibilities, D = A^T W V is the dirty image and C = A^T W A the \
+        curvature matrix. D, C and sum(W V^2) depend only on the dataset, so they are computed once by a direct \
+        Fourier transform of the image grid, and the cost of each fit is then independent of the number of \
+        visibilities. Computing them scales as the number of image pixels squared times the number of visibilities, \
+        so this is deferred to the first parametric fit, such that workspaces which only fit pixelizations (which \
+        never use them) do not pay this cost.
+
+        This is only used when the masked interferometer's transformer is a *TransformerDFT* (the image-space \
+        chi-squared is that of an exact direct Fourier transform, so it would not match a *FitInterferometer* using \
+        a *TransformerNUFFT*), the mask has fewer image pixels than there are visibilities (otherwise transforming \
+        the model image is cheaper) and the noise-map is not scaled by a *HyperBackgroundNoise*. Tracers with a \
+        pixelization are fitted using a *FitInterferometer*.
+
+        When a full fit is required (e.g. for visualization or a phase's result), *fit_from_tracer* returns the \
+        corresponding *FitInterferometer*.
+
+        Parameters
+        -----------
+        masked_interferometer : interferometer.MaskedInterferometer
+            The masked interferometer dataset that is fitted.
+        visibilities_chunk_size : int
+            The number of visibilities whose Fourier transforms are held in memory at once when computing the \
+            dirty image and curvature matrix.
+        """
+
+        self.masked_interferometer = masked_interferometer
+        self.settings_pixelization = settings_pixelization
+        self.settings_inversion = settings_inversion
+        self.visibilities_chunk_size = visibilities_chunk_size
+
+        self.noise_normalization = fit_util.noise_normalization_from(
+            noise_map=masked_interferometer.noise_map
+        )
+
+        self._curvature_matrix = None
+        self._dirty_image = None
+        self._visibilities_chi_squared = None
+
+    @property
+    def total_image_pixels(self):
+        return self.masked_interferometer.real_space_mask.mask_sub_1.pixels_in_mask
+
+    @property
+    def total_visibilities(self):
+        return self.masked_interferometer.visibilities.shape[0]
+
+    @property
+    def use_image_space_chi_squared(self):
+        return (
+            isinstance(self.masked_interferometer.transformer, trans.TransformerDFT)
+            and self.total_image_pixels < self.total_visibilities
+        )
+
+    def fit_from_tracer(self, tracer, hyper_background_noise=None):
+        return FitInterferometer(
+            masked_interferometer=self.masked_interferometer,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+            settings_pixelization=self.settings_pixelization,
+            settings_inversion=self.settings_inversion,
+        )
+
+    def figure_of_merit_from_tracer(self, tracer, hyper_background_noise=None):
+        """
+        Returns the figure of merit of the fit of a tracer to the masked interferometer, which is the same value \
+        as the *figure_of_merit* of the corresponding *FitInterferometer* (for a parametric fit computed in image \
+        space, see above).
+        """
+        if (
+            tracer.has_pixelization
+            or hyper_background_noise is not None
+            or not self.use_image_space_chi_squared
+        ):
+            return self.fit_from_tracer(
+                tracer=tracer, hyper_background_noise=hyper_background_noise
+            ).figure_of_merit
+
+        if self._curvature_matrix is None:
+            self.compute_image_space_operators()
+
+        if tracer.has_light_profile:
+            image = np.asarray(
+                tracer.image_from_grid(
+                    grid=self.masked_interferometer.grid
+                ).in_1d_binned
+            )
+        else:
+            image = np.zeros(shape=(self.total_image_pixels,))
+
+        chi_squared = (
+            self._visibilities_chi_squared
+            - 2.0 * np.dot(image, self._dirty_image)
+            + np.dot(image, np.dot(self._curvature_matrix, image))
+        )
+
+        return fit_util.log_likelihood_from(
+            chi_squared=chi_squared, noise_normalization=self.noise_normalization
+        )
+
+    def compute_image_space_operators(self):
+        """
+        Compute the dirty image D = A^T W V, curvature matrix C = A^T W A and sum(W V^2) of the masked \
+        interferometer (see above), transforming the image grid to the uv-plane in chunks of visibilities.
+        """
+        grid_radians = np.asarray(
+            self.masked_interferometer.real_space_mask.mask_sub_1.geometry.masked_grid_sub_1.in_1d_binned.in_radians
+        )
+        uv_wavelengths = np.asarray(
+            self.masked_interferometer.interferometer.uv_wavelengths, dtype="float"
+        )
+        visibilities = np.asarray(self.masked_interferometer.visibilities)
+        weights = 1.0 / np.asarray(self.masked_interferometer.noise_map) ** 2.0
+
+        curvature_matrix = np.zeros(
+            shape=(self.total_image_pixels, self.total_image_pixels)
+        )
+        dirty_image = np.zeros(shape=(self.total_image_pixels,))
+
+        for start in range(0, self.total_visibilities, self.visibilities_chunk_size):
+
+            chunk = slice(start, start + self.visibilities_chunk_size)
+
+            transforms = (
+                transformer_util.preload_real_transforms(
+                    grid_radians=grid_radians, uv_wavelengths=uv_wavelengths[chunk]
+                ),
+                transformer_util.preload_imag_transforms(
+                    grid_radians=grid_radians, uv_wavelengths=uv_wavelengths[chunk]
+                ),
+            )
+
+            for component, transform in enumerate(transforms):
+
+                component_weights = weights[chunk, component]
+
+                curvature_matrix += np.dot(transform * component_weights, transform.T)
+                dirty_image += np.dot(
+                    transform, component_weights * visibilities[chunk, component]
+                )
+
+        self._curvature_matrix = curvature_matrix
+        self._dirty_image = dirty_image
+        self._visibilities_chi_squared = np.sum(weights * visibilities ** 2.0)
+
+
+class FitInterferometerChunks:
+    def __init__(
+        self,
+        masked_interferometer_chunks,
+        tracer,
+        hyper_background_noise=None,
+        settings_pixelization=pix.SettingsPixelization(),
+        settings_inversion=inv.SettingsInversion(),
+        number_of_threads=1,
+    ):
+        """
+        Fit a tracer to an interferometer dataset which is too large to hold in memory, by streaming its \
+        visibilities in chunks (see *MaskedInterferometerChunks*).
+
+        No array of model visibilities is ever created. Instead, the model image of the tracer's light profiles is \
+        transformed to the visibilities of one chunk at a time and the chi-squared of the chunk is added to a \
+        running total. For a tracer with a pixelization the data vector D = T^T W r and curvature matrix \
+        F = T^T W T of the inversion (where T is the transformed mapping matrix, W the inverse variances and r the \
+        profile-subtracted visibilities) are accumulated in the same pass, and once the reconstruction s is solved \
+        for the chi-squared of the full model is:
+
+        chi_squared = sum(W r^2) - 2 s^T D + s^T F s
+
+        The memory used by the fit therefore scales with the chunk size (and number of threads) rather than the \
+        number of visibilities. The figures of merit are the same as those of a *FitInterferometer* using a \
+        *TransformerDFT*.
+
+        Parameters
+        -----------
+        masked_interferometer_chunks : interferometer.MaskedInterferometerChunks
+            The chunked interferometer dataset that is fitted.
+        tracer : ray_tracing.Tracer
+            The tracer, which describes the ray-tracing and strong lens configuration.
+        number_of_threads : int
+            The number of threads the chunks are fitted in, where every thread fits (and holds in memory) one chunk \
+            at a time.
+        """
+
+        self.masked_interferometer_chunks = masked_interferometer_chunks
+        self.tracer = tracer
+        self.hyper_background_noise = hyper_background_noise
+        self.number_of_threads = number_of_threads
+
+        if tracer.has_light_profile:
+            self.profile_image = np.asarray(
+                tracer.image_from_grid(
+                    grid=masked_interferometer_chunks.grid
+                ).in_1d_binned
+            )
+        else:
+            self.profile_image = np.zeros(
+                shape=(masked_interferometer_chunks.grid_radians.shape[0],)
+            )
+
+        if tracer.has_pixelization:
+
+            plane_indexes_with_pixelizations = tracer.plane_indexes_with_pixelizations
+
+            if len(plane_indexes_with_pixelizations) > 1:
+                raise exc.TracerException(
+                    "A FitInterferometerChunks can only fit a tracer with one plane with a pixelization, but the "
+                    "tracer has {} (planes {}).".format(
+                        len(plane_indexes_with_pixelizations),
+                        plane_indexes_with_pixelizations,
+                    )
+                )
+
+            plane_index = plane_indexes_with_pixelizations[0]
+
+            mapper = tracer.mappers_of_planes_from_grid(
+                grid=masked_interferometer_chunks.grid_inversion,
+                settings_pixelization=settings_pixelization,
+            )[plane_index]
+            regularization = tracer.regularizations_of_planes[plane_index]
+            mapping_matrix = np.asarray(mapper.mapping_matrix)
+        else:
+            mapper = None
+            mapping_matrix = None
+
+        (
+            profile_chi_squared,
+            self.noise_normalization,
+            data_vector,
+            curvature_matrix,
+        ) = self.chunk_terms_from_mapping_matrix(mapping_matrix=mapping_matrix)
+
+        if mapper is None:
+
+            self.inversion = None
+            self.chi_squared = profile_chi_squared
+
+        else:
+
+            self.inversion = InversionInterferometerChunks.from_data_vector_and_curvature_matrix(
+                data_vector=data_vector,
+                curvature_matrix=curvature_matrix,
+                mapper=mapper,
+                regularization=regularization,
+                settings=settings_inversion,
+            )
+
+            reconstruction = self.inversion.reconstruction
+
+            self.chi_squared = (
+                profile_chi_squared
+                - 2.0 * np.dot(reconstruction, data_vector)
+                + np.dot(reconstruction, np.dot(curvature_matrix, reconstruction))
+            )
+
+    def chunk_terms_from_mapping_matrix(self, mapping_matrix=None):
+        """
+        Returns the chi-squared of the profile visibilities, the noise normalization and (if a mapping matrix is \
+        input) the data vector and curvature matrix of the inversion, summed over every chunk of the dataset.
+
+        The chunks are split evenly over the threads, with each thread summing the terms of its chunks.
+        """
+        chunks = self.masked_interferometer_chunks.chunks
+
+        if self.number_of_threads == 1 or len(chunks) <= 1:
+            return self.chunk_terms_from_chunks(
+                chunks=chunks, mapping_matrix=mapping_matrix
+            )
+
+        chunks_of_threads = [
+            chunks[thread_index :: self.number_of_threads]
+            for thread_index in range(self.number_of_threads)
+        ]
+
+        with futures.ThreadPoolExecutor(max_workers=self.number_of_threads) as executor:
+            terms_of_threads = list(
+                executor.map(
+                    lambda chunks_of_thread: self.chunk_terms_from_chunks(
+                        chunks=chunks_of_thread, mapping_matrix=mapping_matrix
+                    ),
+                    chunks_of_threads,
+                )
+            )
+
+        return [sum(terms) for terms in zip(*terms_of_threads)]
+
+    def chunk_terms_from_chunks(self, chunks, mapping_matrix=None):
+
+        interferometer_chunks = self.masked_interferometer_chunks.interferometer_chunks
+
+        chi_squared = 0.0
+        noise_normalization = 0.0
+
+        if mapping_matrix is not None:
+            data_vector = np.zeros(shape=(mapping_matrix.shape[1],))
+            curvature_matrix = np.zeros(
+                shape=(mapping_matrix.shape[1], mapping_matrix.shape[1])
+            )
+        else:
+            data_vector = None
+            curvature_matrix = None
+
+        for chunk in chunks:
+
+            visibilities = np.asarray(interferometer_chunks.visibilities[chunk])
+            noise_map = np.asarray(interferometer_chunks.noise_map[chunk])
+
+            if self.hyper_background_noise is not None:
+                noise_map = self.hyper_background_noise.hyper_noise_map_from_noise_map(
+                    noise_map=noise_map
+                )
+
+            weights = 1.0 / noise_map ** 2.0
+
+            transforms = self.masked_interferometer_chunks.transforms_from_chunk(
+                chunk=chunk
+            )
+
+            residuals = visibilities - np.stack(
+                [np.dot(self.profile_image, transform) for transform in transforms],
+                axis=1,
+            )
+
+            chi_squared += np.sum(weights * residuals ** 2.0)
+            noise_normalization += fit_util.noise_normalization_from(
+                noise_map=noise_map
+            )
+
+            if mapping_matrix is None:
+                continue
+
+            for component, transform in enumerate(transforms):
+
+                transformed_mapping_matrix = np.dot(mapping_matrix.T, transform)
+                component_weights = weights[:, component]
+
+                data_vector += np.dot(
+                    transformed_mapping_matrix,
+                    component_weights * residuals[:, component],
+                )
+                curvature_matrix += np.dot(
+                    transformed_mapping_matrix * component_weights,
+                    transformed_mapping_matrix.T,
+                )
+
+        return chi_squared, noise_normalization, data_vector, curvature_matrix
+
+    @property
+    def log_likelihood(self):
+        return fit_util.log_likelihood_from(
+            chi_squared=self.chi_squared, noise_normalization=self.noise_normalization
+        )
+
+    @property
+    def log_likelihood_with_regularization(self):
+        if self.inversion is not None:
+            return fit_util.log_likelihood_with_regularization_from(
+                chi_squared=self.chi_squared,
+                regularization_term=self.inversion.regularization_term,
+                noise_normalization=self.noise_normalization,
+            )
+
+    @property
+    def log_evidence(self):
+        if self.inversion is not None:
+            return fit_util.log_evidence_from(
+                chi_squared=self.chi_squared,
+                regularization_term=self.inversion.regularization_term,
+                log_curvature_regularization_term=self.inversion.log_det_curvature_reg_matrix_term,
+                log_regularization_term=self.inversion.log_det_regularization_matrix_term,
+                noise_normalization=self.noise_normalization,
+            )
+
+    @property
+    def figure_of_merit(self):
+        if self.inversion is None:
+            return self.log_likelihood
+        return self.log_evidence
+
+
+class InversionInterferometerChunks(inv.AbstractInversion, inv.AbstractInversionMatrix):
+    def __init__(
+        self,
+        mapper,
+        regularization,
+        regularization_matrix,
+        reconstruction,
+        curvature_reg_matrix,
+        settings=inv.SettingsInversion(),
+    ):
+        """
+        The inversion of a *FitInterferometerChunks*, whose data vector and curvature matrix are accumulated over \
+        the chunks of the dataset instead of being computed from its transformed mapping matrices (which are not \
+        held in memory).
+        """
+
+        super().__init__(
+            noise_map=None,
+            mapper=mapper,
+            regularization=regularization,
+            regularization_matrix=regularization_matrix,
+            reconstruction=reconstruction,
+            settings=settings,
+        )
+
+        inv.AbstractInversionMatrix.__init__(
+            self=self,
+            curvature_reg_matrix=curvature_reg_matrix,
+            regularization_matrix=regularization_matrix,
+        )
+
+    @classmethod
+    def from_data_vector_and_curvature_matrix(
+        cls,
+        data_vector,
+        curvature_matrix,
+        mapper,
+        regularization,
+        settings=inv.SettingsInversion(),
+    ):
+
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        curvature_reg_matrix = np.add(curvature_matrix, regularization_matrix)
+
+        try:
+            values = np.linalg.solve(curvature_reg_matrix, data_vector)
+        except np.linalg.LinAlgError:
+            raise InversionException()
+
+        if settings.check_solution:
+            if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
+                if np.isclose(a=values[0], b=values, atol=1e-4).all():
+                    raise InversionException()
+
+        return InversionInterferometerChunks(
+            mapper=mapper,
+            regularization=regularization,
+            regularization_matrix=regularization_matrix,
+            reconstruction=values,
+            curvature_reg_matrix=curvature_reg_matrix,
+            settings=settings,
+        )
+
+    @property
+    def mapped_reconstructed_image(self):
+        mapped_reconstructed_image = inversion_util.mapped_reconstructed_data_from(
+            mapping_matrix=self.mapper.mapping_matrix,
+            reconstruction=self.reconstruction,
+        )
+
+        return arrays.Array(
+            array=mapped_reconstructed_image,
+            mask=self.mapper.grid.mask.mask_sub_1,
+            store_in_1d=True,
+        )
+
+
+@decorator_util.jit()
+def chi_squared_from(image, model_image, noise_map):
+    """
+    Returns the chi-squared of a model image's fit to an image, summing ((image - model_image) / noise_map) ** 2.0 \
+    over every pixel in one pass, such that the residual-map and chi-squared-map are never created.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The 1D image that is fitted.
+    model_image : np.ndarray
+        The 1D model image the image is fitted with.
+    noise_map : np.ndarray
+        The 1D noise-map of the image.
+    """
+    chi_squared = 0.0
+
+    for index in range(image.shape[0]):
+        chi = (image[index] - model_image[index]) / noise_map[index]
+        chi_squared += chi * chi
+
+    return chi_squared
+
+
+@decorator_util.jit()
+def chi_squared_and_noise_normalization_from(image, model_image, noise_map):
+    """
+    Returns the chi-squared of a model image's fit to an image and the noise normalization of the noise-map, \
+    sum(log(2 * pi * noise_map ** 2.0)), which are both summed over every pixel in one pass.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        The 1D image that is fitted.
+    model_image : np.ndarray
+        The 1D model image the image is fitted with.
+    noise_map : np.ndarray
+        The 1D noise-map of the image.
+    """
+    chi_squared = 0.0
+    noise_normalization = 0.0
+
+    for index in range(image.shape[0]):
+        chi = (image[index] - model_image[index]) / noise_map[index]
+        chi_squared += chi * chi
+        noise_normalization += np.log(2.0 * np.pi * noise_map[index] ** 2.0)
+
+    return chi_squared, noise_normalization
+
+
 class FitInterferometer(aa_fit.FitInterferometer):
     def __init__(
         self,
@@ -182,10 +883,26 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         self.tracer = tracer
 
-        self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
-            grid=masked_interferometer.grid,
-            transformer=masked_interferometer.transformer,
-        )
+        if tracer.has_light_profile and not isinstance(
+            masked_interferometer.grid, grids.GridIterate
+        ):
+
+            self.profile_images_of_planes = tracer.images_of_planes_from_grid(
+                grid=masked_interferometer.grid
+            )
+
+            self.profile_visibilities = masked_interferometer.transformer.visibilities_from_image(
+                image=sum(self.profile_images_of_planes)
+            )
+
+        else:
+
+            self.profile_images_of_planes = None
+
+            self.profile_visibilities = tracer.profile_visibilities_from_grid_and_transformer(
+                grid=masked_interferometer.grid,
+                transformer=masked_interferometer.transformer,
+            )
 
         self.profile_subtracted_visibilities = (
             masked_interferometer.visibilities - self.profile_visibilities
@@ -248,10 +965,13 @@ class FitInterferometer(aa_fit.FitInterferometer):
 
         return galaxy_model_image_dict
 
-    @property
+    @decorator_util.cached_property
     def galaxy_model_visibilities_dict(self) -> {g.Galaxy: np.ndarray}:
         """
-        A dictionary associating galaxies with their corresponding model images
+        A dictionary associating galaxies with their corresponding model visibilities.
+
+        The galaxy images are transformed to the uv-plane together and the dictionary is computed once per fit, \
+        as it is used repeatedly (e.g. for every galaxy when a phase's result computes its hyper visibilities).
         """
         galaxy_model_visibilities_dict = self.tracer.galaxy_profile_visibilities_dict_from_grid_and_transformer(
             grid=self.masked_interferometer.grid,
@@ -273,17 +993,40 @@ class FitInterferometer(aa_fit.FitInterferometer):
         return galaxy_model_visibilities_dict
 
     def model_visibilities_of_planes(self):
+        """
+        The model visibilities of every plane, which are the visibilities of the plane's light profile image \
+        (computed by the fit, see *profile_images_of_planes*) plus the inversion's mapped reconstructed \
+        visibilities for planes with a pixelization.
 
-        model_visibilities_of_planes = self.tracer.profile_visibilities_of_planes_from_grid_and_transformer(
-            grid=self.masked_interferometer.grid,
-            transformer=self.masked_interferometer.transformer,
-        )
+        The plane images are transformed to the uv-plane together, and the visibilities are computed once per fit.
+        """
+        return self._model_visibilities_of_planes
+
+    @decorator_util.cached_property
+    def _model_visibilities_of_planes(self):
+
+        if self.profile_images_of_planes is not None:
+            model_visibilities_of_planes = ray_tracing.visibilities_of_images_from_transformer(
+                images=self.profile_images_of_planes,
+                transformer=self.masked_interferometer.transformer,
+            )
+        elif self.tracer.has_light_profile:
+            model_visibilities_of_planes = self.tracer.profile_visibilities_of_planes_from_grid_and_transformer(
+                grid=self.masked_interferometer.grid,
+                transformer=self.masked_interferometer.transformer,
+            )
+        else:
+            model_visibilities_of_planes = [
+                vis.Visibilities.zeros(shape_1d=(self.visibilities.shape_1d,))
+                for plane_index in range(self.tracer.total_planes)
+            ]
 
         for plane_index in self.tracer.plane_indexes_with_pixelizations:
 
-            model_visibilities_of_planes[
-                plane_index
-            ] += self.inversion.mapped_reconstructed_image
+            model_visibilities_of_planes[plane_index] = (
+                model_visibilities_of_planes[plane_index]
+                + self.inversion.mapped_reconstructed_visibilities
+            )
 
         return model_visibilities_of_planes
 
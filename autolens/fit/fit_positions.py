@@ -1,5 +1,6 @@
 import numpy as np
 
+from autoarray import decorator_util
 from autoarray.fit import fit as aa_fit
 from autogalaxy.galaxy import galaxy as g
 
@@ -40,12 +41,7 @@ class AbstractFitPositionsSourcePlane:
 
     @staticmethod
     def max_separation_of_grid(grid):
-        rdist_max = np.zeros((grid.shape[0]))
-        for i in range(grid.shape[0]):
-            xdists = np.square(np.subtract(grid[i, 0], grid[:, 0]))
-            ydists = np.square(np.subtract(grid[i, 1], grid[:, 1]))
-            rdist_max[i] = np.max(np.add(xdists, ydists))
-        return np.max(np.sqrt(rdist_max))
+        return max_separation_of_grid_from(grid=np.asarray(grid, dtype="float64"))
 
 
 class FitPositionsSourcePlaneMaxSeparation(AbstractFitPositionsSourcePlane):
@@ -71,3 +67,69 @@ class FitPositionsSourcePlaneMaxSeparation(AbstractFitPositionsSourcePlane):
     @property
     def figure_of_merit(self):
         return -0.5 * sum(self.chi_squared_map)
+
+
+@decorator_util.jit()
+def max_separation_of_grid_from(grid):
+    """
+    Returns the maximum separation of every pair of (y,x) coordinates in a grid, computed without creating any
+    temporary arrays.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates whose maximum separation is computed.
+    """
+
+    max_squared_separation = 0.0
+
+    for i in range(grid.shape[0]):
+        for j in range(i + 1, grid.shape[0]):
+
+            squared_separation = (grid[i, 0] - grid[j, 0]) ** 2 + (
+                grid[i, 1] - grid[j, 1]
+            ) ** 2
+
+            if squared_separation > max_squared_separation:
+                max_squared_separation = squared_separation
+
+    return np.sqrt(max_squared_separation)
+
+
+@decorator_util.jit()
+def grid_within_threshold_from(grid, upper_indexes, threshold):
+    """
+    Returns whether every group of (y,x) coordinates in a grid (e.g. the source-plane positions of each set of
+    multiple images) are within a threshold of one another, returning *False* as soon as a pair of coordinates
+    in the same group is separated by more than the threshold (or their separation is NaN, e.g. because a position
+    traced to a singularity).
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates of every group, with each group stored contiguously.
+    upper_indexes : np.ndarray
+        The index one beyond the final coordinate of every group in the grid.
+    threshold : float
+        The maximum separation of coordinates in the same group.
+    """
+
+    squared_threshold = threshold ** 2
+
+    lower_index = 0
+
+    for upper_index in upper_indexes:
+
+        for i in range(lower_index, upper_index):
+            for j in range(i + 1, upper_index):
+
+                squared_separation = (grid[i, 0] - grid[j, 0]) ** 2 + (
+                    grid[i, 1] - grid[j, 1]
+                ) ** 2
+
+                if not squared_separation <= squared_threshold:
+                    return False
+
+        lower_index = upper_index
+
+    return True
@@ -0,0 +1,61 @@
+from astropy import cosmology as cosmo
+from autogalaxy.galaxy import galaxy as g
+
+import hashlib
+import numpy as np
+
+
+def hash_from_object(obj):
+    """Returns a hash of an object's parameters, for example the mass profiles, redshifts and cosmology of a
+    _Tracer_, which is the same for any two objects with identical parameters.
+
+    Attributes beginning with an underscore (e.g. caches) are not included in the hash. A _Galaxy_ is hashed using
+    only its redshift and mass profiles, which are the parameters that determine its multiple images, so its light
+    profiles, hyper images and unique id do not change the hash."""
+    return hashlib.sha1(repr(canonical_from_object(obj=obj)).encode()).hexdigest()
+
+
+def canonical_from_object(obj):
+
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+
+    if isinstance(obj, np.generic):
+        return obj.item()
+
+    if isinstance(obj, np.ndarray):
+        return (
+            obj.shape,
+            obj.dtype.str,
+            hashlib.sha1(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+        )
+
+    if isinstance(obj, (list, tuple)):
+        return tuple(canonical_from_object(obj=value) for value in obj)
+
+    if isinstance(obj, cosmo.FLRW):
+        return repr(obj)
+
+    if isinstance(obj, g.Galaxy):
+        return (
+            "{}.{}".format(type(obj).__module__, type(obj).__qualname__),
+            canonical_from_object(obj=obj.redshift),
+            canonical_from_object(obj=obj.mass_profiles),
+        )
+
+    if isinstance(obj, dict):
+        return tuple(
+            sorted(
+                (str(key), canonical_from_object(obj=value))
+                for key, value in obj.items()
+                if not str(key).startswith("_")
+            )
+        )
+
+    if hasattr(obj, "__dict__") and not isinstance(obj, type):
+        return (
+            "{}.{}".format(type(obj).__module__, type(obj).__qualname__),
+            canonical_from_object(obj=vars(obj)),
+        )
+
+    return repr(obj)
@@ -5,8 +5,13 @@ from autoarray.util import grid_util, mask_util
 from autoarray.structures import abstract_structure, grids
 
 from autolens import exc
+from autolens import hash_util
 
+from collections import OrderedDict
 import copy
+import hashlib
+import json
+import os
 
 
 class AbstractPositionsSolver:
@@ -23,6 +28,64 @@ class AbstractPositionsSolver:
         self.distance_from_source_centre = distance_from_source_centre
         self.distance_from_mass_profile_centre = distance_from_mass_profile_centre
 
+    def solve_from_tracer(self, tracer):
+        """Needs work - idea is it solves for all image plane multiple image positions using the redshift distribution of
+        the tracer."""
+        return grids.GridCoordinates(
+            coordinates=self.solve_for_source_plane_coordinates(
+                lensing_obj=tracer,
+                source_plane_coordinates=tracer.light_profile_centres.in_list[-1],
+            )
+        )
+
+    def solve(self, lensing_obj, source_plane_coordinate):
+        return self.solve_for_source_plane_coordinates(
+            lensing_obj=lensing_obj, source_plane_coordinates=[source_plane_coordinate]
+        )[0]
+
+    def solve_for_source_plane_coordinates(self, lensing_obj, source_plane_coordinates):
+        """Solve for the image-plane multiple images of every (y,x) coordinate in a list of source-plane coordinates.
+
+        The deflection angles of the initial grid are the same for every source-plane coordinate, therefore they are
+        computed once and the peaks of every source-plane coordinate are found together (see the method
+        *grids_peaks_from*), before the peaks of each source-plane coordinate are refined by the method
+        *solve_from_coordinates*.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            _MassProfile_, _Galaxy_, _Plane_ or _Tracer_.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) coordinates in the source-plane whose multiple images are found.
+
+        Returns
+        -------
+        [autoarray.GridCoordinates]
+            The multiple images of every source-plane coordinate, in the same order as the input coordinates.
+        """
+        coordinates_lists = self.grids_peaks_from(
+            lensing_obj=lensing_obj,
+            grid=self.grid,
+            source_plane_coordinates=source_plane_coordinates,
+        )
+
+        return [
+            self.solve_from_coordinates(
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+                coordinates_list=coordinates_list,
+            )
+            for source_plane_coordinate, coordinates_list in zip(
+                source_plane_coordinates, coordinates_lists
+            )
+        ]
+
+    def solve_from_coordinates(
+        self, lensing_obj, source_plane_coordinate, coordinates_list
+    ):
+        raise NotImplementedError()
+
     def grid_with_coordinates_from_mass_profile_centre_removed(self, lensing_obj, grid):
         """Remove all coordinates from a grid which are within the distance_from_mass_profile_centre attribute of any
         mass profile of the lensing object.
@@ -164,6 +227,55 @@ class AbstractPositionsSolver:
             coordinates=grid_peaks, pixel_scales=grid.pixel_scales
         )
 
+    def grids_peaks_from(self, lensing_obj, grid, source_plane_coordinates):
+        """ Find the 'peaks' of a grid of coordinates for every (y,x) coordinate in a list of source-plane
+        coordinates, where a peak is defined as for the method *grid_peaks_from*.
+
+        The deflection angles of the grid are computed once and the distances of the traced grid to every
+        source-plane coordinate are computed as a single 2D array of shape [total_source_plane_coordinates,
+        total_grid_pixels], such that the peaks of every source-plane coordinate are found in a single call to the
+        function *grid_peaks_mask_from*.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            _MassProfile_, _Galaxy_, _Plane_ or _Tracer_.
+        grid : autoarray.GridCoordinatesUniform or ndarray
+            A grid of (y,x) Cartesian coordinates for which the 'peak' values that trace closer to every source-plane
+            coordinate than their neighbors are found.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) coordinates in the source-plane that the distance of traced grid coordinates are computed for.
+        """
+        deflections = lensing_obj.deflections_from_grid(grid=grid)
+        source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
+
+        source_plane_distances = np.sqrt(
+            np.sum(
+                np.square(
+                    np.asarray(source_plane_grid)[None, :, :]
+                    - np.asarray(source_plane_coordinates).reshape(-1, 1, 2)
+                ),
+                axis=2,
+            )
+        )
+
+        neighbors, has_neighbors = grid_square_neighbors_1d_from(shape_1d=grid.shape[0])
+
+        peaks_mask = grid_peaks_mask_from(
+            distances_2d=source_plane_distances,
+            neighbors=neighbors.astype("int"),
+            has_neighbors=has_neighbors,
+        )
+
+        return [
+            grids.GridCoordinatesUniform(
+                coordinates=np.asarray(grid)[peaks_mask_of_coordinate],
+                pixel_scales=grid.pixel_scales,
+            )
+            for peaks_mask_of_coordinate in peaks_mask
+        ]
+
     def grid_within_distance_of_source_plane_centre(
         self, lensing_obj, source_plane_coordinate, grid, distance
     ):
@@ -297,24 +409,69 @@ class PositionsFinder(AbstractPositionsSolver):
         else:
             return [tuple(coordinate) for coordinate in grid]
 
-    def solve_from_tracer(self, tracer):
-        """Needs work - idea is it solves for all image plane multiple image positions using the redshift distribution of
-        the tracer."""
-        return grids.GridCoordinates(
-            coordinates=[
-                self.solve(lensing_obj=tracer, source_plane_coordinate=centre)
-                for centre in tracer.light_profile_centres.in_list[-1]
-            ]
+    def refined_coordinates_from_coordinates(
+        self, coordinates, pixel_scale, lensing_obj, source_plane_coordinate
+    ):
+        """For a list of (y,x) coordinates, determine the refined coordinates of every coordinate by locating peak
+        pixels on a higher resolution grid around each pixel, as performed by the method
+        *refined_coordinates_from_coordinate*.
+
+        The higher resolution grids of all coordinates are stacked into one grid, such that the deflection angles of
+        every grid are computed in a single call to the lensing object's deflections_from_grid method, instead of one
+        call per coordinate. The peaks of each grid are then found separately, such that a pixel is only compared to
+        its neighbors on the same grid.
+
+        Parameters
+        ----------
+        coordinates : [(float, float)]
+            The (y,x) coordinates around which the upscaled grids used to find the refined coordinates are computed.
+        pixel_scale : float
+            The pixel-scale resolution of the buffed and upscaled grids that are formed around the input coordinates.
+            If upscale > 1, the pixel_scales are reduced to pixel_scale / upscale_factor.
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            _MassProfile_, _Galaxy_, _Plane_ or _Tracer_.
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane pixels that the distance of traced grid coordinates are computed
+            for.
+        """
+
+        if len(coordinates) == 0:
+            return []
+
+        if self.use_upscaling:
+            upscale_factor = self.upscale_factor
+        else:
+            upscale_factor = 1
+
+        grid = grids_buffed_around_coordinates_from(
+            coordinates=np.asarray(coordinates),
+            pixel_scales=(pixel_scale, pixel_scale),
+            buffer=4,
+            upscale_factor=upscale_factor,
         )
 
-    def solve(self, lensing_obj, source_plane_coordinate):
+        grid = grids.GridCoordinatesUniform(
+            coordinates=grid,
+            pixel_scales=(pixel_scale / upscale_factor, pixel_scale / upscale_factor),
+        )
 
-        coordinates_list = self.grid_peaks_from(
-            lensing_obj=lensing_obj,
-            grid=self.grid,
-            source_plane_coordinate=source_plane_coordinate,
+        deflections = lensing_obj.deflections_from_grid(grid=grid)
+        source_plane_grid = grid.grid_from_deflection_grid(deflection_grid=deflections)
+        source_plane_distances = source_plane_grid.distances_from_coordinate(
+            coordinate=source_plane_coordinate
+        )
+
+        return grids_peaks_from(
+            distance_1d=np.asarray(source_plane_distances),
+            grid_1d=np.asarray(grid),
+            total_grids=len(coordinates),
         )
 
+    def solve_from_coordinates(
+        self, lensing_obj, source_plane_coordinate, coordinates_list
+    ):
+
         coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
             lensing_obj=lensing_obj, grid=coordinates_list
         )
@@ -327,19 +484,12 @@ class PositionsFinder(AbstractPositionsSolver):
 
         while pixel_scale > self.pixel_scale_precision:
 
-            refined_coordinates_list = []
-
-            for coordinate in coordinates_list:
-
-                refined_coordinates = self.refined_coordinates_from_coordinate(
-                    coordinate=coordinate,
-                    pixel_scale=pixel_scale,
-                    lensing_obj=lensing_obj,
-                    source_plane_coordinate=source_plane_coordinate,
-                )
-
-                if refined_coordinates is not None:
-                    refined_coordinates_list += refined_coordinates
+            refined_coordinates_list = self.refined_coordinates_from_coordinates(
+                coordinates=coordinates_list,
+                pixel_scale=pixel_scale,
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+            )
 
             refined_coordinates_list = grid_remove_duplicates(
                 grid=np.asarray(refined_coordinates_list)
@@ -361,33 +511,545 @@ class PositionsFinder(AbstractPositionsSolver):
         return grids.GridCoordinates(coordinates=coordinates_list)
 
 
+class PositionsSolverNewton(AbstractPositionsSolver):
+    def __init__(
+        self,
+        grid,
+        precision=1e-6,
+        max_iterations=20,
+        jacobian_step_size=1e-5,
+        duplicate_tolerance=None,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+    ):
+        """Given a _LensingObject_ (e.g. a _MassProfile, _Galaxy_, _Plane_ or _Tracer_) this class uses their
+        deflections_from_grid method to determine the (y,x) coordinates the multiple-images appear given a (y,x)
+        source-centre coordinate in the source-plane.
+
+        This is performed as follows:
+
+         1) For an initial input grid, find the 'peak' pixels which trace closer to the centre of the source in the
+            source-plane than their 8 direct neighboring pixels, as performed by the _PositionsFinder_.
+         2) Using every peak pixel as a starting point, solve the lens equation for the image-plane coordinate that
+            traces exactly to the source-plane centre using Newton-Raphson iterations. The Jacobian of the lens
+            equation is computed using central finite differences of the deflection angles.
+         3) Remove starting points which do not converge and duplicate solutions, where several starting points
+            converge to the same multiple image.
+
+        Every iteration computes the deflection angles of every starting point and its finite difference offsets in
+        a single call to deflections_from_grid, and the solutions converge quadratically. Multiple images are
+        therefore located to a high precision in far fewer deflection angle calculations than the iterative grid
+        upscaling of the _PositionsFinder_.
+
+        Parameters
+        ----------
+        grid : autoarray.Grid
+            The grid whose peak pixels are the starting points of the Newton-Raphson iterations.
+        precision : float
+            The iterations of a starting point are converged once the (y,x) step they take in the image-plane is
+            below this value.
+        max_iterations : int
+            The maximum number of iterations, after which any starting points that have not converged are removed.
+        jacobian_step_size : float
+            The size of the (y,x) offsets used to compute the Jacobian via finite differences.
+        duplicate_tolerance : float or None
+            Converged solutions closer than this distance are the same multiple image, and all but one are removed.
+            Solutions which converge slowly (e.g. near a critical curve) stop when their step is below the precision
+            but can be much further than this from the exact image, so solutions of one image found from different
+            starting points are not within the precision of one another. Distinct images are at least a pixel of the
+            initial grid apart (they are found from different peak pixels), so if not input the tolerance is half of
+            the initial grid's pixel scale.
+        distance_from_source_centre : float or None
+            If input, solutions which do not trace within this distance of the source-plane centre are removed.
+        distance_from_mass_profile_centre : float or None
+            If input, starting points within this distance of any mass profile centre are removed.
+        """
+
+        super(PositionsSolverNewton, self).__init__(
+            use_upscaling=False,
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+        )
+
+        self.grid = grid.in_1d_binned
+        self.precision = precision
+        self.max_iterations = max_iterations
+        self.jacobian_step_size = jacobian_step_size
+
+        if duplicate_tolerance is None:
+            duplicate_tolerance = 0.5 * self.grid.pixel_scale
+
+        self.duplicate_tolerance = duplicate_tolerance
+
+    def solve_from_coordinates(
+        self, lensing_obj, source_plane_coordinate, coordinates_list
+    ):
+
+        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates = np.asarray(coordinates_list).reshape(-1, 2)
+        converged = np.full(shape=coordinates.shape[0], fill_value=False)
+        iterating = np.full(shape=coordinates.shape[0], fill_value=True)
+
+        for iteration in range(self.max_iterations):
+
+            if not iterating.any():
+                break
+
+            grid = grids.GridCoordinates(
+                coordinates=grid_jacobian_stencils_from(
+                    grid_1d=coordinates[iterating], step_size=self.jacobian_step_size
+                )
+            )
+
+            deflections = lensing_obj.deflections_from_grid(grid=grid)
+
+            steps = grid_newton_steps_from(
+                source_plane_stencils=np.asarray(grid) - np.asarray(deflections),
+                source_plane_coordinate=source_plane_coordinate,
+                step_size=self.jacobian_step_size,
+            )
+
+            iterating_indexes = np.where(iterating)[0]
+
+            coordinates[iterating_indexes] += steps
+
+            step_lengths = np.sqrt(np.sum(np.square(steps), axis=1))
+
+            converged[iterating_indexes] = step_lengths < self.precision
+            iterating[iterating_indexes] = ~(
+                converged[iterating_indexes] | np.isnan(step_lengths)
+            )
+
+        coordinates_list = grid_remove_duplicates(
+            grid=coordinates[converged], tolerance=self.duplicate_tolerance
+        )
+
+        coordinates_list = self.grid_within_distance_of_source_plane_centre(
+            lensing_obj=lensing_obj,
+            grid=grids.GridCoordinatesUniform(
+                coordinates=coordinates_list,
+                pixel_scales=(self.precision, self.precision),
+            ),
+            source_plane_coordinate=source_plane_coordinate,
+            distance=self.distance_from_source_centre,
+        )
+
+        return grids.GridCoordinates(coordinates=coordinates_list)
+
+
+class PositionsSolverTriangles(AbstractPositionsSolver):
+    def __init__(
+        self,
+        grid,
+        pixel_scale_precision,
+        distance_from_source_centre=None,
+        distance_from_mass_profile_centre=None,
+    ):
+        """Given a _LensingObject_ (e.g. a _MassProfile, _Galaxy_, _Plane_ or _Tracer_) this class uses their
+        deflections_from_grid method to determine the (y,x) coordinates the multiple-images appear given a (y,x)
+        source-centre coordinate in the source-plane.
+
+        This is performed by mapping triangles from the image-plane to the source-plane, as follows:
+
+         1) Split every square of 4 adjacent pixels on the input grid into 2 triangles and ray-trace the vertices of
+            every triangle to the source-plane, using a single deflection angle calculation of the grid.
+         2) Find the triangles whose traced vertices form a triangle containing the source-plane centre, using their
+            barycentric coordinates. Every multiple image lies inside one of these triangles.
+         3) Split each of these triangles into 4 smaller triangles, ray-trace their vertices in a single deflection
+            angle calculation and again keep only those which contain the source-plane centre. This is repeated until
+            the size of the triangles is below the pixel_scale_precision.
+         4) Compute the position of every image by interpolating the barycentric coordinates of the source-plane
+            centre in its traced triangle to the image-plane triangle, and remove duplicates (which occur when the
+            source-plane centre lies on the edge of two triangles).
+
+        Unlike the peak criterion of the _PositionsFinder_, a triangle contains the source-plane centre if and only
+        if an image lies within it (for triangles small enough that the lens mapping is linear across them). All
+        images are therefore found in one pass, including those near the critical curves. Images which are not
+        physical, for example the central image of a singular mass profile, can still be removed using the
+        distance_from_mass_profile_centre input.
+
+        Parameters
+        ----------
+        grid : autoarray.Grid
+            The uniform grid whose pixels form the initial triangles.
+        pixel_scale_precision : float
+            The triangles are refined until their size is below this value.
+        distance_from_source_centre : float or None
+            If input, images which do not trace within this distance of the source-plane centre are removed.
+        distance_from_mass_profile_centre : float or None
+            If input, images within this distance of any mass profile centre are removed.
+        """
+
+        super(PositionsSolverTriangles, self).__init__(
+            use_upscaling=False,
+            distance_from_source_centre=distance_from_source_centre,
+            distance_from_mass_profile_centre=distance_from_mass_profile_centre,
+        )
+
+        self.grid = grid.in_1d_binned
+        self.pixel_scale_precision = pixel_scale_precision
+
+    def triangles_containing_source_plane_coordinate_from(
+        self, lensing_obj, triangles, source_plane_coordinate
+    ):
+        """For an input array of image-plane triangles, ray-trace their vertices to the source-plane and return the
+        image-plane triangles and their traced triangles which contain the input source-plane coordinate.
+
+        The vertices of all triangles are traced in a single deflection angle calculation.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            _MassProfile_, _Galaxy_, _Plane_ or _Tracer_.
+        triangles : ndarray
+            The (y,x) coordinates of the vertices of every image-plane triangle, with shape [total_triangles, 3, 2].
+        source_plane_coordinate : (float, float)
+            The (y,x) coordinate in the source-plane that the traced triangles must contain.
+        """
+        grid = grids.GridCoordinates(coordinates=triangles.reshape(-1, 2))
+
+        deflections = lensing_obj.deflections_from_grid(grid=grid)
+
+        traced_triangles = (np.asarray(grid) - np.asarray(deflections)).reshape(
+            triangles.shape
+        )
+
+        contains = triangles_contain_coordinate_from(
+            triangles=traced_triangles, coordinate=source_plane_coordinate
+        )
+
+        return triangles[contains], traced_triangles[contains]
+
+    def solve_for_source_plane_coordinates(self, lensing_obj, source_plane_coordinates):
+        """Solve for the image-plane multiple images of every (y,x) coordinate in a list of source-plane coordinates.
+
+        The initial grid and its triangles are traced to the source-plane once, and are shared by every source-plane
+        coordinate, before the triangles containing each source-plane coordinate are refined by the method
+        *solve_from_triangles*.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            _MassProfile_, _Galaxy_, _Plane_ or _Tracer_.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) coordinates in the source-plane whose multiple images are found.
+        """
+        deflections = lensing_obj.deflections_from_grid(grid=self.grid)
+        source_plane_grid = self.grid.grid_from_deflection_grid(
+            deflection_grid=deflections
+        )
+
+        triangles = triangles_from_grid_2d(
+            grid_2d=np.asarray(self.grid.in_2d), mask_2d=np.asarray(self.grid.mask)
+        )
+
+        traced_triangles = triangles_from_grid_2d(
+            grid_2d=np.asarray(source_plane_grid.in_2d),
+            mask_2d=np.asarray(self.grid.mask),
+        )
+
+        return [
+            self.solve_from_triangles(
+                lensing_obj=lensing_obj,
+                source_plane_coordinate=source_plane_coordinate,
+                triangles=triangles,
+                traced_triangles=traced_triangles,
+            )
+            for source_plane_coordinate in source_plane_coordinates
+        ]
+
+    def solve_from_triangles(
+        self, lensing_obj, source_plane_coordinate, triangles, traced_triangles
+    ):
+
+        contains = triangles_contain_coordinate_from(
+            triangles=traced_triangles, coordinate=source_plane_coordinate
+        )
+
+        triangles = triangles[contains]
+        traced_triangles = traced_triangles[contains]
+
+        pixel_scale = self.grid.pixel_scale
+
+        while pixel_scale > self.pixel_scale_precision and triangles.shape[0] > 0:
+
+            (
+                triangles,
+                traced_triangles,
+            ) = self.triangles_containing_source_plane_coordinate_from(
+                lensing_obj=lensing_obj,
+                triangles=triangles_subdivided_from(triangles=triangles),
+                source_plane_coordinate=source_plane_coordinate,
+            )
+
+            pixel_scale = pixel_scale / 2.0
+
+        coordinates = triangles_coordinate_interpolated_from(
+            triangles=triangles,
+            traced_triangles=traced_triangles,
+            coordinate=source_plane_coordinate,
+        )
+
+        coordinates_list = grid_remove_duplicates(
+            grid=coordinates, tolerance=self.pixel_scale_precision
+        )
+
+        coordinates_list = grids.GridCoordinatesUniform(
+            coordinates=coordinates_list, pixel_scales=(pixel_scale, pixel_scale)
+        )
+
+        coordinates_list = self.grid_with_coordinates_from_mass_profile_centre_removed(
+            lensing_obj=lensing_obj, grid=coordinates_list
+        )
+
+        coordinates_list = self.grid_within_distance_of_source_plane_centre(
+            lensing_obj=lensing_obj,
+            grid=coordinates_list,
+            source_plane_coordinate=source_plane_coordinate,
+            distance=self.distance_from_source_centre,
+        )
+
+        return grids.GridCoordinates(coordinates=coordinates_list)
+
+
+_solutions_cache = OrderedDict()
+_solutions_cache_size = 128
+_solutions_file_version = 1
+
+
+class PositionsSolverCache:
+    def __init__(self, solver, file_path=None):
+        """Wraps a positions solver (e.g. a _PositionsFinder_) such that the multiple images it solves for are cached
+        and returned without solving again when the same lens model, source-plane coordinate and solver are input.
+
+        Solutions are cached in memory in a least-recently-used cache of at most *_solutions_cache_size* solutions,
+        which is shared by every _PositionsSolverCache_ in a process, and are optionally persisted to a .json file (e.g. in a phase's output
+        directory) such that a resumed pipeline loads them instead of solving again.
+
+        Every solution is keyed by a hash of the parameters of the lensing object (e.g. the mass profiles, redshifts
+        and cosmology of a _Tracer_), the source-plane coordinate and the settings and grid of the solver. Lensing
+        objects with identical parameters therefore share solutions, even if they are different instances, and a
+        lensing object whose parameters change never returns the solutions of its previous parameters. The .json file
+        stores the version of its format (*_solutions_file_version*, which is increased whenever the solvers change
+        the solutions they return), and a file written by a different version is ignored and overwritten.
+
+        The solver is only called to update the positions of a pipeline's next phase (see the
+        *image_plane_multiple_image_positions_of_source_plane_centres* of a phase's _Result_), therefore this is
+        where solutions are cached. A _PhasePositions_ does not solve for positions when it computes a log
+        likelihood, so it does not use this cache.
+
+        Parameters
+        ----------
+        solver : AbstractPositionsSolver
+            The solver whose solutions are cached.
+        file_path : str or None
+            The .json file the solutions are persisted to, if input.
+        """
+        self.solver = solver
+        self.file_path = file_path
+
+        self.solver_hash = hash_util.hash_from_object(obj=solver)
+
+        self.persisted_solutions = {}
+
+        if file_path is not None and os.path.exists(file_path):
+            with open(file_path, "r") as f:
+                persisted = json.load(f)
+
+            if persisted.get("version") == _solutions_file_version:
+                self.persisted_solutions = persisted["solutions"]
+
+    def solution_key_from(self, lensing_obj_hash, source_plane_coordinate):
+        return hashlib.sha1(
+            "{}{}{}".format(
+                self.solver_hash,
+                lensing_obj_hash,
+                [float(value) for value in source_plane_coordinate],
+            ).encode()
+        ).hexdigest()
+
+    def solve_from_tracer(self, tracer):
+        return grids.GridCoordinates(
+            coordinates=self.solve_for_source_plane_coordinates(
+                lensing_obj=tracer,
+                source_plane_coordinates=tracer.light_profile_centres.in_list[-1],
+            )
+        )
+
+    def solve(self, lensing_obj, source_plane_coordinate):
+        return self.solve_for_source_plane_coordinates(
+            lensing_obj=lensing_obj, source_plane_coordinates=[source_plane_coordinate]
+        )[0]
+
+    def solve_for_source_plane_coordinates(self, lensing_obj, source_plane_coordinates):
+        """Solve for the image-plane multiple images of every (y,x) coordinate in a list of source-plane coordinates,
+        using the solver's *solve_for_source_plane_coordinates* method for only the source-plane coordinates whose
+        solutions are not cached.
+
+        Parameters
+        ----------
+        lensing_obj : autogalaxy.LensingObject
+            An object which has a deflection_from_grid method for performing lensing calculations, for example a
+            _MassProfile_, _Galaxy_, _Plane_ or _Tracer_.
+        source_plane_coordinates : [(float, float)]
+            The (y,x) coordinates in the source-plane whose multiple images are found.
+        """
+        lensing_obj_hash = hash_util.hash_from_object(obj=lensing_obj)
+
+        keys = [
+            self.solution_key_from(
+                lensing_obj_hash=lensing_obj_hash,
+                source_plane_coordinate=source_plane_coordinate,
+            )
+            for source_plane_coordinate in source_plane_coordinates
+        ]
+
+        solutions = [self.cached_solution_from_key(key=key) for key in keys]
+
+        unsolved_indexes = [
+            index for index, solution in enumerate(solutions) if solution is None
+        ]
+
+        if len(unsolved_indexes) > 0:
+
+            unsolved_solutions = self.solver.solve_for_source_plane_coordinates(
+                lensing_obj=lensing_obj,
+                source_plane_coordinates=[
+                    source_plane_coordinates[index] for index in unsolved_indexes
+                ],
+            )
+
+            for index, solution in zip(unsolved_indexes, unsolved_solutions):
+
+                solutions[index] = [
+                    tuple(coordinate) for coordinate in np.asarray(solution)
+                ]
+
+                self.cache_solution(key=keys[index], solution=solutions[index])
+
+            self.output_persisted_solutions()
+
+        return [grids.GridCoordinates(coordinates=solution) for solution in solutions]
+
+    def cached_solution_from_key(self, key):
+
+        if key in _solutions_cache:
+            _solutions_cache.move_to_end(key)
+            return _solutions_cache[key]
+
+        if key in self.persisted_solutions:
+            solution = [
+                tuple(coordinate) for coordinate in self.persisted_solutions[key]
+            ]
+            self.cache_solution(key=key, solution=solution)
+            return solution
+
+    def cache_solution(self, key, solution):
+
+        _solutions_cache[key] = solution
+
+        while len(_solutions_cache) > _solutions_cache_size:
+            _solutions_cache.popitem(last=False)
+
+        if self.file_path is not None:
+            self.persisted_solutions[key] = solution
+
+    def output_persisted_solutions(self):
+
+        if self.file_path is None:
+            return
+
+        file_path_temporary = "{}.tmp".format(self.file_path)
+
+        with open(file_path_temporary, "w") as f:
+            json.dump(
+                {
+                    "version": _solutions_file_version,
+                    "solutions": self.persisted_solutions,
+                },
+                f,
+            )
+
+        os.replace(file_path_temporary, self.file_path)
+
+
 @decorator_util.jit()
-def grid_remove_duplicates(grid):
+def grid_remove_duplicates(grid, tolerance=1e-8):
+    """
+    Remove the duplicate (y,x) coordinates from a grid, where two coordinates are duplicates if their separation is \
+    below the tolerance. Of a group of duplicates only the coordinate that is last in the grid is kept.
 
-    tolerance = 1e-8
+    Duplicates are found using a spatial hash, where every coordinate is binned into a square cell of size \
+    tolerance. The duplicates of a coordinate can then only be in its own cell or the 8 cells surrounding it, which \
+    are found by a binary search of the sorted cell keys. This scales as O(N log N) with the number of coordinates, \
+    instead of the O(N^2) cost of computing the separation of every pair of coordinates.
 
+    Parameters
+    ----------
+    grid : np.ndarray
+        The (y,x) coordinates which duplicates are removed from, with shape [total_coordinates, 2].
+    tolerance : float
+        The separation below which two coordinates are duplicates.
+
+    Returns
+    -------
+    [(float, float)]
+        The (y,x) coordinates of the grid with duplicates removed, in the order they appear in the grid.
+    """
     grid_no_duplicates = []
 
-    separations = np.zeros((grid.shape[0], grid.shape[0]))
+    total_coordinates = grid.shape[0]
 
-    for i in range(grid.shape[0]):
-        for j in range(grid.shape[0]):
-            separations[i, j] = np.sqrt(
-                np.square(grid[i, 0] - grid[j, 0]) + np.square(grid[i, 1] - grid[j, 1])
-            )
-            separations[i, i] = tolerance * 2
+    cells_y = np.zeros(total_coordinates, dtype=np.int64)
+    cells_x = np.zeros(total_coordinates, dtype=np.int64)
+    keys = np.zeros(total_coordinates, dtype=np.int64)
 
-    for i in range(grid.shape[0]):
+    for i in range(total_coordinates):
+        cells_y[i] = np.int64(np.floor(grid[i, 0] / tolerance))
+        cells_x[i] = np.int64(np.floor(grid[i, 1] / tolerance))
+        keys[i] = cells_y[i] * 73856093 + cells_x[i] * 19349663
+
+    order = np.argsort(keys, kind="mergesort")
+    sorted_keys = keys[order]
+
+    for i in range(total_coordinates):
 
         is_duplicate = False
 
-        for j in range(grid.shape[0]):
+        for cell_y in range(cells_y[i] - 1, cells_y[i] + 2):
+            for cell_x in range(cells_x[i] - 1, cells_x[i] + 2):
+
+                key = cell_y * 73856093 + cell_x * 19349663
+
+                index = np.searchsorted(sorted_keys, key)
+
+                while index < total_coordinates and sorted_keys[index] == key:
+
+                    j = order[index]
+
+                    if j > i:
+
+                        separation = np.sqrt(
+                            np.square(grid[i, 0] - grid[j, 0])
+                            + np.square(grid[i, 1] - grid[j, 1])
+                        )
 
-            if separations[i, j] < tolerance:
+                        if separation < tolerance:
+                            is_duplicate = True
+                            break
 
-                is_duplicate = True
-                separations[i, j] = tolerance * 2
-                separations[j, i] = tolerance * 2
+                    index += 1
+
+                if is_duplicate:
+                    break
+
+            if is_duplicate:
+                break
 
         if not is_duplicate:
             grid_no_duplicates.append((grid[i, 0], grid[i, 1]))
@@ -460,6 +1122,332 @@ def grid_buffed_around_coordinate_from(
     return grid_1d
 
 
+@decorator_util.jit()
+def grids_buffed_around_coordinates_from(
+    coordinates, pixel_scales, buffer, upscale_factor=1
+):
+    """For an input 1D array of (y,x) coordinates, return the buffed grid around every coordinate (see the function
+    *grid_buffed_around_coordinate_from*) stacked into one 1D grid, where the grid of each coordinate is contiguous.
+
+    Parameters
+    ----------
+    coordinates : ndarray
+        The (y,x) coordinates around which the buffed grids are created, with shape [total_coordinates, 2].
+    pixel_scales : (float, float)
+        The pixel scale of the buffed grids before they are upscaled.
+    buffer : int
+        The number of pixels around each (y,x) coordinate that its grid is computed on.
+    upscale_factor : int
+        The factor by which the resolution of the grids is increased relative to the input pixel-scales.
+    """
+
+    pixels_per_grid = (upscale_factor * (2 * buffer + 1)) ** 2
+
+    grid_1d = np.zeros(shape=(coordinates.shape[0] * pixels_per_grid, 2))
+
+    for coordinate_index in range(coordinates.shape[0]):
+
+        grid_index = coordinate_index * pixels_per_grid
+
+        grid_1d[
+            grid_index : grid_index + pixels_per_grid, :
+        ] = grid_buffed_around_coordinate_from(
+            coordinate=(
+                coordinates[coordinate_index, 0],
+                coordinates[coordinate_index, 1],
+            ),
+            pixel_scales=pixel_scales,
+            buffer=buffer,
+            upscale_factor=upscale_factor,
+        )
+
+    return grid_1d
+
+
+@decorator_util.jit()
+def grid_jacobian_stencils_from(grid_1d, step_size):
+    """For an input 1D grid of (y,x) coordinates, return a 1D grid containing every coordinate followed by the 4
+    coordinates offset from it by the step size in the positive y, negative y, positive x and negative x directions.
+
+    These offset coordinates are used to compute the Jacobian of the lens equation at every coordinate via central
+    finite differences (see the function *grid_newton_steps_from*).
+
+    Parameters
+    ----------
+    grid_1d : ndarray
+        The (y,x) coordinates around which the stencils are created, with shape [total_coordinates, 2].
+    step_size : float
+        The size of the (y,x) offsets of every stencil.
+    """
+    stencils_1d = np.zeros(shape=(grid_1d.shape[0] * 5, 2))
+
+    for grid_index in range(grid_1d.shape[0]):
+
+        stencil_index = grid_index * 5
+
+        for offset_index in range(5):
+            stencils_1d[stencil_index + offset_index, 0] = grid_1d[grid_index, 0]
+            stencils_1d[stencil_index + offset_index, 1] = grid_1d[grid_index, 1]
+
+        stencils_1d[stencil_index + 1, 0] += step_size
+        stencils_1d[stencil_index + 2, 0] -= step_size
+        stencils_1d[stencil_index + 3, 1] += step_size
+        stencils_1d[stencil_index + 4, 1] -= step_size
+
+    return stencils_1d
+
+
+@decorator_util.jit()
+def grid_newton_steps_from(source_plane_stencils, source_plane_coordinate, step_size):
+    """Given the source-plane (y,x) coordinates of image-plane stencils created by the function
+    *grid_jacobian_stencils_from*, compute the Newton-Raphson step of every image-plane coordinate which solves the
+    lens equation for the input (y,x) source-plane coordinate.
+
+    The Jacobian of the lens equation is computed via central finite differences of the stencil and the step is
+    given by -A^-1 r, where A is the Jacobian and r the offset of the traced coordinate from the source-plane
+    coordinate. Coordinates where the Jacobian is singular are given a step of NaN, such that they never converge.
+
+    Parameters
+    ----------
+    source_plane_stencils : ndarray
+        The source-plane (y,x) coordinates of the stencils, with shape [total_coordinates * 5, 2].
+    source_plane_coordinate : (float, float)
+        The (y,x) coordinate in the source-plane that the lens equation is solved for.
+    step_size : float
+        The size of the (y,x) offsets of every stencil.
+    """
+    total_coordinates = source_plane_stencils.shape[0] // 5
+
+    steps = np.zeros(shape=(total_coordinates, 2))
+
+    for grid_index in range(total_coordinates):
+
+        stencil_index = grid_index * 5
+
+        residual_y = (
+            source_plane_stencils[stencil_index, 0] - source_plane_coordinate[0]
+        )
+        residual_x = (
+            source_plane_stencils[stencil_index, 1] - source_plane_coordinate[1]
+        )
+
+        a_yy = (
+            source_plane_stencils[stencil_index + 1, 0]
+            - source_plane_stencils[stencil_index + 2, 0]
+        ) / (2.0 * step_size)
+        a_xy = (
+            source_plane_stencils[stencil_index + 1, 1]
+            - source_plane_stencils[stencil_index + 2, 1]
+        ) / (2.0 * step_size)
+        a_yx = (
+            source_plane_stencils[stencil_index + 3, 0]
+            - source_plane_stencils[stencil_index + 4, 0]
+        ) / (2.0 * step_size)
+        a_xx = (
+            source_plane_stencils[stencil_index + 3, 1]
+            - source_plane_stencils[stencil_index + 4, 1]
+        ) / (2.0 * step_size)
+
+        determinant = a_yy * a_xx - a_yx * a_xy
+
+        if determinant == 0.0:
+            steps[grid_index, 0] = np.nan
+            steps[grid_index, 1] = np.nan
+        else:
+            steps[grid_index, 0] = (
+                -(a_xx * residual_y - a_yx * residual_x) / determinant
+            )
+            steps[grid_index, 1] = (
+                -(a_yy * residual_x - a_xy * residual_y) / determinant
+            )
+
+    return steps
+
+
+@decorator_util.jit()
+def triangles_from_grid_2d(grid_2d, mask_2d):
+    """From a uniform 2D grid of (y,x) coordinates, return the triangles formed by splitting every square of 4
+    adjacent unmasked pixels in two, with the top-left, top-right and bottom-left pixels forming the first triangle
+    and the top-right, bottom-right and bottom-left pixels the second.
+
+    The input grid may be the image-plane grid or its ray-traced source-plane grid, such that the triangles of both
+    share the same vertices.
+
+    Parameters
+    ----------
+    grid_2d : ndarray
+        The 2D grid of (y,x) coordinates, with shape [total_y_pixels, total_x_pixels, 2].
+    mask_2d : ndarray
+        The 2D mask of the grid, where True entries are not used as triangle vertices.
+    """
+    total_triangles = 0
+
+    for y in range(grid_2d.shape[0] - 1):
+        for x in range(grid_2d.shape[1] - 1):
+            if (
+                not mask_2d[y, x]
+                and not mask_2d[y, x + 1]
+                and not mask_2d[y + 1, x]
+                and not mask_2d[y + 1, x + 1]
+            ):
+                total_triangles += 2
+
+    triangles = np.zeros(shape=(total_triangles, 3, 2))
+
+    triangle_index = 0
+
+    for y in range(grid_2d.shape[0] - 1):
+        for x in range(grid_2d.shape[1] - 1):
+            if (
+                not mask_2d[y, x]
+                and not mask_2d[y, x + 1]
+                and not mask_2d[y + 1, x]
+                and not mask_2d[y + 1, x + 1]
+            ):
+
+                triangles[triangle_index, 0, :] = grid_2d[y, x, :]
+                triangles[triangle_index, 1, :] = grid_2d[y, x + 1, :]
+                triangles[triangle_index, 2, :] = grid_2d[y + 1, x, :]
+
+                triangles[triangle_index + 1, 0, :] = grid_2d[y, x + 1, :]
+                triangles[triangle_index + 1, 1, :] = grid_2d[y + 1, x + 1, :]
+                triangles[triangle_index + 1, 2, :] = grid_2d[y + 1, x, :]
+
+                triangle_index += 2
+
+    return triangles
+
+
+@decorator_util.jit()
+def triangles_subdivided_from(triangles):
+    """Split every input triangle into 4 triangles of half its size, using the midpoints of its edges as the new
+    vertices.
+
+    Parameters
+    ----------
+    triangles : ndarray
+        The (y,x) coordinates of the vertices of every triangle, with shape [total_triangles, 3, 2].
+    """
+    subdivided_triangles = np.zeros(shape=(triangles.shape[0] * 4, 3, 2))
+
+    for triangle_index in range(triangles.shape[0]):
+
+        vertex_0 = triangles[triangle_index, 0, :]
+        vertex_1 = triangles[triangle_index, 1, :]
+        vertex_2 = triangles[triangle_index, 2, :]
+
+        midpoint_01 = (vertex_0 + vertex_1) / 2.0
+        midpoint_12 = (vertex_1 + vertex_2) / 2.0
+        midpoint_20 = (vertex_2 + vertex_0) / 2.0
+
+        subdivided_index = triangle_index * 4
+
+        subdivided_triangles[subdivided_index, 0, :] = vertex_0
+        subdivided_triangles[subdivided_index, 1, :] = midpoint_01
+        subdivided_triangles[subdivided_index, 2, :] = midpoint_20
+
+        subdivided_triangles[subdivided_index + 1, 0, :] = midpoint_01
+        subdivided_triangles[subdivided_index + 1, 1, :] = vertex_1
+        subdivided_triangles[subdivided_index + 1, 2, :] = midpoint_12
+
+        subdivided_triangles[subdivided_index + 2, 0, :] = midpoint_20
+        subdivided_triangles[subdivided_index + 2, 1, :] = midpoint_12
+        subdivided_triangles[subdivided_index + 2, 2, :] = vertex_2
+
+        subdivided_triangles[subdivided_index + 3, 0, :] = midpoint_01
+        subdivided_triangles[subdivided_index + 3, 1, :] = midpoint_12
+        subdivided_triangles[subdivided_index + 3, 2, :] = midpoint_20
+
+    return subdivided_triangles
+
+
+@decorator_util.jit()
+def triangle_barycentric_coordinates_from(triangle, coordinate):
+    """Compute the barycentric coordinates of a (y,x) coordinate with respect to a triangle, returning NaN values if
+    the triangle has no area."""
+
+    determinant = (triangle[1, 0] - triangle[0, 0]) * (
+        triangle[2, 1] - triangle[0, 1]
+    ) - (triangle[2, 0] - triangle[0, 0]) * (triangle[1, 1] - triangle[0, 1])
+
+    if determinant == 0.0:
+        return np.nan, np.nan, np.nan
+
+    weight_1 = (
+        (coordinate[0] - triangle[0, 0]) * (triangle[2, 1] - triangle[0, 1])
+        - (triangle[2, 0] - triangle[0, 0]) * (coordinate[1] - triangle[0, 1])
+    ) / determinant
+
+    weight_2 = (
+        (triangle[1, 0] - triangle[0, 0]) * (coordinate[1] - triangle[0, 1])
+        - (coordinate[0] - triangle[0, 0]) * (triangle[1, 1] - triangle[0, 1])
+    ) / determinant
+
+    return 1.0 - weight_1 - weight_2, weight_1, weight_2
+
+
+@decorator_util.jit()
+def triangles_contain_coordinate_from(triangles, coordinate):
+    """For an input array of triangles, determine which contain the input (y,x) coordinate, where a coordinate on the
+    edge of a triangle is contained by it. Triangles with no area, or with NaN vertices, contain no coordinates.
+
+    Parameters
+    ----------
+    triangles : ndarray
+        The (y,x) coordinates of the vertices of every triangle, with shape [total_triangles, 3, 2].
+    coordinate : (float, float)
+        The (y,x) coordinate which is tested for being inside every triangle.
+    """
+    contains = np.full(shape=triangles.shape[0], fill_value=False)
+
+    for triangle_index in range(triangles.shape[0]):
+
+        weight_0, weight_1, weight_2 = triangle_barycentric_coordinates_from(
+            triangle=triangles[triangle_index], coordinate=coordinate
+        )
+
+        contains[triangle_index] = (
+            weight_0 >= 0.0 and weight_1 >= 0.0 and weight_2 >= 0.0
+        )
+
+    return contains
+
+
+@decorator_util.jit()
+def triangles_coordinate_interpolated_from(triangles, traced_triangles, coordinate):
+    """For input image-plane triangles whose traced source-plane triangles contain a (y,x) source-plane coordinate,
+    return the image-plane (y,x) coordinate in every triangle which maps to the source-plane coordinate, assuming the
+    lens mapping is linear across the triangle.
+
+    This uses the barycentric coordinates of the source-plane coordinate in every traced triangle as the weights of
+    the vertices of its image-plane triangle.
+
+    Parameters
+    ----------
+    triangles : ndarray
+        The (y,x) coordinates of the vertices of every image-plane triangle, with shape [total_triangles, 3, 2].
+    traced_triangles : ndarray
+        The (y,x) coordinates of the traced vertices of every triangle in the source-plane.
+    coordinate : (float, float)
+        The (y,x) source-plane coordinate which the returned image-plane coordinates map to.
+    """
+    grid_1d = np.zeros(shape=(triangles.shape[0], 2))
+
+    for triangle_index in range(triangles.shape[0]):
+
+        weight_0, weight_1, weight_2 = triangle_barycentric_coordinates_from(
+            triangle=traced_triangles[triangle_index], coordinate=coordinate
+        )
+
+        grid_1d[triangle_index, :] = (
+            weight_0 * triangles[triangle_index, 0, :]
+            + weight_1 * triangles[triangle_index, 1, :]
+            + weight_2 * triangles[triangle_index, 2, :]
+        )
+
+    return grid_1d
+
+
 @decorator_util.jit()
 def pair_coordinate_to_closest_pixel_on_grid(coordinate, grid_1d):
 
@@ -579,6 +1567,99 @@ def grid_peaks_from(distance_1d, grid_1d, neighbors, has_neighbors):
     return peaks_list
 
 
+@decorator_util.jit()
+def grid_peaks_mask_from(distances_2d, neighbors, has_neighbors):
+    """ Given a 2D array of the distances of every (y,x) coordinate of a grid to multiple source centres, of shape
+    [total_source_centres, total_grid_pixels], determine for every source centre the coordinates which are closer to
+    it than their 8 neighboring pixels (see the function *grid_peaks_from*).
+
+    Parameters
+    ----------
+    distances_2d : ndarray
+        The distance of every (y,x) grid coordinate to the centre of every source in the source-plane.
+    neighbors : ndarray
+        A 2D array of shape [pixels, 8] giving the 1D index of every grid pixel to its 8 neighboring pixels.
+    has_neighbors : ndarray
+        An array of bools, where True means a pixel has 8 neighbors and False means it has less than 8 and is not
+        compared to the source distance.
+
+    Returns
+    -------
+    ndarray
+        A 2D array of bools of shape [total_source_centres, total_grid_pixels], which is True for the peaks of every
+        source centre.
+    """
+    peaks_mask = np.full(shape=distances_2d.shape, fill_value=False)
+
+    for source_index in range(distances_2d.shape[0]):
+        for grid_index in range(distances_2d.shape[1]):
+
+            if has_neighbors[grid_index]:
+
+                distance = distances_2d[source_index, grid_index]
+
+                is_peak = True
+
+                for neighbor_index in range(8):
+
+                    neighbor = neighbors[grid_index, neighbor_index]
+
+                    if not distance <= distances_2d[source_index, neighbor]:
+                        is_peak = False
+                        break
+
+                peaks_mask[source_index, grid_index] = is_peak
+
+    return peaks_mask
+
+
+@decorator_util.jit()
+def grids_peaks_from(distance_1d, grid_1d, total_grids):
+    """ Given an input grid of (y,x) coordinates made of multiple square grids of equal size stacked together (see the
+    function *grids_buffed_around_coordinates_from*) and a 1d array of their distances to the centre of the source,
+    determine the coordinates which are closer to the source than their 8 neighboring pixels.
+
+    This is equivalent to calling *grid_peaks_from* on every square grid separately, such that a pixel on the edge of
+    one grid is never compared to a pixel on a different grid.
+
+    Parameters
+    ----------
+    distance_1d : ndarray
+        The distance of every (y,x) grid coordinate to the centre of the source in the source-plane.
+    grid_1d : ndarray
+        The 1D grid of (y,x) coordinates of all square grids whose distances to the source are compared.
+    total_grids : int
+        The number of square grids stacked in the input grid.
+    """
+    peaks_list = []
+
+    pixels_per_grid = grid_1d.shape[0] // total_grids
+    shape_of_edge = int(np.sqrt(pixels_per_grid))
+
+    for grid in range(total_grids):
+        for y in range(1, shape_of_edge - 1):
+            for x in range(1, shape_of_edge - 1):
+
+                grid_index = grid * pixels_per_grid + y * shape_of_edge + x
+
+                distance = distance_1d[grid_index]
+
+                if (
+                    distance <= distance_1d[grid_index - shape_of_edge - 1]
+                    and distance <= distance_1d[grid_index - shape_of_edge]
+                    and distance <= distance_1d[grid_index - shape_of_edge + 1]
+                    and distance <= distance_1d[grid_index - 1]
+                    and distance <= distance_1d[grid_index + 1]
+                    and distance <= distance_1d[grid_index + shape_of_edge - 1]
+                    and distance <= distance_1d[grid_index + shape_of_edge]
+                    and distance <= distance_1d[grid_index + shape_of_edge + 1]
+                ):
+
+                    peaks_list.append((grid_1d[grid_index, 0], grid_1d[grid_index, 1]))
+
+    return peaks_list
+
+
 @decorator_util.jit()
 def grid_within_distance(distances_1d, grid_1d, within_distance):
 
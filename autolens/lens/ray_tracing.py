@@ -1,19 +1,26 @@
 from abc import ABC
+from collections import OrderedDict
+import hashlib
 import pickle
 import numpy as np
 from astropy import cosmology as cosmo
+from autoarray import decorator_util
 from autoarray.inversion import pixelizations as pix
 from autoarray.inversion import inversions as inv
+from autoarray.operators import transformer as trans
 from autoarray.structures import grids
+from autoarray.structures import visibilities as vis
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
 from autogalaxy.plane import plane as pl
 from autogalaxy.util import cosmology_util
 from autogalaxy.util import plane_util
+from autolens import exc
+from autolens import hash_util
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
-    def __init__(self, planes, cosmology):
+    def __init__(self, planes, cosmology, adaptive_tracing_tolerance=None):
         """Ray-tracer for a lens system with any number of planes.
 
         The redshift of these planes are specified by the redshits of the galaxies; there is a unique plane redshift \
@@ -36,10 +43,45 @@ class AbstractTracer(lensing.LensingObject, ABC):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        adaptive_tracing_tolerance : float or None
+            If input, sub-gridded grids are ray-traced adaptively, whereby only the pixels where interpolating the \
+            traced grid from the pixel corners is inaccurate by more than this tolerance (in arc-seconds) have their \
+            sub-pixels ray-traced (see *adaptive_traced_grids_of_planes_from_grid*).
         """
         self.planes = planes
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
+        self.adaptive_tracing_tolerance = adaptive_tracing_tolerance
+
+        if self.all_planes_have_redshifts and isinstance(cosmology, cosmo.FLRW):
+            self.scaling_factor_matrix = scaling_factor_matrix_from(
+                plane_redshifts=tuple(self.plane_redshifts), cosmology=cosmology
+            )
+        else:
+            self.scaling_factor_matrix = None
+
+        self._traced_grids_cache = OrderedDict()
+
+    def __getstate__(self):
+        """The traced grids cache can hold many large arrays, so it is not pickled with the tracer."""
+        state = self.__dict__.copy()
+        state.pop("_traced_grids_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        state.setdefault("adaptive_tracing_tolerance", None)
+        self.__dict__.update(state)
+        if "scaling_factor_matrix" not in state:
+            self.scaling_factor_matrix = (
+                scaling_factor_matrix_from(
+                    plane_redshifts=tuple(self.plane_redshifts),
+                    cosmology=self.cosmology,
+                )
+                if self.all_planes_have_redshifts
+                and isinstance(self.cosmology, cosmo.FLRW)
+                else None
+            )
+        self._traced_grids_cache = OrderedDict()
 
     @property
     def total_planes(self):
@@ -305,6 +347,13 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
         )
 
     def scaling_factor_between_planes(self, i, j):
+
+        i = range(self.total_planes)[i]
+        j = range(self.total_planes)[j]
+
+        if i < j and self.scaling_factor_matrix is not None:
+            return self.scaling_factor_matrix[i, j]
+
         return cosmology_util.scaling_factor_between_redshifts_from(
             redshift_0=self.plane_redshifts[i],
             redshift_1=self.plane_redshifts[j],
@@ -321,43 +370,443 @@ class AbstractTracerCosmology(AbstractTracer, ABC):
 
 
 class AbstractTracerLensing(AbstractTracerCosmology, ABC):
+
+    # The maximum number of grids whose traced grids and deflections are stored in a tracer's cache.
+    traced_grids_cache_size = 8
+
     @grids.grid_like_to_structure_list
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace an input grid of (y,x) coordinates through every plane of the tracer, returning the traced grid of
+        every plane (the image-plane grid is the first entry).
 
-        traced_grids = []
-        traced_deflections = []
+        The traced grids and deflection angles of every plane are cached on the tracer, such that repeated calls
+        using the same grid (e.g. the *MaskedImaging* grid used throughout a *FitImaging*) do not recompute the
+        deflection angles of every mass profile. The cache is keyed by the grid's identity and a hash of its
+        contents and holds at most *traced_grids_cache_size* grids, with the least recently used grid evicted first.
 
-        for (plane_index, plane) in enumerate(self.planes):
+        Parameters
+        ----------
+        grid : aa.Grid or aa.GridCoordinates
+            The image-plane grid which is traced through the planes.
+        plane_index_limit : int or None
+            If input, only the grids up to and including this plane index are traced and returned.
+        """
+
+        if plane_index_limit is None:
+            plane_index_limit = self.total_planes - 1
+
+        traced_grids = self.traced_grids_and_deflections_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )[0]
+
+        return [
+            traced_grid.copy() for traced_grid in traced_grids[: plane_index_limit + 1]
+        ]
+
+    def traced_grids_and_deflections_of_planes_from_grid(self, grid, plane_index_limit):
+        """Returns the (cached) traced grids and deflection angles of every plane up to the input plane index limit,
+        resuming the ray-tracing calculation from the last plane that was previously traced for this grid.
+
+        The deflections of a plane are only computed if a subsequent plane requires them, thus the final plane of a
+        tracer never has its deflection angles computed.
+
+        The arrays returned are those stored in the cache and must not be modified in place."""
+
+        cache_key = self.traced_grids_cache_key_from_grid(grid=grid)
+
+        if cache_key in self._traced_grids_cache:
+            self._traced_grids_cache.move_to_end(cache_key)
+            traced_grids, traced_deflections = self._traced_grids_cache[cache_key]
+        else:
+            if self.adaptive_tracing_applies_to_grid(grid=grid):
+                traced_grids = self.adaptive_traced_grids_of_planes_from_grid(grid=grid)
+            else:
+                traced_grids = []
+
+            traced_deflections = []
+            self._traced_grids_cache[cache_key] = (traced_grids, traced_deflections)
+
+            while len(self._traced_grids_cache) > self.traced_grids_cache_size:
+                self._traced_grids_cache.popitem(last=False)
+
+        self.trace_grids_and_deflections_of_planes(
+            grid=grid,
+            traced_grids=traced_grids,
+            traced_deflections=traced_deflections,
+            plane_index_limit=plane_index_limit,
+        )
+
+        return traced_grids, traced_deflections
+
+    def trace_grids_and_deflections_of_planes(
+        self, grid, traced_grids, traced_deflections, plane_index_limit
+    ):
+        """Extend the input lists of traced grids and deflection angles of every plane, such that they contain every
+        plane up to the input plane index limit.
+
+        If the grid is a *GridInterpolate* its sparse interpolation grid is also traced through every plane. The
+        traced grid of each plane then uses that plane's traced interpolation grid, such that mass profiles which are
+        interpolated evaluate their deflection angles on the sparse grid in that plane. These are interpolated to the
+        full resolution grid using the image-plane interpolation weights, which remain valid because every traced
+        coordinate is a function of its image-plane coordinate."""
+
+        if isinstance(grid, grids.GridInterpolate):
+            traced_interp_grids = self.traced_grids_and_deflections_of_planes_from_grid(
+                grid=grid.grid_interp, plane_index_limit=plane_index_limit
+            )[0]
+
+        for plane_index in range(len(traced_grids), plane_index_limit + 1):
+
+            if plane_index > len(traced_deflections):
+                traced_deflections.append(
+                    self.planes[plane_index - 1].deflections_from_grid(
+                        grid=traced_grids[plane_index - 1]
+                    )
+                )
 
             scaled_grid = grid.copy()
 
             if plane_index > 0:
+
                 for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
+                    scaling_factor = self.scaling_factor_between_planes(
+                        i=previous_plane_index, j=plane_index
                     )
 
                     scaled_deflections = (
                         scaling_factor * traced_deflections[previous_plane_index]
                     )
 
-                    # TODO : Setup as GridInterpolate
-
                     scaled_grid -= scaled_deflections
 
+            if isinstance(grid, grids.GridInterpolate):
+                scaled_grid.grid_interp = traced_interp_grids[plane_index]
+
             traced_grids.append(scaled_grid)
 
-            if plane_index_limit is not None:
-                if plane_index == plane_index_limit:
-                    return traced_grids
+    def adaptive_tracing_applies_to_grid(self, grid):
+        """Adaptive ray-tracing is only performed if the tracer has an *adaptive_tracing_tolerance*, more than one
+        plane and the input is a *Grid* with a sub-size above 1 (e.g. not a *GridIterate* or *GridCoordinates*)."""
+        return (
+            self.adaptive_tracing_tolerance is not None
+            and self.total_planes > 1
+            and type(grid) is grids.Grid
+            and grid.sub_size > 1
+            and grid.shape[0] == grid.mask.sub_pixels_in_mask
+        )
+
+    def adaptive_traced_grids_of_planes_from_grid(self, grid):
+        """Trace a sub-gridded *Grid* through every plane of the tracer adaptively, computing the deflection angles
+        of far fewer coordinates than the sub-grid contains.
+
+        The corners and centre of every (unsubbed) image pixel are traced first. Where the lens mapping is smooth
+        (e.g. far from the critical curves) the traced sub-pixels of an image pixel are accurately given by bilinear
+        interpolation of its traced corners. The accuracy of this interpolation is estimated by comparing the
+        interpolated value at the pixel centre to the pixel's traced centre: in any pixel where they differ by more
+        than the *adaptive_tracing_tolerance* (in arc-seconds, in any plane), or where a corner lands on a singularity of
+        a mass profile, every sub-pixel is ray-traced exactly.
+
+        For a grid of N image pixels and sub-size S this computes the deflections of ~2N coordinates plus S^2
+        coordinates for every refined pixel, compared to S^2 N coordinates for the full sub-grid.
+
+        Parameters
+        ----------
+        grid : aa.Grid
+            The sub-gridded image-plane grid which is traced through the planes.
+        """
+
+        sub_length = grid.sub_size ** 2
+        pixels = grid.shape[0] // sub_length
+        pixel_scale_y, pixel_scale_x = grid.pixel_scales
+
+        sub_grid = np.asarray(grid).reshape(pixels, sub_length, 2)
+        pixel_centres = np.mean(sub_grid, axis=1)
+
+        pixel_indexes = np.argwhere(~np.asarray(grid.mask))
+        corner_offsets = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+
+        corner_keys = (pixel_indexes[:, None, 0] + corner_offsets[:, 0]) * (
+            grid.mask.shape[1] + 1
+        ) + (pixel_indexes[:, None, 1] + corner_offsets[:, 1])
+
+        corner_grid = np.stack(
+            (
+                pixel_centres[:, None, 0]
+                + pixel_scale_y * (0.5 - corner_offsets[:, 0]),
+                pixel_centres[:, None, 1]
+                + pixel_scale_x * (corner_offsets[:, 1] - 0.5),
+            ),
+            axis=-1,
+        )
+
+        unique_corner_keys, unique_corner_indexes, corner_inverse = np.unique(
+            corner_keys, return_index=True, return_inverse=True
+        )
+
+        total_corners = unique_corner_keys.shape[0]
+
+        coarse_grid = np.concatenate(
+            (corner_grid.reshape(-1, 2)[unique_corner_indexes], pixel_centres)
+        )
+
+        traced_coarse_grids = []
+
+        self.trace_grids_and_deflections_of_planes(
+            grid=coarse_grid,
+            traced_grids=traced_coarse_grids,
+            traced_deflections=[],
+            plane_index_limit=self.total_planes - 1,
+        )
+
+        corner_inverse = corner_inverse.reshape(pixels, 4)
+
+        traced_corners_of_planes = [
+            traced_coarse_grid[:total_corners][corner_inverse]
+            for traced_coarse_grid in traced_coarse_grids
+        ]
+
+        refine = np.zeros(pixels, dtype="bool")
+
+        for traced_coarse_grid, traced_corners in zip(
+            traced_coarse_grids[1:], traced_corners_of_planes[1:]
+        ):
+            interpolation_error = np.linalg.norm(
+                np.mean(traced_corners, axis=1) - traced_coarse_grid[total_corners:],
+                axis=1,
+            )
+            refine |= ~(interpolation_error <= self.adaptive_tracing_tolerance)
+
+        v = (pixel_centres[:, None, 0] + 0.5 * pixel_scale_y - sub_grid[:, :, 0]) / (
+            pixel_scale_y
+        )
+        u = (sub_grid[:, :, 1] - pixel_centres[:, None, 1] + 0.5 * pixel_scale_x) / (
+            pixel_scale_x
+        )
+
+        bilinear_weights = np.stack(
+            ((1.0 - u) * (1.0 - v), u * (1.0 - v), (1.0 - u) * v, u * v), axis=-1
+        )
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+        traced_refined_grids = []
+
+        if np.any(refine):
+            self.trace_grids_and_deflections_of_planes(
+                grid=sub_grid[refine].reshape(-1, 2),
+                traced_grids=traced_refined_grids,
+                traced_deflections=[],
+                plane_index_limit=self.total_planes - 1,
+            )
+
+        traced_grids = [grid.copy()]
+
+        for plane_index in range(1, self.total_planes):
+
+            traced_sub_grid = np.einsum(
+                "psc,pcd->psd", bilinear_weights, traced_corners_of_planes[plane_index]
+            )
+
+            if np.any(refine):
+                traced_sub_grid[refine] = traced_refined_grids[plane_index].reshape(
+                    -1, sub_length, 2
+                )
+
+            traced_grid = grid.copy()
+            traced_grid[:] = traced_sub_grid.reshape(-1, 2)
+            traced_grids.append(traced_grid)
 
         return traced_grids
 
+    def traced_grids_of_planes_from_grids(self, grid_list, plane_index_limits=None):
+        """Trace a list of grids (e.g. the grid, blurring grid and sparse grids of a fit) through the planes of the
+        tracer, returning the traced grids of every plane of every grid (entries of the list which are None are
+        returned as None).
+
+        The grids are concatenated and traced through the planes in a single pass (see
+        *cache_traced_grids_of_planes_from_grids*), instead of performing a multi-plane pass per grid.
+
+        Parameters
+        ----------
+        grid_list : [aa.Grid or aa.GridCoordinates or None]
+            The image-plane grids which are traced through the planes.
+        plane_index_limits : [int or None] or None
+            If input, each grid is only traced up to and including its corresponding plane index.
+        """
+
+        if plane_index_limits is None:
+            plane_index_limits = [None] * len(grid_list)
+
+        plane_index_limits = [
+            self.total_planes - 1 if plane_index_limit is None else plane_index_limit
+            for plane_index_limit in plane_index_limits
+        ]
+
+        self.cache_traced_grids_of_planes_from_grids(
+            grid_list=grid_list, plane_index_limits=plane_index_limits
+        )
+
+        return [
+            None
+            if grid is None
+            else self.traced_grids_of_planes_from_grid(
+                grid=grid, plane_index_limit=plane_index_limit
+            )
+            for grid, plane_index_limit in zip(grid_list, plane_index_limits)
+        ]
+
+    def cache_traced_grids_of_planes_from_grids(self, grid_list, plane_index_limits):
+        """Trace a list of grids through the planes in a single pass and store the traced grids and deflections of
+        every grid in the traced grids cache, such that subsequent calls using any of these grids are not retraced.
+
+        The grids are concatenated into one array, ordered such that grids which are traced through more planes come
+        first. The deflection angles of each plane are then computed once for the whole array, only including the
+        grids that are traced beyond that plane, such that grids are never traced to planes they are not used for.
+        The traced grids and deflections of every plane are split back into views of each individual grid.
+
+        Grids which are already cached up to their plane index limit, *GridIterate* and *GridInterpolate* objects
+        and grids which are traced adaptively are not included, and are traced individually when required.
+
+        Parameters
+        ----------
+        grid_list : [aa.Grid or aa.GridCoordinates or None]
+            The image-plane grids which are traced through the planes.
+        plane_index_limits : [int]
+            The index of the last plane each grid is traced to.
+        """
+
+        grids_to_trace = {}
+
+        for grid, plane_index_limit in zip(grid_list, plane_index_limits):
+
+            if (
+                grid is None
+                or plane_index_limit == 0
+                or isinstance(grid, (grids.GridIterate, grids.GridInterpolate))
+                or self.adaptive_tracing_applies_to_grid(grid=grid)
+            ):
+                continue
+
+            cache_key = self.traced_grids_cache_key_from_grid(grid=grid)
+
+            if cache_key in self._traced_grids_cache:
+                if len(self._traced_grids_cache[cache_key][0]) > plane_index_limit:
+                    continue
+                del self._traced_grids_cache[cache_key]
+
+            if cache_key in grids_to_trace:
+                plane_index_limit = max(plane_index_limit, grids_to_trace[cache_key][1])
+
+            grids_to_trace[cache_key] = (grid, plane_index_limit)
+
+        if len(grids_to_trace) == 0:
+            return
+
+        grids_to_trace = sorted(
+            [
+                (cache_key, grid, plane_index_limit)
+                for cache_key, (grid, plane_index_limit) in grids_to_trace.items()
+            ],
+            key=lambda grid_to_trace: -grid_to_trace[2],
+        )
+
+        grid_sizes = [grid.shape[0] for (_, grid, _) in grids_to_trace]
+        grid_offsets = np.concatenate(([0], np.cumsum(grid_sizes)))
+
+        plane_index_limit = grids_to_trace[0][2]
+
+        traced_sizes = [
+            sum(
+                grid_size
+                for grid_size, (_, _, grid_plane_index_limit) in zip(
+                    grid_sizes, grids_to_trace
+                )
+                if grid_plane_index_limit >= plane_index
+            )
+            for plane_index in range(plane_index_limit + 1)
+        ]
+
+        grid_buffer = np.concatenate(
+            [np.asarray(grid).reshape(-1, 2) for (_, grid, _) in grids_to_trace]
+        )
+
+        traced_buffers = [grid_buffer]
+        deflections_buffers = []
+
+        for plane_index in range(1, plane_index_limit + 1):
+
+            traced_size = traced_sizes[plane_index]
+
+            deflections_buffers.append(
+                np.asarray(
+                    self.planes[plane_index - 1].deflections_from_grid(
+                        grid=traced_buffers[plane_index - 1][:traced_size]
+                    )
+                )
+            )
+
+            traced_buffer = grid_buffer[:traced_size].copy()
+
+            for previous_plane_index in range(plane_index):
+                traced_buffer -= (
+                    self.scaling_factor_between_planes(
+                        i=previous_plane_index, j=plane_index
+                    )
+                    * deflections_buffers[previous_plane_index][:traced_size]
+                )
+
+            traced_buffers.append(traced_buffer)
+
+        for buffer in traced_buffers + deflections_buffers:
+            buffer.setflags(write=False)
+
+        for index, (cache_key, grid, grid_plane_index_limit) in enumerate(
+            grids_to_trace
+        ):
+
+            grid_slice = slice(grid_offsets[index], grid_offsets[index + 1])
+
+            traced_grids = [
+                self.view_of_grid_from_buffer(
+                    grid=grid, buffer=traced_buffer[grid_slice]
+                )
+                for traced_buffer in traced_buffers[: grid_plane_index_limit + 1]
+            ]
+
+            traced_deflections = [
+                deflections_buffer[grid_slice]
+                for deflections_buffer in deflections_buffers[:grid_plane_index_limit]
+            ]
+
+            self._traced_grids_cache[cache_key] = (traced_grids, traced_deflections)
+
+            while len(self._traced_grids_cache) > self.traced_grids_cache_size:
+                self._traced_grids_cache.popitem(last=False)
+
+    @staticmethod
+    def view_of_grid_from_buffer(grid, buffer):
+        """A view of a buffer of traced (y,x) coordinates with the same structure (e.g. *Grid*) and attributes (e.g.
+        mask) as the grid that was traced."""
+
+        if type(grid) is np.ndarray:
+            return buffer.reshape(grid.shape)
+
+        view = buffer.reshape(grid.shape).view(type(grid))
+        view.__dict__.update(grid.__dict__)
+        return view
+
+    @staticmethod
+    def traced_grids_cache_key_from_grid(grid):
+        """The key of a grid in the traced grids cache, which combines the grid's identity with a hash of its contents
+        so that a grid which is modified in place (or a new grid reusing the memory of a deleted grid) is retraced."""
+
+        grid_array = np.ascontiguousarray(grid)
+
+        return (
+            id(grid),
+            type(grid),
+            grid_array.shape,
+            hashlib.sha1(grid_array.view(np.uint8)).hexdigest(),
+        )
+
     @grids.grid_like_to_structure
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
 
@@ -448,13 +897,17 @@ class AbstractTracerLensing(AbstractTracerCosmology, ABC):
             if redshift < plane_redshift:
                 plane_index_insert = plane_index
 
-        planes = self.planes
+        planes = list(self.planes)
         planes.insert(
             plane_index_insert,
             pl.Plane(redshift=redshift, galaxies=[], cosmology=self.cosmology),
         )
 
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
+        tracer = Tracer(
+            planes=planes,
+            cosmology=self.cosmology,
+            adaptive_tracing_tolerance=self.adaptive_tracing_tolerance,
+        )
 
         return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
 
@@ -504,6 +957,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         if not self.has_light_profile:
             return np.zeros(shape=grid.shape_1d)
 
+        self.cache_traced_grids_of_planes_from_grids(
+            grid_list=[grid, blurring_grid],
+            plane_index_limits=[self.upper_plane_index_with_light_profile] * 2,
+        )
+
         image = self.image_from_grid(grid=grid)
 
         blurring_image = self.image_from_grid(grid=blurring_grid)
@@ -524,10 +982,10 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
-        )
+        (
+            traced_grids_of_planes,
+            traced_blurring_grids_of_planes,
+        ) = self.traced_grids_of_planes_from_grids(grid_list=[grid, blurring_grid])
         return [
             plane.blurred_image_from_grid_and_psf(
                 grid=traced_grids_of_planes[plane_index],
@@ -552,6 +1010,11 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         if not self.has_light_profile:
             return np.zeros(shape=grid.shape_1d)
 
+        self.cache_traced_grids_of_planes_from_grids(
+            grid_list=[grid, blurring_grid],
+            plane_index_limits=[self.upper_plane_index_with_light_profile] * 2,
+        )
+
         image = self.image_from_grid(grid=grid)
 
         blurring_image = self.image_from_grid(grid=blurring_grid)
@@ -574,10 +1037,10 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
             Class which performs the PSF convolution of a masked image in 1D.
         """
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
-        traced_blurring_grids_of_planes = self.traced_grids_of_planes_from_grid(
-            grid=blurring_grid
-        )
+        (
+            traced_grids_of_planes,
+            traced_blurring_grids_of_planes,
+        ) = self.traced_grids_of_planes_from_grids(grid_list=[grid, blurring_grid])
 
         return [
             plane.blurred_image_from_grid_and_convolver(
@@ -663,10 +1126,10 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
     ):
 
         images_of_planes = self.images_of_planes_from_grid(grid=grid)
-        return [
-            transformer.visibilities_from_image(image=image)
-            for image in images_of_planes
-        ]
+
+        return visibilities_of_images_from_transformer(
+            images=images_of_planes, transformer=transformer
+        )
 
     def sparse_image_plane_grids_of_planes_from_grid(
         self, grid, pixelization_setting=pix.SettingsPixelization()
@@ -701,19 +1164,17 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 settings_pixelization.preload_sparse_grids_of_planes
             )
 
-        traced_sparse_grids_of_planes = []
-
-        for (plane_index, plane) in enumerate(self.planes):
-
-            if sparse_image_plane_grids_of_planes[plane_index] is None:
-                traced_sparse_grids_of_planes.append(None)
-            else:
-                traced_sparse_grids = self.traced_grids_of_planes_from_grid(
-                    grid=sparse_image_plane_grids_of_planes[plane_index]
-                )
-                traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
+        traced_sparse_grids_of_planes = self.traced_grids_of_planes_from_grids(
+            grid_list=sparse_image_plane_grids_of_planes,
+            plane_index_limits=range(self.total_planes),
+        )
 
-        return traced_sparse_grids_of_planes
+        return [
+            None if traced_sparse_grids is None else traced_sparse_grids[plane_index]
+            for plane_index, traced_sparse_grids in enumerate(
+                traced_sparse_grids_of_planes
+            )
+        ]
 
     def mappers_of_planes_from_grid(
         self, grid, settings_pixelization=pix.SettingsPixelization()
@@ -848,28 +1309,174 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ) -> {g.Galaxy: np.ndarray}:
         """
-        A dictionary associating galaxies with their corresponding model images
+        A dictionary associating galaxies with their corresponding model visibilities.
+
+        The images of all galaxies with light profiles are transformed to the uv-plane together (see \
+        *visibilities_of_images_from_transformer*), and galaxies without light profiles have visibilities of zero.
         """
 
-        galaxy_profile_visibilities_image_dict = dict()
+        galaxy_image_dict = dict()
 
         traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
 
         for (plane_index, plane) in enumerate(self.planes):
-            profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
-                grid=traced_grids_of_planes[plane_index], transformer=transformer
+            for galaxy in plane.galaxies:
+                if galaxy.has_light_profile:
+                    galaxy_image_dict[galaxy] = galaxy.image_from_grid(
+                        grid=traced_grids_of_planes[plane_index]
+                    )
+
+        galaxy_profile_visibilities_image_dict = dict(
+            zip(
+                galaxy_image_dict.keys(),
+                visibilities_of_images_from_transformer(
+                    images=list(galaxy_image_dict.values()), transformer=transformer
+                ),
             )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
-                galaxy_profile_visibilities_image_dict[
-                    galaxy
-                ] = profile_visibilities_of_galaxies[galaxy_index]
+        )
+
+        return {
+            galaxy: galaxy_profile_visibilities_image_dict.get(
+                galaxy,
+                vis.Visibilities.zeros(shape_1d=(transformer.uv_wavelengths.shape[0],)),
+            )
+            for galaxy in self.galaxies
+        }
+
+
+_scaling_factor_matrix_cache = OrderedDict()
+_scaling_factor_matrix_cache_size = 128
+
+
+def scaling_factor_matrix_from(plane_redshifts, cosmology):
+    """Compute the matrix of scaling factors between every pair of planes used for multi-plane ray-tracing, where
+    entry [i, j] (i < j) scales the deflection angles of plane i to plane j given the redshift of the final plane.
+
+    Every scaling factor requires astropy distance integrals, therefore the matrix is computed once and cached for
+    every combination of plane redshifts and cosmology. This means the many tracers created during a non-linear
+    search (which all share the same plane redshifts) do not recompute them. The cosmology is keyed by its repr,
+    which lists its parameters, because astropy cosmologies are not hashable (and equal cosmologies should share
+    an entry).
+
+    Parameters
+    ----------
+    plane_redshifts : (float,)
+        The redshifts of the tracer's planes, in ascending order.
+    cosmology : astropy.cosmology
+        The cosmology of the ray-tracing calculation.
+    """
+
+    key = (tuple(plane_redshifts), repr(cosmology))
+
+    if key in _scaling_factor_matrix_cache:
+        _scaling_factor_matrix_cache.move_to_end(key)
+        return _scaling_factor_matrix_cache[key]
+
+    total_planes = len(plane_redshifts)
+
+    scaling_factor_matrix = np.zeros(shape=(total_planes, total_planes))
+
+    for j in range(1, total_planes):
+        for i in range(j):
+            scaling_factor_matrix[
+                i, j
+            ] = cosmology_util.scaling_factor_between_redshifts_from(
+                redshift_0=plane_redshifts[i],
+                redshift_1=plane_redshifts[j],
+                redshift_final=plane_redshifts[-1],
+                cosmology=cosmology,
+            )
+
+    scaling_factor_matrix.setflags(write=False)
+
+    _scaling_factor_matrix_cache[key] = scaling_factor_matrix
+
+    if len(_scaling_factor_matrix_cache) > _scaling_factor_matrix_cache_size:
+        _scaling_factor_matrix_cache.popitem(last=False)
+
+    return scaling_factor_matrix
+
+
+def visibilities_of_images_from_transformer(images, transformer):
+    """Transform many images (e.g. the images of every galaxy or plane of a tracer) to the uv-plane together, \
+    returning the visibilities of every image.
+
+    For a *TransformerDFT* the images are stacked into one [total_images, total_image_pixels] array, such that \
+    its preloaded transforms are multiplied with all images in one matrix product, or (without a preload) the \
+    Fourier transform of every image pixel to every visibility is computed once for all images rather than once \
+    per image. Other transformers transform each image separately.
+
+    Parameters
+    ----------
+    images : [aa.Array]
+        The images which are transformed to the uv-plane.
+    transformer : TransformerDFT or TransformerNUFFT
+        The transformer which maps images to the uv-plane.
+    """
+
+    if not isinstance(transformer, trans.TransformerDFT) or len(images) < 2:
+        return [transformer.visibilities_from_image(image=image) for image in images]
+
+    images_1d = np.stack([np.asarray(image.in_1d_binned) for image in images])
+
+    if transformer.preload_transform:
+        real_visibilities = np.dot(images_1d, transformer.preload_real_transforms)
+        imag_visibilities = np.dot(images_1d, transformer.preload_imag_transforms)
+    else:
+        real_visibilities, imag_visibilities = visibilities_of_images_jit(
+            images_1d=images_1d,
+            grid_radians=np.asarray(transformer.grid),
+            uv_wavelengths=transformer.uv_wavelengths,
+        )
+
+    return [
+        vis.Visibilities(
+            visibilities_1d=np.stack(
+                (real_visibilities[image_index], imag_visibilities[image_index]),
+                axis=-1,
+            )
+        )
+        for image_index in range(len(images))
+    ]
 
-        return galaxy_profile_visibilities_image_dict
+
+@decorator_util.jit()
+def visibilities_of_images_jit(images_1d, grid_radians, uv_wavelengths):
+
+    real_visibilities = np.zeros(shape=(images_1d.shape[0], uv_wavelengths.shape[0]))
+    imag_visibilities = np.zeros(shape=(images_1d.shape[0], uv_wavelengths.shape[0]))
+
+    for image_1d_index in range(images_1d.shape[1]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            phase = (
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            real_transform = np.cos(phase)
+            imag_transform = np.sin(phase)
+
+            for image_index in range(images_1d.shape[0]):
+                real_visibilities[image_index, vis_1d_index] += (
+                    images_1d[image_index, image_1d_index] * real_transform
+                )
+                imag_visibilities[image_index, vis_1d_index] += (
+                    images_1d[image_index, image_1d_index] * imag_transform
+                )
+
+    return real_visibilities, imag_visibilities
 
 
 class Tracer(AbstractTracerData):
     @classmethod
-    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+    def from_galaxies(
+        cls, galaxies, cosmology=cosmo.Planck15, adaptive_tracing_tolerance=None
+    ):
 
         plane_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=galaxies)
 
@@ -884,7 +1491,11 @@ class Tracer(AbstractTracerData):
                 pl.Plane(galaxies=galaxies_in_planes[plane_index], cosmology=cosmology)
             )
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            adaptive_tracing_tolerance=adaptive_tracing_tolerance,
+        )
 
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
@@ -951,3 +1562,134 @@ class Tracer(AbstractTracerData):
             )
 
         return Tracer(planes=planes, cosmology=cosmology)
+
+
+class BatchTracer:
+    def __init__(self, tracers):
+        """A batch of tracers which share the same plane redshifts and cosmology (e.g. tracers of the same lens model
+        for many parameter sets sampled by a non-linear search), which are traced together.
+
+        The deflection angles of every tracer are computed using its own mass profiles, but the multi-plane
+        ray-tracing calculation (scaling the deflection angles of every previous plane and subtracting them from the
+        grid) is performed for all tracers at once using stacked arrays of shape [total_tracers, total_coordinates, 2].
+
+        Parameters
+        ----------
+        tracers : [Tracer]
+            The tracers in the batch, which must all have the same plane redshifts and cosmology. Cosmologies are
+            compared by their parameters, so tracers given separate but identical cosmology instances (e.g. after
+            being pickled to another process) can be batched together.
+        """
+
+        if len(tracers) == 0:
+            raise exc.TracerException("A BatchTracer requires at least one tracer.")
+
+        cosmology_hash = hash_util.hash_from_object(obj=tracers[0].cosmology)
+
+        for tracer in tracers[1:]:
+            if (
+                tracer.plane_redshifts != tracers[0].plane_redshifts
+                or hash_util.hash_from_object(obj=tracer.cosmology) != cosmology_hash
+            ):
+                raise exc.TracerException(
+                    "The tracers of a BatchTracer must all have the same plane redshifts and cosmology."
+                )
+
+        self.tracers = tracers
+
+    @classmethod
+    def from_galaxies_list(cls, galaxies_list, cosmology=cosmo.Planck15):
+        return BatchTracer(
+            tracers=[
+                Tracer.from_galaxies(galaxies=galaxies, cosmology=cosmology)
+                for galaxies in galaxies_list
+            ]
+        )
+
+    @property
+    def total_tracers(self):
+        return len(self.tracers)
+
+    @property
+    def total_planes(self):
+        return self.tracers[0].total_planes
+
+    @property
+    def plane_redshifts(self):
+        return self.tracers[0].plane_redshifts
+
+    @property
+    def scaling_factor_matrix(self):
+        return self.tracers[0].scaling_factor_matrix
+
+    def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """Trace an input grid of (y,x) coordinates through every plane of every tracer in the batch.
+
+        The traced grids are returned as a list with an entry for every plane, where each entry is an ndarray of
+        shape [total_tracers, total_coordinates, 2] giving the traced grid of that plane for every tracer.
+
+        Parameters
+        ----------
+        grid : aa.Grid or ndarray
+            The image-plane grid which is traced through the planes of every tracer.
+        plane_index_limit : int or None
+            If input, only the grids up to and including this plane index are traced and returned.
+        """
+
+        if plane_index_limit is None:
+            plane_index_limit = self.total_planes - 1
+
+        grid = np.asarray(grid)
+
+        traced_grids = [
+            np.repeat(grid[np.newaxis, :, :], repeats=self.total_tracers, axis=0)
+        ]
+        traced_deflections = []
+
+        for plane_index in range(1, plane_index_limit + 1):
+
+            traced_deflections.append(
+                self.deflections_of_plane_from_traced_grids(
+                    plane_index=plane_index - 1, traced_grids=traced_grids[-1]
+                )
+            )
+
+            scaling_factors = np.array(
+                [
+                    self.tracers[0].scaling_factor_between_planes(
+                        i=previous_plane_index, j=plane_index
+                    )
+                    for previous_plane_index in range(plane_index)
+                ]
+            )
+
+            traced_grids.append(
+                grid[np.newaxis, :, :]
+                - np.tensordot(scaling_factors, np.stack(traced_deflections), axes=1)
+            )
+
+        return traced_grids
+
+    def deflections_of_plane_from_traced_grids(self, plane_index, traced_grids):
+        """Compute the deflection angles of one plane of every tracer, returning them stacked as an ndarray of shape
+        [total_tracers, total_coordinates, 2]. Each tracer's deflections are computed using its traced grid of that
+        plane, which is the corresponding entry of the input [total_tracers, total_coordinates, 2] ndarray.
+
+        The deflection angles are computed by looping over the tracers in Python, calling each plane's own mass
+        profiles, because the mass profiles of different tracers have different parameters (and may be different
+        profile classes) and autogalaxy's profiles only evaluate one set of parameters per call. Only the ray-tracing
+        recursion in *traced_grids_of_planes_from_grid* is vectorized over the batch, so the speed up over tracing
+        each *Tracer* individually is limited to that step."""
+
+        deflections = np.zeros(shape=traced_grids.shape)
+
+        for tracer_index, tracer in enumerate(self.tracers):
+
+            plane = tracer.planes[plane_index]
+
+            if plane.has_mass_profile:
+                deflections[tracer_index] = plane.deflections_from_grid(
+                    grid=traced_grids[tracer_index]
+                )
+
+        return deflections
@@ -3,6 +3,7 @@ from autolens import exc
 from autolens.fit import fit_positions
 
 import copy
+import numpy as np
 
 
 class SettingsLens:
@@ -11,11 +12,31 @@ class SettingsLens:
         auto_positions_factor=None,
         auto_positions_minimum_threshold=None,
         positions_threshold=None,
+        adaptive_tracing_tolerance=None,
     ):
+        """
+        The settings of the lens calculations performed when fitting a lens model.
+
+        Parameters
+        ----------
+        auto_positions_factor : float or None
+            Sets the positions threshold of the next phase to this factor multiplied by the maximum separation of the \
+            positions traced using the maximum likelihood lens model of the previous phase.
+        auto_positions_minimum_threshold : float or None
+            The minimum value that the automatically computed positions threshold can take.
+        positions_threshold : float or None
+            If the positions of a lens model trace further than this threshold from one another in the source-plane \
+            the model is resampled.
+        adaptive_tracing_tolerance : float or None
+            If input, the tracers of the lens models ray-trace sub-gridded grids adaptively, computing the traced \
+            sub-pixels of pixels far from the critical curves via interpolation accurate to this tolerance (in \
+            arc-seconds).
+        """
 
         self.auto_positions_factor = auto_positions_factor
         self.auto_positions_minimum_threshold = auto_positions_minimum_threshold
         self.positions_threshold = positions_threshold
+        self.adaptive_tracing_tolerance = adaptive_tracing_tolerance
 
     @property
     def tag(self):
@@ -73,20 +94,41 @@ class SettingsLens:
         )
 
     def check_positions_trace_within_threshold_via_tracer(self, positions, tracer):
+        """
+        Raise a *RayTracingException*, such that the lens model is resampled, if any set of positions trace further \
+        than the positions threshold from one another in the source-plane.
+
+        This check is performed at the start of the log likelihood function, before any other calculation, so only \
+        the positions are traced (without creating a positions fit) and the first pair of positions found to exceed \
+        the threshold rejects the model.
+
+        The positions are traced directly rather than via *traced_grids_of_planes_from_grid*, so that this small, \
+        freshly created grid does not evict the cached traced grids of the tracer.
+        """
+
+        if positions is None or self.positions_threshold is None:
+            return
 
         if not tracer.has_mass_profile or len(tracer.planes) == 1:
             return
 
-        if positions is not None and self.positions_threshold is not None:
+        traced_positions = []
+
+        tracer.trace_grids_and_deflections_of_planes(
+            grid=np.asarray(positions),
+            traced_grids=traced_positions,
+            traced_deflections=[],
+            plane_index_limit=tracer.total_planes - 1,
+        )
 
-            positions_fit = fit_positions.FitPositionsSourcePlaneMaxSeparation(
-                positions=positions, tracer=tracer, noise_value=1.0
-            )
+        source_plane_positions = traced_positions[-1]
 
-            if not positions_fit.maximum_separation_within_threshold(
-                self.positions_threshold
-            ):
-                raise exc.RayTracingException
+        if not fit_positions.grid_within_threshold_from(
+            grid=np.asarray(source_plane_positions, dtype="float64"),
+            upper_indexes=np.asarray(positions.upper_indexes, dtype="int64"),
+            threshold=self.positions_threshold,
+        ):
+            raise exc.RayTracingException
 
     def modify_positions_threshold(self, positions_threshold):
 
@@ -66,20 +66,29 @@ class Result(result.Result):
 
         grid = self.analysis.masked_dataset.mask.geometry.unmasked_grid_sub_1
 
-        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.001)
+        solver = pos.PositionsSolverCache(
+            solver=pos.PositionsFinder(grid=grid, pixel_scale_precision=0.001),
+            file_path=self.positions_solver_cache_file_path,
+        )
 
         try:
-            multiple_images = [
-                solver.solve(
-                    lensing_obj=self.max_log_likelihood_tracer,
-                    source_plane_coordinate=centre,
-                )
-                for centre in self.source_plane_centres.in_list[0]
-            ]
+            multiple_images = solver.solve_for_source_plane_coordinates(
+                lensing_obj=self.max_log_likelihood_tracer,
+                source_plane_coordinates=self.source_plane_centres.in_list[0],
+            )
             return grids.GridCoordinates(coordinates=multiple_images)
         except IndexError:
             return None
 
+    @property
+    def positions_solver_cache_file_path(self) -> str:
+        """The file in the phase's output directory that the multiple image positions solved for by this result are \
+        persisted to, such that a resumed pipeline does not solve for them again."""
+        if self.search is None:
+            return None
+
+        return "{}/positions_solver_cache.json".format(self.search.paths.output_path)
+
     @property
     def path_galaxy_tuples(self) -> [(str, g.Galaxy)]:
         """
@@ -1,5 +1,77 @@
+import autofit as af
+from autofit.exc import FitException
+from autogalaxy.profiles import mass_profiles
+from autolens import hash_util
+from autolens.dataset import shared
 from autolens.lens import ray_tracing
 
+import multiprocessing as mp
+import numpy as np
+
+_batch_analysis = None
+
+
+def _init_batch_worker(analysis):
+    """
+    Store the *Analysis* in a worker process of the batch pool, so that its masked dataset is sent to each worker \
+    once when the pool starts (or inherited without copying when the pool forks) instead of once per task.
+
+    If the *Analysis* is passed as a *SharedDataset* the worker attaches to it, such that the arrays of the masked \
+    dataset are views of shared memory rather than copies.
+    """
+    global _batch_analysis
+
+    if isinstance(analysis, shared.SharedDataset):
+        analysis = analysis.attach()
+
+    _batch_analysis = analysis
+
+
+def _batch_log_likelihood(instance):
+    return _log_likelihood_or_resample(analysis=_batch_analysis, instance=instance)
+
+
+def _log_likelihood_or_resample(analysis, instance):
+    try:
+        return analysis.log_likelihood_function(instance=instance)
+    except FitException:
+        return -np.inf
+
+
+def mass_model_is_fixed_from(model):
+    """
+    Returns *True* if none of the mass profiles or redshifts of the galaxies in a model are free parameters, such \
+    that every instance of the model has the same mass model (and therefore traces every grid to the same \
+    coordinates).
+
+    A free parameter is part of the mass model if any object on its path in the model (e.g. *galaxies.lens.mass*) is \
+    a *PriorModel* of a mass profile, or if it is a redshift. Parameters shared by a light and mass profile (e.g. a \
+    linked centre) have a path via both, so they are part of the mass model.
+
+    Parameters
+    ----------
+    model : af.CollectionPriorModel or None
+        The model of the phase, where a model of *None* is treated as not fixed.
+    """
+    if model is None:
+        return False
+
+    for path, prior in model.path_priors_tuples:
+
+        if path[-1] == "redshift":
+            return False
+
+        for index in range(1, len(path)):
+
+            obj = model.object_for_path(path[:index])
+
+            if isinstance(obj, af.PriorModel) and issubclass(
+                obj.cls, mass_profiles.MassProfile
+            ):
+                return False
+
+    return True
+
 
 class Analysis:
     def plane_for_instance(self, instance):
@@ -8,5 +80,152 @@ class Analysis:
     def tracer_for_instance(self, instance):
 
         return ray_tracing.Tracer.from_galaxies(
-            galaxies=instance.galaxies, cosmology=self.cosmology
+            galaxies=instance.galaxies,
+            cosmology=self.cosmology,
+            adaptive_tracing_tolerance=self.adaptive_tracing_tolerance,
+        )
+
+    def share_traced_grids_cache_with_tracer(self, tracer):
+        """
+        Give a tracer the traced grids cache of the previous tracer created by this *Analysis*, if both tracers have \
+        the same mass model.
+
+        When the mass profiles of a phase are fixed (e.g. they are instances passed from a previous phase of a \
+        pipeline) every sample of the non-linear search creates a tracer with the same plane redshifts, mass \
+        profiles and cosmology, which therefore traces the masked dataset's grids to the same coordinates. Sharing \
+        the cache means the grids are traced once for the whole search, and the likelihood evaluation of each \
+        sample is reduced to evaluating its light profiles (and inversion) on the cached traced grids.
+
+        Whether the phase's model has fixed mass profiles and redshifts is determined once when the *Analysis* is \
+        created (see *mass_model_is_fixed_from*). If they are free, no two samples share a mass model and this \
+        returns immediately. Otherwise the mass model is compared via a hash of the tracer's parameters which omits \
+        its light profiles (see *hash_util.hash_from_object*), so a tracer whose mass model differs nevertheless \
+        (e.g. an instance changed after it was sampled) is traced as normal and its cache replaces the shared cache.
+
+        This is called after the positions of the dataset are checked to trace within the positions threshold, so \
+        samples rejected by that check do not compute the hash.
+        """
+        if not self.mass_model_is_fixed or not tracer.has_mass_profile:
+            return
+
+        mass_model_hash = hash_util.hash_from_object(obj=tracer)
+
+        if getattr(self, "_traced_grids_mass_model_hash", None) == mass_model_hash:
+            tracer._traced_grids_cache = self._traced_grids_cache
+        else:
+            self._traced_grids_mass_model_hash = mass_model_hash
+            self._traced_grids_cache = tracer._traced_grids_cache
+
+    @property
+    def adaptive_tracing_tolerance(self):
+        return self.settings.settings_lens.adaptive_tracing_tolerance
+
+    def log_likelihood_function_batch(self, instances, number_of_cores=None):
+        """
+        Compute the log likelihood of many model instances in parallel, using a persistent pool of worker processes.
+
+        The pool is created on the first call and reused by subsequent calls with the same number of cores, so the \
+        masked dataset (grids, convolver, noise-map, etc.) is passed to the workers once when the pool starts rather \
+        than being pickled for every instance. Where the platform supports it the pool forks, such that the workers \
+        share the dataset's memory with the parent process. Otherwise the *Analysis* is exported as a \
+        *SharedDataset* which the workers attach to, so its arrays are still held in memory once per machine.
+
+        Instances whose fit raises a *FitException* are given a log likelihood of -np.inf, which is the value the \
+        non-linear search uses for resampled points.
+
+        The pool is closed when the phase's non-linear search finishes (see *PhaseDataset.run_analysis*). An \
+        *Analysis* used outside of a phase should call *close_batch_pool* once it is finished with, or be used as a \
+        context manager (e.g. *with analysis: ...*) which closes the pool on exit.
+
+        Parameters
+        ----------
+        instances : [af.ModelInstance]
+            The model instances whose log likelihoods are computed.
+        number_of_cores : int or None
+            The number of worker processes in the pool, which defaults to the number of CPUs on the machine.
+
+        Returns
+        -------
+        [float]
+            The log likelihood of every instance, in the same order as the input instances.
+        """
+        instances = list(instances)
+
+        if number_of_cores is None:
+            number_of_cores = mp.cpu_count()
+
+        if number_of_cores == 1 or len(instances) <= 1:
+            return [
+                _log_likelihood_or_resample(analysis=self, instance=instance)
+                for instance in instances
+            ]
+
+        pool = self.batch_pool_from_number_of_cores(number_of_cores=number_of_cores)
+
+        return pool.map(_batch_log_likelihood, instances)
+
+    def batch_pool_from_number_of_cores(self, number_of_cores):
+        """
+        Returns the persistent pool of worker processes used by *log_likelihood_function_batch*, creating it (and \
+        closing any existing pool with a different number of cores) if necessary.
+        """
+        pool = getattr(self, "_batch_pool", None)
+
+        if pool is not None and self._batch_pool_cores == number_of_cores:
+            return pool
+
+        self.close_batch_pool()
+
+        if "fork" in mp.get_all_start_methods():
+            context = mp.get_context("fork")
+            analysis = self
+        else:
+            context = mp.get_context()
+            analysis = shared.SharedDataset.from_dataset(dataset=self)
+            self._batch_shared_dataset = analysis
+
+        self._batch_pool = context.Pool(
+            processes=number_of_cores,
+            initializer=_init_batch_worker,
+            initargs=(analysis,),
         )
+        self._batch_pool_cores = number_of_cores
+
+        return self._batch_pool
+
+    def close_batch_pool(self):
+        """
+        Terminate the pool of worker processes used by *log_likelihood_function_batch*, if one exists.
+        """
+        pool = getattr(self, "_batch_pool", None)
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+        shared_dataset = getattr(self, "_batch_shared_dataset", None)
+
+        if shared_dataset is not None:
+            shared_dataset.unlink()
+
+        self._batch_pool = None
+        self._batch_pool_cores = None
+        self._batch_shared_dataset = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_batch_pool()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_batch_pool", None)
+        state.pop("_batch_pool_cores", None)
+        state.pop("_batch_shared_dataset", None)
+        state.pop("_traced_grids_mass_model_hash", None)
+        state.pop("_traced_grids_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
@@ -8,6 +8,19 @@ import copy
 
 
 class PhaseDataset(dataset.PhaseDataset):
+    def run_analysis(self, analysis, info=None, pickle_files=None):
+        """
+        Run the phase's non-linear search. The pool of worker processes (and shared memory file) that the *Analysis* \
+        creates if the search computes log likelihoods in parallel (see *log_likelihood_function_batch*) is closed \
+        once the search finishes, including when it raises an exception, so it lasts only as long as the search.
+        """
+        try:
+            return super().run_analysis(
+                analysis=analysis, info=info, pickle_files=pickle_files
+            )
+        finally:
+            analysis.close_batch_pool()
+
     def modify_dataset(self, dataset, results):
 
         # TODO : There is a very weird error no cosma for this line we don't yet undersatand. This try / except fixes it.
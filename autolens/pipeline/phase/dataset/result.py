@@ -1,4 +1,11 @@
+from autoconf import conf
+import autoarray as aa
+import numpy as np
+import hashlib
+import os
+from autogalaxy.galaxy import galaxy as g
 from autogalaxy.pipeline.phase.dataset import result as ag_result
+from autolens import decorator_util
 from autolens.pipeline.phase.abstract import result
 
 
@@ -22,3 +29,148 @@ class Result(result.Result, ag_result.Result):
         return self.max_log_likelihood_tracer.sparse_image_plane_grids_of_planes_from_grid(
             grid=self.max_log_likelihood_fit.grid
         )
+
+    @property
+    def galaxy_image_mask(self) -> aa.Mask:
+        """
+        The mask of the model images of the galaxies, which is used to rebuild them when they are loaded from the \
+        phase's output directory.
+        """
+        return self.analysis.masked_dataset.mask.mask_sub_1
+
+    @decorator_util.cached_property
+    def galaxy_images_path(self) -> str:
+        """
+        The directory in the phase's output directory that the model images of the galaxies of the maximum log \
+        likelihood fit are persisted to, such that a later phase or a resumed pipeline loads them instead of \
+        refitting the dataset.
+
+        The directory is named after a hash of the maximum log likelihood parameters, the mask of the galaxy images \
+        and the name and data of the dataset, so images of a different model, mask or dataset are never loaded. If \
+        the result has no search or its samples have no parameters (e.g. a result which is not from a non-linear \
+        search) the images are not persisted.
+        """
+        if self.search is None or self.samples is None:
+            return None
+
+        if len(self.samples.parameters) == 0:
+            return None
+
+        vector = np.asarray(self.samples.max_log_likelihood_vector, dtype="float")
+
+        mask = self.galaxy_image_mask
+        masked_dataset = self.analysis.masked_dataset
+
+        galaxy_images_hash = hashlib.sha1(vector.tobytes())
+        galaxy_images_hash.update(np.ascontiguousarray(mask).tobytes())
+        galaxy_images_hash.update(np.ascontiguousarray(masked_dataset.data).tobytes())
+        galaxy_images_hash.update(
+            repr(
+                (mask.shape, mask.pixel_scales, mask.origin, masked_dataset.name)
+            ).encode()
+        )
+
+        return "{}/galaxy_images/{}".format(
+            self.search.paths.output_path, galaxy_images_hash.hexdigest()
+        )
+
+    def image_for_galaxy(self, galaxy: g.Galaxy) -> np.ndarray:
+        """
+        Parameters
+        ----------
+        galaxy
+            A galaxy used in this phase
+
+        Returns
+        -------
+        ndarray or None
+            A numpy arrays giving the model image of that galaxy
+        """
+        return self.max_log_likelihood_fit.galaxy_model_image_dict[galaxy]
+
+    @decorator_util.cached_property
+    def image_galaxy_dict(self) -> {str: g.Galaxy}:
+        """
+        A dictionary associating galaxy names with model images of those galaxies.
+
+        The images are computed once per result, loaded from the phase's output directory if a previous run \
+        persisted them there and written to it otherwise.
+        """
+        image_galaxy_dict = self.image_galaxy_dict_from_galaxy_images_path()
+
+        if image_galaxy_dict is None:
+
+            image_galaxy_dict = {
+                galaxy_path: self.image_for_galaxy(galaxy)
+                for galaxy_path, galaxy in self.path_galaxy_tuples
+            }
+
+            self.output_image_galaxy_dict(image_galaxy_dict=image_galaxy_dict)
+
+        return image_galaxy_dict
+
+    def galaxy_image_file_path_from(self, galaxy_path) -> str:
+        return "{}/{}.npy".format(self.galaxy_images_path, ".".join(galaxy_path))
+
+    def image_galaxy_dict_from_galaxy_images_path(self):
+        """
+        Load the model images of the galaxies from the phase's output directory, returning None if any of them has \
+        not been persisted there.
+        """
+        if self.galaxy_images_path is None:
+            return None
+
+        file_paths = {
+            galaxy_path: self.galaxy_image_file_path_from(galaxy_path=galaxy_path)
+            for galaxy_path, galaxy in self.path_galaxy_tuples
+        }
+
+        if not all(os.path.isfile(file_path) for file_path in file_paths.values()):
+            return None
+
+        mask = self.galaxy_image_mask
+
+        return {
+            galaxy_path: aa.Array.manual_mask(array=np.load(file_path), mask=mask)
+            for galaxy_path, file_path in file_paths.items()
+        }
+
+    def output_image_galaxy_dict(self, image_galaxy_dict):
+        """
+        Write the model images of the galaxies to the phase's output directory as .npy files, one per galaxy.
+        """
+        if self.galaxy_images_path is None:
+            return
+
+        os.makedirs(self.galaxy_images_path, exist_ok=True)
+
+        for galaxy_path, galaxy_image in image_galaxy_dict.items():
+
+            file_path = self.galaxy_image_file_path_from(galaxy_path=galaxy_path)
+
+            np.save("{}.tmp.npy".format(file_path), np.asarray(galaxy_image))
+            os.replace("{}.tmp.npy".format(file_path), file_path)
+
+    @decorator_util.cached_property
+    def hyper_galaxy_image_path_dict(self):
+        """
+        A dictionary associating 1D hyper_galaxies galaxy images with their names.
+        """
+
+        hyper_minimum_percent = conf.instance.general.get(
+            "hyper", "hyper_minimum_percent", float
+        )
+
+        hyper_galaxy_image_path_dict = {}
+
+        for path, galaxy in self.path_galaxy_tuples:
+
+            galaxy_image = self.image_galaxy_dict[path].copy()
+
+            if not np.all(galaxy_image == 0):
+                minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
+                galaxy_image[galaxy_image < minimum_galaxy_value] = minimum_galaxy_value
+
+            hyper_galaxy_image_path_dict[path] = galaxy_image
+
+        return hyper_galaxy_image_path_dict
@@ -19,6 +19,7 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         image_path=None,
         results=None,
         log_likelihood_cap=None,
+        model=None,
     ):
 
         super().__init__(
@@ -39,10 +40,25 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
         self.masked_dataset = masked_imaging
 
+        self.mass_model_is_fixed = analysis_dataset.mass_model_is_fixed_from(
+            model=model
+        )
+
+        self.fit_imaging_workspace = self.fit_imaging_workspace_from_masked_imaging(
+            masked_imaging=masked_imaging
+        )
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
 
+    def fit_imaging_workspace_from_masked_imaging(self, masked_imaging):
+        return fit.FitImagingWorkspace(
+            masked_imaging=masked_imaging,
+            settings_pixelization=self.settings.settings_pixelization,
+            settings_inversion=self.settings.settings_inversion,
+        )
+
     def log_likelihood_function(self, instance):
         """
         Determine the fit of a lens galaxy and source galaxy to the masked_imaging in this lens.
@@ -58,13 +74,16 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             A fractional value indicating how well this model fit and the model masked_imaging itself
         """
 
-        self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
         self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
             tracer=tracer, positions=self.masked_dataset.positions
         )
 
+        self.share_traced_grids_cache_with_tracer(tracer=tracer)
+
+        self.associate_hyper_images(instance=instance)
+
         hyper_image_sky = self.hyper_image_sky_for_instance(instance=instance)
 
         hyper_background_noise = self.hyper_background_noise_for_instance(
@@ -72,13 +91,11 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         )
 
         try:
-            fit = self.masked_imaging_fit_for_tracer(
+            return self.fit_imaging_workspace.figure_of_merit_from_tracer(
                 tracer=tracer,
                 hyper_image_sky=hyper_image_sky,
                 hyper_background_noise=hyper_background_noise,
             )
-
-            return fit.figure_of_merit
         except (InversionException or GridException or OverflowError) as e:
             raise FitException from e
 
@@ -86,13 +103,10 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         self, tracer, hyper_image_sky, hyper_background_noise
     ):
 
-        return fit.FitImaging(
-            masked_imaging=self.masked_dataset,
+        return self.fit_imaging_workspace.fit_from_tracer(
             tracer=tracer,
             hyper_image_sky=hyper_image_sky,
             hyper_background_noise=hyper_background_noise,
-            settings_pixelization=self.settings.settings_pixelization,
-            settings_inversion=self.settings.settings_inversion,
         )
 
     def stochastic_log_evidences_for_instance(
@@ -192,3 +206,16 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
                 max_log_evidence=fit.log_evidence,
                 during_analysis=during_analysis,
             )
+
+    def __getstate__(self):
+        """The workspace's buffers are overwritten by every fit, so they are not pickled with the *Analysis* (where \
+        they could become read-only views of a *SharedDataset*) and are allocated again when it is unpickled."""
+        state = super().__getstate__()
+        state.pop("fit_imaging_workspace", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self.fit_imaging_workspace = self.fit_imaging_workspace_from_masked_imaging(
+            masked_imaging=self.masked_dataset
+        )
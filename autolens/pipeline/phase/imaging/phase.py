@@ -100,6 +100,7 @@ class PhaseImaging(dataset.PhaseDataset):
             image_path=self.search.paths.image_path,
             results=results,
             log_likelihood_cap=self.settings.log_likelihood_cap,
+            model=self.model,
         )
 
         return analysis
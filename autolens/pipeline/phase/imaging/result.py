@@ -1,12 +1,11 @@
-from autoconf import conf
 import autoarray as aa
 import numpy as np
-from autogalaxy.galaxy import galaxy as g
+from autolens import decorator_util
 from autolens.pipeline.phase import dataset
 
 
 class Result(dataset.Result):
-    @property
+    @decorator_util.cached_property
     def max_log_likelihood_fit(self):
 
         hyper_image_sky = self.analysis.hyper_image_sky_for_instance(
@@ -36,60 +35,12 @@ class Result(dataset.Result):
         fit = self.max_log_likelihood_fit
         return fit.unmasked_blurred_image_of_planes_and_galaxies
 
-    def image_for_galaxy(self, galaxy: g.Galaxy) -> np.ndarray:
-        """
-        Parameters
-        ----------
-        galaxy
-            A galaxy used in this phase
-
-        Returns
-        -------
-        ndarray or None
-            A numpy arrays giving the model image of that galaxy
-        """
-        return self.max_log_likelihood_fit.galaxy_model_image_dict[galaxy]
-
-    @property
-    def image_galaxy_dict(self) -> {str: g.Galaxy}:
-        """
-        A dictionary associating galaxy names with model images of those galaxies
-        """
-        return {
-            galaxy_path: self.image_for_galaxy(galaxy)
-            for galaxy_path, galaxy in self.path_galaxy_tuples
-        }
-
-    @property
-    def hyper_galaxy_image_path_dict(self):
-        """
-        A dictionary associating 1D hyper_galaxies galaxy images with their names.
-        """
-
-        hyper_minimum_percent = conf.instance.general.get(
-            "hyper", "hyper_minimum_percent", float
-        )
-
-        hyper_galaxy_image_path_dict = {}
-
-        for path, galaxy in self.path_galaxy_tuples:
-
-            galaxy_image = self.image_galaxy_dict[path]
-
-            if not np.all(galaxy_image == 0):
-                minimum_galaxy_value = hyper_minimum_percent * max(galaxy_image)
-                galaxy_image[galaxy_image < minimum_galaxy_value] = minimum_galaxy_value
-
-            hyper_galaxy_image_path_dict[path] = galaxy_image
-
-        return hyper_galaxy_image_path_dict
-
-    @property
+    @decorator_util.cached_property
     def hyper_model_image(self):
 
         hyper_model_image = aa.Array.manual_mask(
-            array=np.zeros(self.mask.mask_sub_1.pixels_in_mask),
-            mask=self.mask.mask_sub_1,
+            array=np.zeros(self.galaxy_image_mask.pixels_in_mask),
+            mask=self.galaxy_image_mask,
         )
 
         for path, galaxy in self.path_galaxy_tuples:
@@ -17,6 +17,7 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         image_path=None,
         results=None,
         log_likelihood_cap=None,
+        model=None,
     ):
 
         super(Analysis, self).__init__(
@@ -37,6 +38,16 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
         self.masked_dataset = masked_interferometer
 
+        self.mass_model_is_fixed = analysis_dataset.mass_model_is_fixed_from(
+            model=model
+        )
+
+        self.fit_interferometer_workspace = fit.FitInterferometerWorkspace(
+            masked_interferometer=masked_interferometer,
+            settings_pixelization=self.settings.settings_pixelization,
+            settings_inversion=self.settings.settings_inversion,
+        )
+
         result = ag_analysis.last_result_with_use_as_hyper_dataset(results=results)
 
         if result is not None:
@@ -71,22 +82,24 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             A fractional value indicating how well this model fit and the model masked_interferometer itself
         """
 
-        self.associate_hyper_images(instance=instance)
         tracer = self.tracer_for_instance(instance=instance)
 
         self.settings.settings_lens.check_positions_trace_within_threshold_via_tracer(
             tracer=tracer, positions=self.masked_dataset.positions
         )
 
+        self.share_traced_grids_cache_with_tracer(tracer=tracer)
+
+        self.associate_hyper_images(instance=instance)
+
         hyper_background_noise = self.hyper_background_noise_for_instance(
             instance=instance
         )
 
         try:
-            fit = self.masked_interferometer_fit_for_tracer(
+            return self.fit_interferometer_workspace.figure_of_merit_from_tracer(
                 tracer=tracer, hyper_background_noise=hyper_background_noise
             )
-            return fit.figure_of_merit
         except InversionException as e:
             raise FitException from e
 
@@ -130,12 +143,8 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
     def masked_interferometer_fit_for_tracer(self, tracer, hyper_background_noise):
 
-        return fit.FitInterferometer(
-            masked_interferometer=self.masked_dataset,
-            tracer=tracer,
-            hyper_background_noise=hyper_background_noise,
-            settings_pixelization=self.settings.settings_pixelization,
-            settings_inversion=self.settings.settings_inversion,
+        return self.fit_interferometer_workspace.fit_from_tracer(
+            tracer=tracer, hyper_background_noise=hyper_background_noise
         )
 
     def visualize(self, instance, during_analysis):
@@ -96,6 +96,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
             image_path=self.search.paths.image_path,
             results=results,
             log_likelihood_cap=self.settings.log_likelihood_cap,
+            model=self.model,
         )
 
         return analysis
@@ -0,0 +1,36 @@
+# %%
+"""
+__Remove Duplicates Profiler__
+
+This tool profiles the removal of duplicate coordinates from the grids of candidate multiple images the
+_PositionsFinder_ refines, showing that the time taken scales linearly with the number of candidate coordinates up to
+10^5 coordinates.
+
+Each grid is made of random (y,x) coordinates, a third of which are duplicates of another coordinate.
+"""
+
+# %%
+from autolens.lens import positions_solver as pos
+import numpy as np
+import time
+
+# %%
+"""The function is compiled by numba on its first call, which is therefore not included in the profiling."""
+
+# %%
+pos.grid_remove_duplicates(grid=np.zeros((2, 2)))
+
+# %%
+for total_coordinates in [1000, 10000, 100000]:
+
+    grid = np.random.uniform(low=-3.0, high=3.0, size=(total_coordinates, 2))
+    grid[1::3] = grid[::3][: grid[1::3].shape[0]]
+
+    start = time.time()
+    grid_no_duplicates = pos.grid_remove_duplicates(grid=grid)
+    diff = time.time() - start
+
+    print(
+        f"Time to remove duplicates from {total_coordinates} coordinates = {diff} "
+        f"({len(grid_no_duplicates)} coordinates remaining)"
+    )
@@ -1,5 +1,7 @@
 import autolens as al
+from autolens.dataset import shared
 import numpy as np
+import pickle
 
 
 class TestMaskedImaging:
@@ -44,6 +46,51 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.in_1d == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__export_to_shared_memory__attached_masked_imaging_has_same_arrays_as_views_of_file(
+        self, imaging_7x7, sub_mask_7x7, tmp_path
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        shared_dataset = shared.SharedDataset.from_dataset(
+            dataset=masked_imaging_7x7, directory=str(tmp_path), minimum_bytes=1
+        )
+
+        shared_dataset = pickle.loads(pickle.dumps(shared_dataset))
+
+        attached_masked_imaging = shared_dataset.attach()
+
+        assert (attached_masked_imaging.image == masked_imaging_7x7.image).all()
+        assert (attached_masked_imaging.noise_map == masked_imaging_7x7.noise_map).all()
+        assert (attached_masked_imaging.grid == masked_imaging_7x7.grid).all()
+        assert attached_masked_imaging.grid.sub_size == 2
+        assert (
+            attached_masked_imaging.blurring_grid == masked_imaging_7x7.blurring_grid
+        ).all()
+        assert (
+            attached_masked_imaging.convolver.image_frame_1d_indexes
+            == masked_imaging_7x7.convolver.image_frame_1d_indexes
+        ).all()
+
+        assert isinstance(attached_masked_imaging.grid, al.Grid)
+        assert attached_masked_imaging.grid.flags.writeable is False
+        assert attached_masked_imaging.image.flags.writeable is False
+        assert isinstance(attached_masked_imaging.grid.base.base, np.memmap)
+
+        shared_dataset.unlink()
+
+        assert list(tmp_path.iterdir()) == []
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        shared_dataset = masked_imaging_7x7.export_to_shared_memory(
+            directory=str(tmp_path)
+        )
+
+        assert (shared_dataset.attach().image == masked_imaging_7x7.image).all()
+
+        shared_dataset.unlink()
+
 
 class TestSimulatorImaging:
     def test__from_tracer_and_grid__same_as_tracer_image(self):
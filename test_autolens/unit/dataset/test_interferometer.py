@@ -116,6 +116,183 @@ class TestMaskedInterferometer:
         assert masked_interferometer_7.noise_map[0, 0] == 10.0
 
 
+class TestVisibilitiesBinning:
+    def test__binned_visibilities_are_weighted_means_of_folded_visibilities(self):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=[[1.0, 2.0], [3.0, -4.0], [5.0, 6.0]]
+            ),
+            noise_map=al.VisibilitiesNoiseMap.manual_1d(
+                visibilities=[[1.0, 1.0], [1.0, 2.0], [1.0, 1.0]]
+            ),
+            uv_wavelengths=np.array([[1.0, 1.0], [-3.0, -3.0], [11.0, 11.0]]),
+        )
+
+        visibilities_binning = al.VisibilitiesBinning.from_interferometer(
+            interferometer=interferometer, uv_pixel_scale=10.0
+        )
+
+        binned_interferometer = visibilities_binning.binned_interferometer
+
+        assert visibilities_binning.total_visibilities == 3
+        assert visibilities_binning.total_binned_visibilities == 2
+        assert visibilities_binning.compression == pytest.approx(1.5, 1.0e-4)
+
+        assert binned_interferometer.visibilities == pytest.approx(
+            np.array([[2.0, 2.4], [5.0, 6.0]]), 1.0e-4
+        )
+        assert binned_interferometer.noise_map == pytest.approx(
+            np.array([[np.sqrt(0.5), np.sqrt(0.8)], [1.0, 1.0]]), 1.0e-4
+        )
+        assert binned_interferometer.uv_wavelengths == pytest.approx(
+            np.array([[23.0 / 13.0, 23.0 / 13.0], [11.0, 11.0]]), 1.0e-4
+        )
+
+        assert visibilities_binning.chi_squared_offset == pytest.approx(
+            1.0 + 1.0 + 0.16 + 0.64, 1.0e-4
+        )
+
+    def test__chi_squared_of_binned_dataset_plus_offset_and_bias_is_unbinned_chi_squared(
+        self, mask_7x7
+    ):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=np.random.RandomState(seed=2).normal(size=(100, 2))
+            ),
+            noise_map=al.VisibilitiesNoiseMap.manual_1d(
+                visibilities=np.random.RandomState(seed=3).uniform(
+                    1.0, 2.0, size=(100, 2)
+                )
+            ),
+            uv_wavelengths=np.random.RandomState(seed=1).normal(
+                scale=10000.0, size=(100, 2)
+            ),
+        )
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=np.full(fill_value=False, shape=(100, 2)),
+            real_space_mask=mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                sub_size=1, transformer_class=al.TransformerDFT
+            ),
+        )
+
+        visibilities_binning = al.VisibilitiesBinning.from_masked_interferometer(
+            masked_interferometer=masked_interferometer, maximum_phase_error=0.5
+        )
+
+        assert visibilities_binning.total_binned_visibilities < 100
+        assert (
+            visibilities_binning.maximum_phase_error_from_real_space_mask(
+                real_space_mask=mask_7x7
+            )
+            < 0.5
+        )
+
+        binned_masked_interferometer = visibilities_binning.masked_interferometer_from(
+            masked_interferometer=masked_interferometer
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=0.1)
+                )
+            ]
+        )
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer, tracer=tracer
+        )
+        binned_fit = al.FitInterferometer(
+            masked_interferometer=binned_masked_interferometer, tracer=tracer
+        )
+
+        chi_squared_bias = visibilities_binning.chi_squared_bias_from_image(
+            image=tracer.image_from_grid(grid=masked_interferometer.grid)
+        )
+
+        assert fit.chi_squared == pytest.approx(
+            binned_fit.chi_squared
+            + visibilities_binning.chi_squared_offset
+            + chi_squared_bias,
+            1.0e-8,
+        )
+
+
+class TestInterferometerChunks:
+    def test__chunks__cover_every_visibility(self, interferometer_7):
+
+        interferometer_chunks = al.InterferometerChunks.from_interferometer(
+            interferometer=interferometer_7, chunk_size=3
+        )
+
+        assert interferometer_chunks.total_visibilities == 7
+        assert interferometer_chunks.chunks == [
+            slice(0, 3),
+            slice(3, 6),
+            slice(6, 7),
+        ]
+
+    def test__output_to_and_load_from_npy__arrays_are_memory_mapped(
+        self, interferometer_7, tmp_path
+    ):
+
+        interferometer_chunks = al.InterferometerChunks.from_interferometer(
+            interferometer=interferometer_7, chunk_size=3
+        )
+
+        paths = dict(
+            visibilities_path=str(tmp_path / "visibilities.npy"),
+            noise_map_path=str(tmp_path / "noise_map.npy"),
+            uv_wavelengths_path=str(tmp_path / "uv_wavelengths.npy"),
+        )
+
+        interferometer_chunks.output_to_npy(**paths)
+
+        interferometer_chunks = al.InterferometerChunks.from_npy(chunk_size=3, **paths)
+
+        assert isinstance(interferometer_chunks.visibilities, np.memmap)
+        assert (
+            interferometer_chunks.visibilities == interferometer_7.visibilities
+        ).all()
+        assert (interferometer_chunks.noise_map == interferometer_7.noise_map).all()
+        assert (
+            interferometer_chunks.uv_wavelengths == interferometer_7.uv_wavelengths
+        ).all()
+
+    def test__masked__transforms_of_chunk_same_as_transformer_dft(
+        self, interferometer_7, sub_mask_7x7
+    ):
+
+        masked_interferometer_chunks = al.MaskedInterferometerChunks(
+            interferometer_chunks=al.InterferometerChunks.from_interferometer(
+                interferometer=interferometer_7, chunk_size=3
+            ),
+            real_space_mask=sub_mask_7x7,
+        )
+
+        transformer = al.TransformerDFT(
+            uv_wavelengths=interferometer_7.uv_wavelengths,
+            real_space_mask=sub_mask_7x7,
+        )
+
+        (
+            real_transforms,
+            imag_transforms,
+        ) = masked_interferometer_chunks.transforms_from_chunk(chunk=slice(3, 6))
+
+        assert real_transforms == pytest.approx(
+            transformer.preload_real_transforms[:, 3:6], 1.0e-8
+        )
+        assert imag_transforms == pytest.approx(
+            transformer.preload_imag_transforms[:, 3:6], 1.0e-8
+        )
+
+
 class TestSimulatorInterferometer:
     def test__from_tracer__same_as_tracer_input(self):
 
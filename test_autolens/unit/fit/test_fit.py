@@ -2,6 +2,7 @@ import autolens as al
 import numpy as np
 import pytest
 from autoarray.inversion import inversions
+from autolens import exc
 from test_autogalaxy.mock import MockLightProfile
 
 
@@ -1537,6 +1538,404 @@ class TestFitImaging:
             )
 
 
+class TestFitImagingWorkspace:
+    def test__figure_of_merit__profiles_only__same_as_fit_imaging(
+        self, masked_imaging_7x7
+    ):
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+        g1 = al.Galaxy(
+            redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        workspace = al.FitImagingWorkspace(masked_imaging=masked_imaging_7x7)
+
+        fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+        assert workspace.figure_of_merit_from_tracer(tracer=tracer) == pytest.approx(
+            fit.figure_of_merit, 1.0e-8
+        )
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=al.Array.ones(shape_2d=(3, 3)),
+            hyper_galaxy_image=al.Array.ones(shape_2d=(3, 3)),
+            hyper_minimum_value=0.0,
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        fit = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert workspace.figure_of_merit_from_tracer(
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        ) == pytest.approx(fit.figure_of_merit, 1.0e-8)
+        assert workspace.noise_map.in_2d == pytest.approx(fit.noise_map.in_2d, 1.0e-8)
+
+        fit = workspace.fit_from_tracer(
+            tracer=tracer,
+            hyper_image_sky=hyper_image_sky,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert isinstance(fit, al.FitImaging)
+        assert (fit.masked_imaging.image == masked_imaging_7x7.image + 1.0).all()
+
+    def test__figure_of_merit__inversion__same_as_fit_imaging(self, masked_imaging_7x7):
+
+        hyper_image_sky = al.hyper_data.HyperImageSky(sky_scale=1.0)
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        galaxy_light = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            hyper_galaxy=al.HyperGalaxy(
+                contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+            ),
+            hyper_model_image=al.Array.ones(shape_2d=(3, 3)),
+            hyper_galaxy_image=al.Array.ones(shape_2d=(3, 3)),
+            hyper_minimum_value=0.0,
+        )
+
+        galaxy_pix = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(3, 3)),
+            regularization=al.reg.Constant(coefficient=1.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_pix])
+
+        workspace = al.FitImagingWorkspace(masked_imaging=masked_imaging_7x7)
+
+        for i in range(2):
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            assert workspace.figure_of_merit_from_tracer(
+                tracer=tracer
+            ) == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+            fit = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            )
+
+            assert workspace.figure_of_merit_from_tracer(
+                tracer=tracer,
+                hyper_image_sky=hyper_image_sky,
+                hyper_background_noise=hyper_background_noise,
+            ) == pytest.approx(fit.figure_of_merit, 1.0e-8)
+            assert workspace.model_image.in_2d == pytest.approx(
+                fit.model_image.in_2d, 1.0e-8
+            )
+
+
+class TestFitInterferometerWorkspace:
+    def test__figure_of_merit__parametric__same_as_fit_interferometer(
+        self, mask_7x7, visibilities_mask_7x2
+    ):
+
+        uv_wavelengths = np.random.RandomState(seed=1).uniform(
+            -10000.0, 10000.0, size=(25, 2)
+        )
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=np.random.RandomState(seed=2).normal(size=(25, 2))
+            ),
+            noise_map=al.Visibilities.manual_1d(
+                visibilities=np.random.RandomState(seed=3).uniform(
+                    1.0, 2.0, size=(25, 2)
+                )
+            ),
+            uv_wavelengths=uv_wavelengths,
+        )
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=np.full(fill_value=False, shape=(25, 2)),
+            real_space_mask=mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                sub_size=2, transformer_class=al.TransformerDFT
+            ),
+        )
+
+        workspace = al.FitInterferometerWorkspace(
+            masked_interferometer=masked_interferometer, visibilities_chunk_size=10
+        )
+
+        assert workspace.use_image_space_chi_squared is True
+        assert workspace._curvature_matrix is None
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5),
+                al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(coefficient=1.0),
+                ),
+            ]
+        )
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer, tracer=tracer
+        )
+
+        assert workspace.figure_of_merit_from_tracer(tracer=tracer) == pytest.approx(
+            fit.figure_of_merit, 1.0e-8
+        )
+        assert workspace._curvature_matrix is None
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+        g1 = al.Galaxy(
+            redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer, tracer=tracer
+        )
+
+        assert workspace.figure_of_merit_from_tracer(tracer=tracer) == pytest.approx(
+            fit.figure_of_merit, 1.0e-8
+        )
+        assert workspace._curvature_matrix is not None
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer, tracer=tracer
+        )
+
+        assert workspace.figure_of_merit_from_tracer(tracer=tracer) == pytest.approx(
+            fit.figure_of_merit, 1.0e-8
+        )
+
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        assert workspace.figure_of_merit_from_tracer(
+            tracer=tracer, hyper_background_noise=hyper_background_noise
+        ) == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=np.full(fill_value=False, shape=(25, 2)),
+            real_space_mask=mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                sub_size=2, transformer_class=al.TransformerNUFFT
+            ),
+        )
+
+        workspace = al.FitInterferometerWorkspace(
+            masked_interferometer=masked_interferometer
+        )
+
+        assert workspace.use_image_space_chi_squared is False
+        assert workspace._curvature_matrix is None
+
+    def test__more_image_pixels_than_visibilities__fits_via_fit_interferometer(
+        self, masked_interferometer_7
+    ):
+
+        workspace = al.FitInterferometerWorkspace(
+            masked_interferometer=masked_interferometer_7
+        )
+
+        assert workspace.use_image_space_chi_squared is False
+
+        g0 = al.Galaxy(
+            redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0])
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer_7, tracer=tracer
+        )
+
+        assert workspace.figure_of_merit_from_tracer(tracer=tracer) == pytest.approx(
+            fit.figure_of_merit, 1.0e-8
+        )
+        assert workspace._curvature_matrix is None
+
+
+class TestFitInterferometerChunks:
+    def test__figure_of_merit__same_as_fit_interferometer(self, mask_7x7):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=np.random.RandomState(seed=2).normal(size=(25, 2))
+            ),
+            noise_map=al.Visibilities.manual_1d(
+                visibilities=np.random.RandomState(seed=3).uniform(
+                    1.0, 2.0, size=(25, 2)
+                )
+            ),
+            uv_wavelengths=np.random.RandomState(seed=1).uniform(
+                -10000.0, 10000.0, size=(25, 2)
+            ),
+        )
+
+        settings = al.SettingsMaskedInterferometer(
+            sub_size=2, transformer_class=al.TransformerDFT
+        )
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=np.full(fill_value=False, shape=(25, 2)),
+            real_space_mask=mask_7x7,
+            settings=settings,
+        )
+
+        masked_interferometer_chunks = al.MaskedInterferometerChunks(
+            interferometer_chunks=al.InterferometerChunks.from_interferometer(
+                interferometer=interferometer, chunk_size=10
+            ),
+            real_space_mask=mask_7x7,
+            settings=settings,
+        )
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            light_profile=al.lp.EllipticalSersic(intensity=1.0),
+            mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+        g1 = al.Galaxy(
+            redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer, tracer=tracer
+        )
+
+        fit_chunks = al.FitInterferometerChunks(
+            masked_interferometer_chunks=masked_interferometer_chunks, tracer=tracer
+        )
+
+        assert fit_chunks.chi_squared == pytest.approx(fit.chi_squared, 1.0e-8)
+        assert fit_chunks.noise_normalization == pytest.approx(
+            fit.noise_normalization, 1.0e-8
+        )
+        assert fit_chunks.figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        pix = al.pix.Rectangular(shape=(3, 3))
+        reg = al.reg.Constant(coefficient=1.0)
+
+        g1 = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        hyper_background_noise = al.hyper_data.HyperBackgroundNoise(noise_scale=1.0)
+
+        fit = al.FitInterferometer(
+            masked_interferometer=masked_interferometer,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+        )
+
+        fit_chunks = al.FitInterferometerChunks(
+            masked_interferometer_chunks=masked_interferometer_chunks,
+            tracer=tracer,
+            hyper_background_noise=hyper_background_noise,
+            number_of_threads=2,
+        )
+
+        assert fit_chunks.inversion.reconstruction == pytest.approx(
+            fit.inversion.reconstruction, 1.0e-6
+        )
+        assert fit_chunks.chi_squared == pytest.approx(fit.chi_squared, 1.0e-6)
+        assert fit_chunks.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+        assert fit_chunks.figure_of_merit == pytest.approx(fit.figure_of_merit, 1.0e-8)
+
+        g0_pix = al.Galaxy(redshift=0.5, pixelization=pix, regularization=reg)
+        g1_light = al.Galaxy(
+            redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0_pix, g1_light])
+
+        fit_chunks = al.FitInterferometerChunks(
+            masked_interferometer_chunks=masked_interferometer_chunks, tracer=tracer
+        )
+
+        assert fit_chunks.inversion.mapper.pixels == 9
+        assert fit_chunks.inversion.regularization is reg
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0_pix, g1])
+
+        with pytest.raises(exc.TracerException):
+            al.FitInterferometerChunks(
+                masked_interferometer_chunks=masked_interferometer_chunks, tracer=tracer
+            )
+
+
+class TestChiSquaredAndNoiseNormalization:
+    def test__same_as_fit_util(self):
+
+        image = np.array([1.0, 2.0, 3.0, -4.0])
+        model_image = np.array([1.5, 1.0, 3.0, 2.0])
+        noise_map = np.array([0.5, 2.0, 1.0, 3.0])
+
+        residual_map = al.util.fit.residual_map_from(data=image, model_data=model_image)
+        chi_squared_map = al.util.fit.chi_squared_map_from(
+            residual_map=residual_map, noise_map=noise_map
+        )
+        chi_squared = al.util.fit.chi_squared_from(chi_squared_map=chi_squared_map)
+        noise_normalization = al.util.fit.noise_normalization_from(noise_map=noise_map)
+
+        assert al.fit.fit.chi_squared_from(
+            image=image, model_image=model_image, noise_map=noise_map
+        ) == pytest.approx(chi_squared, 1.0e-12)
+
+        (
+            chi_squared_fused,
+            noise_normalization_fused,
+        ) = al.fit.fit.chi_squared_and_noise_normalization_from(
+            image=image, model_image=model_image, noise_map=noise_map
+        )
+
+        assert chi_squared_fused == pytest.approx(chi_squared, 1.0e-12)
+        assert noise_normalization_fused == pytest.approx(noise_normalization, 1.0e-12)
+
+
 class TestFitInterferometer:
     class TestFitProperties:
         def test__total_inversions(self, masked_interferometer_7):
@@ -1964,6 +2363,10 @@ class TestFitInterferometer:
                 1.0e-4,
             )
 
+            assert (
+                fit.galaxy_model_visibilities_dict is fit.galaxy_model_visibilities_dict
+            )
+
         def test___all_lens_fit_quantities__hyper_background_noise(
             self, masked_interferometer_7
         ):
@@ -2607,6 +3010,39 @@ class TestFitInterferometer:
                 1.0e-4,
             )
 
+        def test___model_visibilities_of_planes__has_profile_visibilities_and_inversion_mapped_reconstructed_visibilities(
+            self, masked_interferometer_7_grid
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            pix = al.pix.Rectangular(shape=(3, 3))
+            reg = al.reg.Constant(coefficient=1.0)
+            galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, galaxy_pix])
+
+            fit = al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7_grid, tracer=tracer
+            )
+
+            model_visibilities_of_planes = fit.model_visibilities_of_planes()
+
+            assert model_visibilities_of_planes[0] == pytest.approx(
+                fit.profile_visibilities, 1.0e-4
+            )
+            assert model_visibilities_of_planes[1] == pytest.approx(
+                fit.inversion.mapped_reconstructed_visibilities, 1.0e-4
+            )
+            assert fit.model_visibilities == pytest.approx(
+                model_visibilities_of_planes[0] + model_visibilities_of_planes[1],
+                1.0e-4,
+            )
+
+            assert fit.model_visibilities_of_planes() is model_visibilities_of_planes
+
         def test___all_lens_fit_quantities__hyper_background_noise(
             self, masked_interferometer_7
         ):
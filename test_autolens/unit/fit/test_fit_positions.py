@@ -1,4 +1,5 @@
 import autolens as al
+from autolens.fit import fit_positions
 import numpy as np
 import pytest
 
@@ -153,6 +154,48 @@ class TestAbstractFitPositionsSourcePlane:
         assert not fit.maximum_separation_within_threshold(threshold=0.15)
 
 
+class TestGridWithinThreshold:
+    def test__groups_of_coordinates__false_if_any_group_exceeds_threshold(self):
+
+        grid = np.array(
+            [[0.0, 0.0], [0.0, 1.0], [0.0, 0.5], [0.0, 0.0], [0.0, 0.0], [3.0, 3.0]]
+        )
+
+        within_threshold = fit_positions.grid_within_threshold_from(
+            grid=grid, upper_indexes=np.array([3, 6]), threshold=1.1
+        )
+
+        assert within_threshold is False
+
+        within_threshold = fit_positions.grid_within_threshold_from(
+            grid=grid, upper_indexes=np.array([3]), threshold=1.1
+        )
+
+        assert within_threshold is True
+
+        within_threshold = fit_positions.grid_within_threshold_from(
+            grid=grid, upper_indexes=np.array([3, 6]), threshold=np.sqrt(18) + 1.0e-4
+        )
+
+        assert within_threshold is True
+
+    def test__nan_coordinates__false(self):
+
+        grid = np.array([[0.0, 0.0], [np.nan, 0.0], [0.0, 0.5]])
+
+        within_threshold = fit_positions.grid_within_threshold_from(
+            grid=grid, upper_indexes=np.array([3]), threshold=1.1
+        )
+
+        assert within_threshold is False
+
+    def test__max_separation_of_grid(self):
+
+        grid = np.array([[0.0, 0.0], [1.0, 1.0], [3.0, 3.0]])
+
+        assert fit_positions.max_separation_of_grid_from(grid=grid) == np.sqrt(18)
+
+
 class TestFitPositionsSourcePlane:
     def test__likelihood__is_sum_of_separations_divided_by_noise(self):
         positions = al.GridCoordinates(
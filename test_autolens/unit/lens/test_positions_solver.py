@@ -2,9 +2,15 @@ import autolens as al
 from autolens.lens import positions_solver as pos
 
 import numpy as np
+import os
+import shutil
 
 import pytest
 
+test_path = "{}/files/positions_solver".format(
+    os.path.dirname(os.path.realpath(__file__))
+)
+
 
 class TestAbstractPositionsSolver:
     def test__solver_with_remove_distance_from_mass_profile_centre__remove_pixels_from_initial_grid(
@@ -201,6 +207,394 @@ class TestPositionFinder:
         assert position_manual_0.in_list[0] == positions.in_list[0]
         assert position_manual_1.in_list[0] == positions.in_list[1]
 
+    def test__refined_coordinates_from_coordinates__same_as_refining_each_coordinate(
+        self,
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.01)
+
+        coordinates = [(0.0, -0.9), (0.0, 1.1), (0.5, 0.5)]
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=coordinates,
+            pixel_scale=0.05,
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        refined_coordinates_manual = []
+
+        for coordinate in coordinates:
+
+            refined_coordinates_of_coordinate = solver.refined_coordinates_from_coordinate(
+                coordinate=coordinate,
+                pixel_scale=0.05,
+                lensing_obj=sis,
+                source_plane_coordinate=(0.0, 0.11),
+            )
+
+            if refined_coordinates_of_coordinate is not None:
+                refined_coordinates_manual += refined_coordinates_of_coordinate
+
+        assert len(refined_coordinates) > 0
+        assert refined_coordinates == refined_coordinates_manual
+
+        refined_coordinates = solver.refined_coordinates_from_coordinates(
+            coordinates=[],
+            pixel_scale=0.05,
+            lensing_obj=sis,
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert refined_coordinates == []
+
+    def test__solve_for_source_plane_coordinates__same_as_solving_each_coordinate(
+        self,
+    ):
+
+        grid = al.Grid.uniform(shape_2d=(50, 50), pixel_scales=0.05)
+
+        sie = al.mp.EllipticalIsothermal(
+            centre=(0.0, 0.0), einstein_radius=1.0, elliptical_comps=(0.0, 0.055555)
+        )
+
+        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.01)
+
+        positions = solver.solve_for_source_plane_coordinates(
+            lensing_obj=sie, source_plane_coordinates=[(0.0, 0.0), (0.1, 0.1)]
+        )
+
+        position_manual_0 = solver.solve(
+            lensing_obj=sie, source_plane_coordinate=(0.0, 0.0)
+        )
+
+        position_manual_1 = solver.solve(
+            lensing_obj=sie, source_plane_coordinate=(0.1, 0.1)
+        )
+
+        assert len(positions) == 2
+        assert positions[0].in_list == position_manual_0.in_list
+        assert positions[1].in_list == position_manual_1.in_list
+
+
+class MockCubicLens:
+    def deflections_from_grid(self, grid):
+        # The source-plane coordinates are (y^3, x^3), so Newton-Raphson converges linearly to the image at (0.0, 0.0)
+        # and stops on either side of it once its steps are below the precision.
+        return np.asarray(grid) - np.power(np.asarray(grid), 3)
+
+
+class TestPositionsSolverNewton:
+    def test__positions_found_for_simple_mass_profiles__to_high_precision(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolverNewton(grid=grid, precision=1.0e-8)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert np.array(sorted(positions.in_list[0])) == pytest.approx(
+            np.array([[0.0, -0.89], [0.0, 1.11]]), abs=1.0e-6
+        )
+
+    def test__same_images_as_positions_finder_for_tracer(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0, light=al.lp.EllipticalLightProfile(centre=(0.0, 0.0))
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        solver = pos.PositionsSolverNewton(grid=grid)
+
+        coordinates = solver.solve_from_tracer(tracer=tracer)
+
+        assert len(coordinates.in_list[0]) == 4
+
+        for coordinate in [
+            (1.028125, -0.003125),
+            (0.009375, -0.95312),
+            (0.009375, 0.95312),
+            (-1.028125, -0.003125),
+        ]:
+
+            distances = np.sqrt(
+                np.sum(np.square(np.asarray(coordinates) - coordinate), axis=1)
+            )
+
+            assert np.min(distances) < 0.01
+
+        source_plane_grid = tracer.traced_grids_of_planes_from_grid(grid=coordinates)[
+            -1
+        ]
+
+        assert np.asarray(source_plane_grid) == pytest.approx(
+            np.zeros((4, 2)), abs=1.0e-6
+        )
+
+    def test__slowly_converging_solutions_of_same_image__removed_as_duplicates(self):
+
+        grid = al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.1)
+
+        solver = pos.PositionsSolverNewton(grid=grid, precision=1.0e-4)
+
+        assert solver.duplicate_tolerance == pytest.approx(0.05, 1.0e-4)
+
+        positions = solver.solve_from_coordinates(
+            lensing_obj=MockCubicLens(),
+            source_plane_coordinate=(0.0, 0.0),
+            coordinates_list=np.array([[0.1, 0.1], [-0.1, -0.1], [0.1, -0.1]]),
+        )
+
+        assert np.asarray(positions) == pytest.approx(np.zeros((1, 2)), abs=1.0e-3)
+
+
+class TestPositionsSolverTriangles:
+    def test__positions_found_for_simple_mass_profiles__to_high_precision(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolverTriangles(
+            grid=grid,
+            pixel_scale_precision=1.0e-6,
+            distance_from_mass_profile_centre=0.01,
+        )
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        assert np.array(sorted(positions.in_list[0])) == pytest.approx(
+            np.array([[0.0, -0.89], [0.0, 1.11]]), abs=1.0e-6
+        )
+
+    def test__central_image_of_singular_mass_profile_found_unless_removed(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05)
+
+        sis = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0)
+
+        solver = al.PositionsSolverTriangles(grid=grid, pixel_scale_precision=1.0e-6)
+
+        positions = solver.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.11))
+
+        distances = np.sqrt(np.sum(np.square(np.asarray(positions)), axis=1))
+
+        assert len(positions.in_list[0]) == 3
+        assert np.sort(distances) == pytest.approx(
+            np.array([0.0, 0.89, 1.11]), abs=1.0e-5
+        )
+
+    def test__same_images_as_newton_solver_for_tracer(self):
+
+        grid = al.Grid.uniform(shape_2d=(100, 100), pixel_scales=0.05, sub_size=1)
+
+        g0 = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.001, 0.001),
+                einstein_radius=1.0,
+                elliptical_comps=(0.0, 0.111111),
+            ),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.03, 0.02)),
+        )
+
+        g1 = al.Galaxy(
+            redshift=1.0, light=al.lp.EllipticalLightProfile(centre=(0.05, 0.02))
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+        solver = pos.PositionsSolverTriangles(
+            grid=grid,
+            pixel_scale_precision=1.0e-6,
+            distance_from_mass_profile_centre=0.01,
+        )
+
+        coordinates = solver.solve_from_tracer(tracer=tracer)
+
+        coordinates_newton = pos.PositionsSolverNewton(grid=grid).solve_from_tracer(
+            tracer=tracer
+        )
+
+        assert len(coordinates.in_list[0]) == 4
+        assert np.array(sorted(coordinates.in_list[0])) == pytest.approx(
+            np.array(sorted(coordinates_newton.in_list[0])), abs=1.0e-6
+        )
+
+
+class MockSolver:
+    def __init__(self, solver):
+
+        self.solver = solver
+        self.source_plane_coordinates = []
+
+    def solve_for_source_plane_coordinates(self, lensing_obj, source_plane_coordinates):
+
+        self.source_plane_coordinates += list(source_plane_coordinates)
+
+        return self.solver.solve_for_source_plane_coordinates(
+            lensing_obj=lensing_obj, source_plane_coordinates=source_plane_coordinates
+        )
+
+
+class TestPositionsSolverCache:
+    def test__cached_solutions_not_solved_again__same_as_solver(self):
+
+        pos._solutions_cache.clear()
+
+        grid = al.Grid.uniform(shape_2d=(50, 50), pixel_scales=0.05)
+
+        solver = pos.PositionsFinder(grid=grid, pixel_scale_precision=0.01)
+
+        mock_solver = MockSolver(solver=solver)
+
+        cache = pos.PositionsSolverCache(solver=mock_solver)
+
+        positions = cache.solve(
+            lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert mock_solver.source_plane_coordinates == [(0.0, 0.11)]
+        assert (
+            positions.in_list
+            == solver.solve(
+                lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                source_plane_coordinate=(0.0, 0.11),
+            ).in_list
+        )
+
+        positions = cache.solve_for_source_plane_coordinates(
+            lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            source_plane_coordinates=[(0.0, 0.11), (0.0, 0.2)],
+        )
+
+        assert mock_solver.source_plane_coordinates == [(0.0, 0.11), (0.0, 0.2)]
+        assert (
+            positions[1].in_list
+            == solver.solve(
+                lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                source_plane_coordinate=(0.0, 0.2),
+            ).in_list
+        )
+
+        cache.solve(
+            lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.1),
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert len(mock_solver.source_plane_coordinates) == 3
+
+    def test__in_memory_cache_size__least_recently_used_solutions_removed(
+        self, monkeypatch
+    ):
+
+        pos._solutions_cache.clear()
+
+        monkeypatch.setattr(pos, "_solutions_cache_size", 2)
+
+        grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.1)
+
+        mock_solver = MockSolver(
+            solver=pos.PositionsFinder(grid=grid, use_upscaling=False)
+        )
+
+        cache = pos.PositionsSolverCache(solver=mock_solver)
+
+        sis = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        cache.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.1))
+        cache.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.2))
+        cache.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.1))
+        cache.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.3))
+
+        assert len(pos._solutions_cache) == 2
+        assert len(mock_solver.source_plane_coordinates) == 3
+
+        cache.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.1))
+        cache.solve(lensing_obj=sis, source_plane_coordinate=(0.0, 0.2))
+
+        assert len(mock_solver.source_plane_coordinates) == 4
+
+    def test__solutions_persisted_to_file__loaded_by_new_cache_of_same_version(
+        self, monkeypatch
+    ):
+
+        if os.path.exists(test_path):
+            shutil.rmtree(test_path)
+
+        os.makedirs(test_path)
+
+        file_path = "{}/positions_solver_cache.json".format(test_path)
+
+        pos._solutions_cache.clear()
+
+        grid = al.Grid.uniform(shape_2d=(50, 50), pixel_scales=0.05)
+
+        mock_solver = MockSolver(
+            solver=pos.PositionsFinder(grid=grid, pixel_scale_precision=0.01)
+        )
+
+        cache = pos.PositionsSolverCache(solver=mock_solver, file_path=file_path)
+
+        positions = cache.solve(
+            lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert os.path.exists(file_path)
+
+        pos._solutions_cache.clear()
+
+        mock_solver = MockSolver(
+            solver=pos.PositionsFinder(grid=grid, pixel_scale_precision=0.01)
+        )
+
+        cache = pos.PositionsSolverCache(solver=mock_solver, file_path=file_path)
+
+        positions_loaded = cache.solve(
+            lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert mock_solver.source_plane_coordinates == []
+        assert positions_loaded.in_list == positions.in_list
+
+        pos._solutions_cache.clear()
+
+        monkeypatch.setattr(pos, "_solutions_file_version", 2)
+
+        cache = pos.PositionsSolverCache(solver=mock_solver, file_path=file_path)
+
+        assert cache.persisted_solutions == {}
+
+        cache.solve(
+            lensing_obj=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            source_plane_coordinate=(0.0, 0.11),
+        )
+
+        assert mock_solver.source_plane_coordinates == [(0.0, 0.11)]
+
+        shutil.rmtree(test_path)
+
 
 class TestGridRemoveDuplicates:
     def test__remove_duplicates_from_grid_within_tolerance(self):
@@ -237,6 +631,40 @@ class TestGridRemoveDuplicates:
 
         assert grid == [(1.0, 1.0), (2.0, 2.0), (4.0, 4.0), (5.0, 5.0), (3.0, 3.0)]
 
+    def test__tolerance_input__coordinates_in_neighboring_cells_are_duplicates(self):
+
+        grid = [(1.0, 1.0), (1.0001, 1.0001), (3.0, 3.0)]
+
+        grid = pos.grid_remove_duplicates(grid=np.asarray(grid), tolerance=0.001)
+
+        assert grid == [(1.0001, 1.0001), (3.0, 3.0)]
+
+        grid = [(0.0005, -0.0005), (-0.0005, 0.0005), (0.0, 0.003)]
+
+        grid = pos.grid_remove_duplicates(grid=np.asarray(grid), tolerance=0.0015)
+
+        assert grid == [(-0.0005, 0.0005), (0.0, 0.003)]
+
+    def test__large_grid__same_as_comparing_every_pair_of_coordinates(self):
+
+        np.random.seed(1)
+
+        grid = np.random.uniform(low=-1.0, high=1.0, size=(500, 2))
+        grid = np.concatenate((grid, grid[np.random.randint(0, 500, size=200)]))
+
+        grid_no_duplicates = pos.grid_remove_duplicates(grid=grid)
+
+        grid_no_duplicates_manual = [
+            (grid[i, 0], grid[i, 1])
+            for i in range(grid.shape[0])
+            if not np.any(
+                np.sqrt(np.sum(np.square(grid[i + 1 :] - grid[i]), axis=1)) < 1e-8
+            )
+        ]
+
+        assert len(grid_no_duplicates) < grid.shape[0]
+        assert grid_no_duplicates == grid_no_duplicates_manual
+
 
 class TestGridBuffedAroundCoordinate:
     def test__single_point_grid_buffed_correctly__upscale_factor_1(self):
@@ -574,6 +1002,170 @@ class TestGridBuffedAroundCoordinate:
         )
 
 
+class TestGridsBuffedAroundCoordinates:
+    def test__grids_of_every_coordinate_stacked(self):
+
+        grids_buffed_1d = pos.grids_buffed_around_coordinates_from(
+            coordinates=np.array([[0.0, 0.0], [1.0, 2.0]]),
+            pixel_scales=(1.0, 1.0),
+            buffer=1,
+            upscale_factor=2,
+        )
+
+        grid_buffed_0 = pos.grid_buffed_around_coordinate_from(
+            coordinate=(0.0, 0.0), pixel_scales=(1.0, 1.0), buffer=1, upscale_factor=2
+        )
+
+        grid_buffed_1 = pos.grid_buffed_around_coordinate_from(
+            coordinate=(1.0, 2.0), pixel_scales=(1.0, 1.0), buffer=1, upscale_factor=2
+        )
+
+        assert grids_buffed_1d.shape == (72, 2)
+        assert (grids_buffed_1d[0:36] == grid_buffed_0).all()
+        assert (grids_buffed_1d[36:72] == grid_buffed_1).all()
+
+
+class TestGridJacobianStencils:
+    def test__offsets_of_every_coordinate(self):
+
+        stencils_1d = pos.grid_jacobian_stencils_from(
+            grid_1d=np.array([[0.0, 0.0], [1.0, 2.0]]), step_size=0.1
+        )
+
+        assert stencils_1d == pytest.approx(
+            np.array(
+                [
+                    [0.0, 0.0],
+                    [0.1, 0.0],
+                    [-0.1, 0.0],
+                    [0.0, 0.1],
+                    [0.0, -0.1],
+                    [1.0, 2.0],
+                    [1.1, 2.0],
+                    [0.9, 2.0],
+                    [1.0, 2.1],
+                    [1.0, 1.9],
+                ]
+            ),
+            1.0e-8,
+        )
+
+
+class TestGridNewtonSteps:
+    def test__linear_lens_equation__step_solves_exactly(self):
+
+        grid_1d = np.array([[0.5, -0.3], [2.0, 1.0]])
+
+        stencils_1d = pos.grid_jacobian_stencils_from(grid_1d=grid_1d, step_size=0.01)
+
+        jacobian = np.array([[0.5, 0.2], [-0.1, 2.0]])
+
+        source_plane_stencils = np.matmul(stencils_1d, jacobian.T)
+
+        steps = pos.grid_newton_steps_from(
+            source_plane_stencils=source_plane_stencils,
+            source_plane_coordinate=(0.1, 0.2),
+            step_size=0.01,
+        )
+
+        assert np.matmul(grid_1d + steps, jacobian.T) == pytest.approx(
+            np.array([[0.1, 0.2], [0.1, 0.2]]), 1.0e-6
+        )
+
+    def test__singular_jacobian__step_is_nan(self):
+
+        stencils_1d = pos.grid_jacobian_stencils_from(
+            grid_1d=np.array([[0.5, -0.3]]), step_size=0.01
+        )
+
+        steps = pos.grid_newton_steps_from(
+            source_plane_stencils=np.zeros(stencils_1d.shape),
+            source_plane_coordinate=(0.1, 0.2),
+            step_size=0.01,
+        )
+
+        assert np.isnan(steps).all()
+
+
+class TestTriangles:
+    def test__triangles_from_grid_2d__masked_pixels_not_vertices(self):
+
+        grid_2d = np.array(
+            [
+                [[1.0, -1.0], [1.0, 0.0], [1.0, 1.0]],
+                [[0.0, -1.0], [0.0, 0.0], [0.0, 1.0]],
+            ]
+        )
+
+        triangles = pos.triangles_from_grid_2d(
+            grid_2d=grid_2d, mask_2d=np.full(shape=(2, 3), fill_value=False)
+        )
+
+        assert triangles.shape == (4, 3, 2)
+        assert (triangles[0] == np.array([[1.0, -1.0], [1.0, 0.0], [0.0, -1.0]])).all()
+        assert (triangles[1] == np.array([[1.0, 0.0], [0.0, 0.0], [0.0, -1.0]])).all()
+        assert (triangles[2] == np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 0.0]])).all()
+        assert (triangles[3] == np.array([[1.0, 1.0], [0.0, 1.0], [0.0, 0.0]])).all()
+
+        triangles = pos.triangles_from_grid_2d(
+            grid_2d=grid_2d,
+            mask_2d=np.array([[False, False, True], [False, False, False]]),
+        )
+
+        assert triangles.shape == (2, 3, 2)
+        assert (triangles[0] == np.array([[1.0, -1.0], [1.0, 0.0], [0.0, -1.0]])).all()
+
+    def test__triangles_subdivided__cover_triangle_with_half_size(self):
+
+        triangles = np.array([[[0.0, 0.0], [0.0, 2.0], [2.0, 0.0]]])
+
+        subdivided_triangles = pos.triangles_subdivided_from(triangles=triangles)
+
+        assert subdivided_triangles.shape == (4, 3, 2)
+        assert (
+            subdivided_triangles[0] == np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 0.0]])
+        ).all()
+        assert (
+            subdivided_triangles[3] == np.array([[0.0, 1.0], [1.0, 1.0], [1.0, 0.0]])
+        ).all()
+
+    def test__triangles_contain_coordinate__edges_included_degenerate_excluded(self):
+
+        triangles = np.array(
+            [
+                [[0.0, 0.0], [0.0, 2.0], [2.0, 0.0]],
+                [[0.0, 2.0], [2.0, 2.0], [2.0, 0.0]],
+                [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+            ]
+        )
+
+        contains = pos.triangles_contain_coordinate_from(
+            triangles=triangles, coordinate=(0.5, 0.5)
+        )
+
+        assert (contains == np.array([True, False, False])).all()
+
+        contains = pos.triangles_contain_coordinate_from(
+            triangles=triangles, coordinate=(1.0, 1.0)
+        )
+
+        assert (contains == np.array([True, True, False])).all()
+
+    def test__coordinate_interpolated__inverts_linear_mapping(self):
+
+        triangles = np.array([[[0.0, 0.0], [0.0, 2.0], [2.0, 0.0]]])
+
+        traced_triangles = 0.5 * triangles + 1.0
+
+        grid_1d = pos.triangles_coordinate_interpolated_from(
+            triangles=triangles,
+            traced_triangles=traced_triangles,
+            coordinate=(1.2, 1.3),
+        )
+
+        assert grid_1d == pytest.approx(np.array([[0.4, 0.6]]), 1.0e-8)
+
+
 class TestGridNeighbors1d:
     def test__creates_numpy_array_with_correct_neighbors(self):
 
@@ -770,6 +1362,113 @@ class TestGridPeaks:
         ).all()
 
 
+class TestGridPeaksMask:
+    def test__peaks_of_every_source_centre_found(self):
+
+        distances_2d = np.array(
+            [
+                [1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0],
+                [1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0],
+                [1.0, 1.0, 1.0, 1.0, np.nan, 1.0, 1.0, 1.0, 1.0],
+            ]
+        )
+
+        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(shape_1d=9)
+
+        peaks_mask = pos.grid_peaks_mask_from(
+            distances_2d=distances_2d,
+            neighbors=neighbors_1d.astype("int"),
+            has_neighbors=has_neighbors,
+        )
+
+        assert peaks_mask.shape == (3, 9)
+        assert (peaks_mask[0] == np.array([False] * 4 + [True] + [False] * 4)).all()
+        assert (peaks_mask[1] == np.full(shape=9, fill_value=False)).all()
+        assert (peaks_mask[2] == np.full(shape=9, fill_value=False)).all()
+
+    def test__same_as_grid_peaks_from_for_every_source_centre(self):
+
+        grid_1d = al.Grid.uniform(shape_2d=(5, 5), pixel_scales=1.0)
+
+        distances_2d = np.random.RandomState(seed=1).uniform(size=(3, 25))
+
+        neighbors_1d, has_neighbors = pos.grid_square_neighbors_1d_from(shape_1d=25)
+
+        peaks_mask = pos.grid_peaks_mask_from(
+            distances_2d=distances_2d,
+            neighbors=neighbors_1d.astype("int"),
+            has_neighbors=has_neighbors,
+        )
+
+        for source_index in range(3):
+
+            peaks_coordinates = pos.grid_peaks_from(
+                distance_1d=distances_2d[source_index],
+                grid_1d=grid_1d,
+                neighbors=neighbors_1d.astype("int"),
+                has_neighbors=has_neighbors,
+            )
+
+            assert (
+                np.asarray(grid_1d)[peaks_mask[source_index]]
+                == np.asarray(peaks_coordinates).reshape(-1, 2)
+            ).all()
+
+
+class TestGridsPeaks:
+    def test__peaks_of_each_grid_found__pixels_not_compared_across_grids(self):
+
+        distance_1d = np.array(
+            [1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0]
+            + [1.0, 1.0, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0, 0.0]
+        )
+
+        grid_1d = np.array(
+            [
+                [1.0, -1.0],
+                [1.0, 0.0],
+                [1.0, 1.0],
+                [0.0, -1.0],
+                [0.0, 0.0],
+                [0.0, 1.0],
+                [-1.0, -1.0],
+                [-1.0, 0.0],
+                [-1.0, 1.0],
+                [11.0, 9.0],
+                [11.0, 10.0],
+                [11.0, 11.0],
+                [10.0, 9.0],
+                [10.0, 10.0],
+                [10.0, 11.0],
+                [9.0, 9.0],
+                [9.0, 10.0],
+                [9.0, 11.0],
+            ]
+        )
+
+        peaks_coordinates = pos.grids_peaks_from(
+            distance_1d=distance_1d, grid_1d=grid_1d, total_grids=2
+        )
+
+        assert peaks_coordinates == [(0.0, 0.0)]
+
+        distance_1d[8] = 0.0
+
+        peaks_coordinates = pos.grids_peaks_from(
+            distance_1d=distance_1d, grid_1d=grid_1d, total_grids=2
+        )
+
+        assert peaks_coordinates == [(0.0, 0.0)]
+
+        distance_1d[17] = 1.0
+
+        peaks_coordinates = pos.grids_peaks_from(
+            distance_1d=distance_1d, grid_1d=grid_1d, total_grids=2
+        )
+
+        assert peaks_coordinates == [(0.0, 0.0), (10.0, 10.0)]
+
+
 class TestWithinDistance:
     def test__grid_keeps_only_points_within_distance(self):
 
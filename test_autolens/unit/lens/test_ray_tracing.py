@@ -1,4 +1,5 @@
 import autolens as al
+from autolens import exc
 import numpy as np
 import pytest
 import os
@@ -1137,6 +1138,99 @@ class TestAbstractTracerCosmology:
             1.0, 1e-4
         )
 
+    def test__scaling_factor_matrix__matches_scaling_factors_between_planes(self):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.1),
+                al.Galaxy(redshift=1.0),
+                al.Galaxy(redshift=2.0),
+                al.Galaxy(redshift=3.0),
+            ],
+            cosmology=cosmo.Planck15,
+        )
+
+        scaling_factor_matrix = tracer.scaling_factor_matrix
+
+        assert scaling_factor_matrix.shape == (4, 4)
+        assert scaling_factor_matrix[0, 1] == pytest.approx(0.9348, 1e-4)
+        assert scaling_factor_matrix[0, 2] == pytest.approx(0.984, 1e-4)
+        assert scaling_factor_matrix[1, 2] == pytest.approx(0.754, 1e-4)
+        assert scaling_factor_matrix[2, 3] == pytest.approx(1.0, 1e-4)
+        assert scaling_factor_matrix[1, 0] == 0.0
+
+        assert tracer.scaling_factor_between_planes(i=0, j=-1) == pytest.approx(
+            1.0, 1e-4
+        )
+
+    def test__scaling_factor_matrix__shared_by_tracers_with_same_redshifts(self):
+
+        tracer_0 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+        tracer_1 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+        tracer_2 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)]
+        )
+
+        assert tracer_0.scaling_factor_matrix is tracer_1.scaling_factor_matrix
+        assert tracer_0.scaling_factor_matrix is not tracer_2.scaling_factor_matrix
+
+        tracer_3 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+            cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+        )
+        tracer_4 = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+            cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+        )
+
+        assert tracer_3.scaling_factor_matrix is tracer_4.scaling_factor_matrix
+        assert tracer_3.scaling_factor_matrix is not tracer_0.scaling_factor_matrix
+
+    def test__cosmology_is_not_flrw__scaling_factors_and_traced_grids_use_cosmology(
+        self
+    ):
+        class MockCosmology:
+            def __getattr__(self, item):
+                return getattr(cosmo.Planck15, item)
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            ),
+            al.Galaxy(
+                redshift=1.0, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            ),
+            al.Galaxy(redshift=2.0),
+        ]
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies, cosmology=cosmo.Planck15)
+        mock_tracer = al.Tracer.from_galaxies(
+            galaxies=galaxies, cosmology=MockCosmology()
+        )
+
+        assert mock_tracer.scaling_factor_matrix is None
+        assert mock_tracer.scaling_factor_between_planes(i=0, j=1) == pytest.approx(
+            tracer.scaling_factor_between_planes(i=0, j=1), 1.0e-4
+        )
+
+        grid = al.Grid.manual_2d([[[1.0, 1.0], [0.5, -0.5]]], pixel_scales=1.0)
+
+        traced_grids = tracer.traced_grids_of_planes_from_grid(grid=grid)
+        mock_traced_grids = mock_tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+        for traced_grid, mock_traced_grid in zip(traced_grids, mock_traced_grids):
+            assert mock_traced_grid == pytest.approx(traced_grid, 1.0e-4)
+
+        batch_tracer = al.BatchTracer(tracers=[mock_tracer, mock_tracer])
+
+        batch_traced_grids = batch_tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+        assert batch_traced_grids[2][1] == pytest.approx(traced_grids[2], 1.0e-4)
+
     def test__6_galaxies__tracer_planes_are_correct(self):
 
         g0 = al.Galaxy(redshift=2.0)
@@ -1651,6 +1745,258 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+    class TestTracedGridsCache:
+        def test__same_grid_traced_twice__deflections_only_computed_once(
+            self, sub_grid_7x7, gal_x1_mp, monkeypatch
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            deflections_from_grid = tracer.planes[0].deflections_from_grid
+            calls = []
+
+            def counted_deflections_from_grid(grid):
+                calls.append(grid)
+                return deflections_from_grid(grid=grid)
+
+            monkeypatch.setattr(
+                tracer.planes[0], "deflections_from_grid", counted_deflections_from_grid
+            )
+
+            traced_grids_0 = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            traced_grids_1 = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert len(calls) == 1
+            assert (traced_grids_0[1] == traced_grids_1[1]).all()
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            assert len(calls) == 1
+            assert len(traced_grids) == 1
+
+        def test__plane_index_limit_traced_first__remaining_planes_traced_on_later_call(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_index_limit=0
+            )
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            tracer_no_cache = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_no_cache = tracer_no_cache.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert len(traced_grids) == 2
+            assert (traced_grids[1] == traced_grids_no_cache[1]).all()
+
+        def test__grid_changed_in_place__grid_is_retraced(
+            self, sub_grid_7x7, gal_x1_mp
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_0 = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            sub_grid_7x7[0] = np.array([2.0, 2.0])
+
+            traced_grids_1 = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert traced_grids_1[0][0] == pytest.approx(np.array([2.0, 2.0]), 1.0e-4)
+            assert (traced_grids_0[1][0] != traced_grids_1[1][0]).all()
+
+        def test__returned_grids_are_copies_of_cache(self, sub_grid_7x7, gal_x1_mp):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            traced_grids_0 = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            source_plane_grid = traced_grids_0[1].copy()
+
+            traced_grids_0[1][0] = np.array([100.0, 100.0])
+
+            traced_grids_1 = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            assert (traced_grids_1[1] == source_plane_grid).all()
+
+        def test__cache_size_is_bounded(self, gal_x1_mp):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[gal_x1_mp, al.Galaxy(redshift=1.0)]
+            )
+
+            for i in range(tracer.traced_grids_cache_size + 3):
+                tracer.traced_grids_of_planes_from_grid(
+                    grid=al.Grid.uniform(shape_2d=(3, 3), pixel_scales=1.0 + i)
+                )
+
+            assert len(tracer._traced_grids_cache) == tracer.traced_grids_cache_size
+
+    class TestTracedGridsOfPlanesFromGrids:
+        def test__grids_traced_in_single_pass__same_as_tracing_each_grid(
+            self, sub_grid_7x7, blurring_grid_7x7, monkeypatch
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=0.75, mass=al.mp.SphericalIsothermal(einstein_radius=0.5)
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            calls = []
+
+            for plane in tracer.planes:
+
+                def counted_deflections_from_grid(
+                    grid, deflections_from_grid=plane.deflections_from_grid
+                ):
+                    calls.append(grid.shape[0])
+                    return deflections_from_grid(grid=grid)
+
+                monkeypatch.setattr(
+                    plane, "deflections_from_grid", counted_deflections_from_grid
+                )
+
+            coordinates = np.array([[1.0, 1.0], [0.5, -0.5]])
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grids(
+                grid_list=[sub_grid_7x7, None, coordinates, blurring_grid_7x7],
+                plane_index_limits=[None, None, 1, 2],
+            )
+
+            assert calls == [
+                sub_grid_7x7.shape[0]
+                + blurring_grid_7x7.shape[0]
+                + coordinates.shape[0],
+                sub_grid_7x7.shape[0] + blurring_grid_7x7.shape[0],
+            ]
+
+            assert traced_grids_of_planes[1] is None
+            assert len(traced_grids_of_planes[0]) == 3
+            assert len(traced_grids_of_planes[2]) == 2
+            assert isinstance(traced_grids_of_planes[0][2], al.Grid)
+            assert (traced_grids_of_planes[0][2].mask == sub_grid_7x7.mask).all()
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            for traced_grids, grid in zip(
+                [
+                    traced_grids_of_planes[0],
+                    traced_grids_of_planes[2],
+                    traced_grids_of_planes[3],
+                ],
+                [sub_grid_7x7, coordinates, blurring_grid_7x7],
+            ):
+                for plane_index, traced_grid in enumerate(traced_grids):
+                    assert traced_grid == pytest.approx(
+                        tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index],
+                        1.0e-8,
+                    )
+
+    class TestAdaptiveTracing:
+        def test__linear_lens_mapping__only_pixel_corners_and_centres_traced__same_as_full_tracing(
+            self, sub_grid_7x7, monkeypatch
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5,
+                    shear=al.mp.ExternalShear(elliptical_comps=(0.1, 0.05)),
+                ),
+                al.Galaxy(redshift=1.0),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            adaptive_tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies, adaptive_tracing_tolerance=1.0e-8
+            )
+
+            deflections_from_grid = adaptive_tracer.planes[0].deflections_from_grid
+            calls = []
+
+            def counted_deflections_from_grid(grid):
+                calls.append(grid.shape[0])
+                return deflections_from_grid(grid=grid)
+
+            monkeypatch.setattr(
+                adaptive_tracer.planes[0],
+                "deflections_from_grid",
+                counted_deflections_from_grid,
+            )
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            adaptive_traced_grids = adaptive_tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert calls == [16 + 9]
+            assert type(adaptive_traced_grids[1]) == al.Grid
+            assert adaptive_traced_grids[1] == pytest.approx(traced_grids[1], 1.0e-8)
+
+        def test__tolerance_not_met__all_sub_pixels_traced__same_as_full_tracing(
+            self, sub_grid_7x7
+        ):
+
+            galaxies = [
+                al.Galaxy(
+                    redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+                ),
+                al.Galaxy(
+                    redshift=0.75, mass=al.mp.SphericalIsothermal(einstein_radius=0.5)
+                ),
+                al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=1.0)),
+            ]
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            adaptive_tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies, adaptive_tracing_tolerance=0.0
+            )
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+            adaptive_traced_grids = adaptive_tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert adaptive_traced_grids[1] == pytest.approx(traced_grids[1], 1.0e-8)
+            assert adaptive_traced_grids[2] == pytest.approx(traced_grids[2], 1.0e-8)
+            assert adaptive_tracer.image_from_grid(grid=sub_grid_7x7) == pytest.approx(
+                tracer.image_from_grid(grid=sub_grid_7x7), 1.0e-8
+            )
+
+            adaptive_tracer = al.Tracer.from_galaxies(
+                galaxies=galaxies, adaptive_tracing_tolerance=0.05
+            )
+
+            adaptive_traced_grids = adaptive_tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            assert np.max(np.abs(adaptive_traced_grids[2] - traced_grids[2])) < 0.05
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2669,7 +3015,7 @@ class TestAbstractTracerLensing:
 
     class TestLensingObject:
         def test__correct_einstein_mass_caclulated_for_multiple_mass_profiles__means_all_innherited_methods_work(
-            self
+            self,
         ):
             sis_0 = al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=0.2)
 
@@ -3133,8 +3479,42 @@ class TestAbstractTracerData:
                 grid=sub_grid_7x7, transformer=transformer_7x7_7
             )
 
-            assert (visibilities[0] == visibilities_0).all()
-            assert (visibilities[1] == visibilities_1).all()
+            assert visibilities[0] == pytest.approx(visibilities_0, 1.0e-8)
+            assert visibilities[1] == pytest.approx(visibilities_1, 1.0e-8)
+
+        def test__visibilities_of_images_from_transformer__same_as_transforming_each_image(
+            self, sub_grid_7x7, sub_mask_7x7
+        ):
+
+            image_0 = al.lp.EllipticalSersic(intensity=1.0).image_from_grid(
+                grid=sub_grid_7x7
+            )
+            image_1 = al.lp.EllipticalExponential(intensity=2.0).image_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            uv_wavelengths = np.array(
+                [[-55636.4609375, 171376.90625], [-6903.21923828, 51155.578125]]
+            )
+
+            for preload_transform in [True, False]:
+
+                transformer = al.TransformerDFT(
+                    uv_wavelengths=uv_wavelengths,
+                    real_space_mask=sub_mask_7x7,
+                    preload_transform=preload_transform,
+                )
+
+                visibilities = al.lens.ray_tracing.visibilities_of_images_from_transformer(
+                    images=[image_0, image_1], transformer=transformer
+                )
+
+                assert visibilities[0] == pytest.approx(
+                    transformer.visibilities_from_image(image=image_0), 1.0e-8
+                )
+                assert visibilities[1] == pytest.approx(
+                    transformer.visibilities_from_image(image=image_1), 1.0e-8
+                )
 
         def test__galaxy_visibilities_dict_from_grid_and_transformer(
             self, sub_grid_7x7, transformer_7x7_7
@@ -4093,6 +4473,97 @@ class TestTacerFixedSlices:
             assert traced_grids[3][1] == pytest.approx(np.array([2.0, 0.0]), 1e-4)
 
 
+class TestBatchTracer:
+    def test__traced_grids_of_planes__same_as_each_tracer(self, sub_grid_7x7):
+
+        galaxies_list = [
+            [
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.EllipticalIsothermal(
+                        centre=(0.1 * i, 0.0), einstein_radius=1.0 + 0.1 * i
+                    ),
+                ),
+                al.Galaxy(
+                    redshift=1.0,
+                    mass=al.mp.SphericalIsothermal(einstein_radius=0.2 * i),
+                ),
+                al.Galaxy(redshift=2.0),
+            ]
+            for i in range(3)
+        ]
+
+        batch_tracer = al.BatchTracer.from_galaxies_list(galaxies_list=galaxies_list)
+
+        traced_grids_of_planes = batch_tracer.traced_grids_of_planes_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        assert batch_tracer.total_tracers == 3
+        assert len(traced_grids_of_planes) == 3
+        assert traced_grids_of_planes[2].shape == (3, sub_grid_7x7.shape[0], 2)
+
+        for tracer_index, galaxies in enumerate(galaxies_list):
+
+            tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+            traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+            for plane_index in range(3):
+                assert traced_grids_of_planes[plane_index][
+                    tracer_index
+                ] == pytest.approx(np.asarray(traced_grids[plane_index]), 1.0e-8)
+
+        traced_grids_of_planes = batch_tracer.traced_grids_of_planes_from_grid(
+            grid=sub_grid_7x7, plane_index_limit=1
+        )
+
+        assert len(traced_grids_of_planes) == 2
+
+    def test__tracers_with_different_plane_redshifts__raises_exception(self):
+
+        with pytest.raises(exc.TracerException):
+            al.BatchTracer.from_galaxies_list(
+                galaxies_list=[
+                    [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)],
+                    [al.Galaxy(redshift=0.5), al.Galaxy(redshift=2.0)],
+                ]
+            )
+
+    def test__tracers_with_equal_but_separate_cosmologies__batched_by_value(self):
+
+        galaxies = [al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+
+        batch_tracer = al.BatchTracer(
+            tracers=[
+                al.Tracer.from_galaxies(
+                    galaxies=galaxies,
+                    cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+                ),
+                al.Tracer.from_galaxies(
+                    galaxies=galaxies,
+                    cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+                ),
+            ]
+        )
+
+        assert batch_tracer.total_tracers == 2
+
+        with pytest.raises(exc.TracerException):
+            al.BatchTracer(
+                tracers=[
+                    al.Tracer.from_galaxies(
+                        galaxies=galaxies,
+                        cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+                    ),
+                    al.Tracer.from_galaxies(
+                        galaxies=galaxies,
+                        cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.25),
+                    ),
+                ]
+            )
+
+
 class TestRegression:
     def test__centre_of_profile_in_right_place(self):
         grid = al.Grid.uniform(shape_2d=(7, 7), pixel_scales=1.0)
@@ -4457,3 +4928,63 @@ class TestDecorators:
         grid = al.Grid.from_mask(mask=mask)
         traced_grids_no_interp = tracer.traced_grids_of_planes_from_grid(grid=grid)
         assert (traced_grids[1][0, 0] != traced_grids_no_interp[1][0, 0]).all()
+
+    def test__grid_interp_in__multi_plane__deflections_of_each_plane_interpolated_from_traced_grid_interp(
+        self,
+    ):
+        # True in interpolate.ini
+
+        mask = al.Mask.manual(
+            mask=[
+                [True, True, True, True, True],
+                [True, False, False, False, True],
+                [True, False, False, False, True],
+                [True, False, False, False, True],
+                [True, True, True, True, True],
+            ],
+            pixel_scales=(1.0, 1.0),
+        )
+
+        grid_interp = al.GridInterpolate.from_mask(mask=mask, pixel_scales_interp=0.1)
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(einstein_radius=1.0, centre=(0.1, 0.1)),
+            ),
+            al.Galaxy(
+                redshift=0.75,
+                mass=al.mp.SphericalIsothermal(einstein_radius=0.5, centre=(0.3, 0.2)),
+            ),
+            al.Galaxy(redshift=1.0),
+        ]
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        traced_grids = tracer.traced_grids_of_planes_from_grid(grid=grid_interp)
+
+        traced_grids_interp = tracer.traced_grids_of_planes_from_grid(
+            grid=grid_interp.grid_interp
+        )
+
+        deflections_0 = grid_interp.interpolated_grid_from_grid_interp(
+            grid_interp=tracer.planes[0].deflections_from_grid(
+                grid=traced_grids_interp[0]
+            )
+        )
+        deflections_1 = grid_interp.interpolated_grid_from_grid_interp(
+            grid_interp=tracer.planes[1].deflections_from_grid(
+                grid=traced_grids_interp[1]
+            )
+        )
+
+        source_plane_grid = (
+            grid_interp
+            - tracer.scaling_factor_between_planes(i=0, j=2) * deflections_0
+            - tracer.scaling_factor_between_planes(i=1, j=2) * deflections_1
+        )
+
+        assert isinstance(traced_grids[2], al.GridInterpolate)
+        assert (traced_grids[1].grid_interp == traced_grids_interp[1]).all()
+        assert (traced_grids[2].grid_interp == traced_grids_interp[2]).all()
+        assert traced_grids[2] == pytest.approx(source_plane_grid, 1.0e-8)
@@ -53,6 +53,8 @@ class TestCheckPositionsTrace:
             tracer=tracer, positions=al.GridCoordinates([[(1.0, 1.0), (2.0, 2.0)]])
         )
 
+        assert len(tracer._traced_grids_cache) == 0
+
         settings = al.SettingsLens(positions_threshold=0.0)
         with pytest.raises(exc.RayTracingException):
             settings.check_positions_trace_within_threshold_via_tracer(
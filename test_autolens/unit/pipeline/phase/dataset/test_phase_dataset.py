@@ -1,9 +1,11 @@
 from os import path
 
+import autofit as af
 import autolens as al
 import numpy as np
 import pytest
 from autolens import exc
+from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 from test_autolens import mock
 
 pytestmark = pytest.mark.filterwarnings(
@@ -489,3 +491,55 @@ class TestAutoPositions:
         )
 
         assert analysis.settings.settings_lens.positions_threshold == None
+
+
+class TestMassModelIsFixed:
+    def test__fixed_only_if_no_mass_profile_or_redshift_is_free(self):
+        def model_from(lens):
+            return af.CollectionPriorModel(
+                galaxies=af.CollectionPriorModel(
+                    lens=lens,
+                    source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+                )
+            )
+
+        model = model_from(
+            lens=al.GalaxyModel(
+                redshift=0.5,
+                light=al.lp.EllipticalSersic,
+                mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+        )
+
+        assert analysis_dataset.mass_model_is_fixed_from(model=model) is True
+
+        model = model_from(
+            lens=al.GalaxyModel(
+                redshift=0.5, light=al.lp.EllipticalSersic, mass=al.mp.SphericalIsothermal
+            )
+        )
+
+        assert analysis_dataset.mass_model_is_fixed_from(model=model) is False
+
+        lens = al.GalaxyModel(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic,
+            mass=al.mp.SphericalIsothermal,
+        )
+        lens.mass.einstein_radius = 1.0
+        lens.mass.centre = lens.light.centre
+
+        model = model_from(lens=lens)
+
+        assert analysis_dataset.mass_model_is_fixed_from(model=model) is False
+
+        model = model_from(
+            lens=al.GalaxyModel(
+                redshift=al.Redshift,
+                mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+        )
+
+        assert analysis_dataset.mass_model_is_fixed_from(model=model) is False
+
+        assert analysis_dataset.mass_model_is_fixed_from(model=None) is False
@@ -1,8 +1,10 @@
 from os import path
 
+import autofit as af
 import autolens as al
 import numpy as np
 import pytest
+import shutil
 from test_autolens import mock
 
 pytestmark = pytest.mark.filterwarnings(
@@ -167,3 +169,134 @@ class TestResult:
             6,
             2,
         )
+
+    def test__max_log_likelihood_fit_and_hyper_images__computed_once(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens = al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0))
+        source = al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=2.0))
+
+        instance = af.ModelInstance()
+        instance.galaxies = af.ModelInstance()
+        instance.galaxies.lens = lens
+        instance.galaxies.source = source
+
+        samples = mock.MockSamples(max_log_likelihood_instance=instance)
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase", search=mock.MockSearch(samples=samples)
+        )
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert result.max_log_likelihood_fit is result.max_log_likelihood_fit
+        assert result.image_galaxy_dict is result.image_galaxy_dict
+        assert result.hyper_model_image is result.hyper_model_image
+
+        fit = result.max_log_likelihood_fit
+
+        for path, galaxy in result.path_galaxy_tuples:
+            assert result.image_galaxy_dict[path] == pytest.approx(
+                fit.galaxy_model_image_dict[galaxy], 1.0e-4
+            )
+
+        assert result.hyper_model_image == pytest.approx(
+            sum(result.hyper_galaxy_image_path_dict.values()), 1.0e-4
+        )
+
+    def test__galaxy_images__persisted_and_loaded_from_output_path(
+        self, imaging_7x7, mask_7x7
+    ):
+        lens = al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0))
+        source = al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=2.0))
+
+        instance = af.ModelInstance()
+        instance.galaxies = af.ModelInstance()
+        instance.galaxies.lens = lens
+        instance.galaxies.source = source
+
+        samples = mock.MockSamples(max_log_likelihood_instance=instance)
+        samples.parameters = [[0.0], [1.0], [2.0]]
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase_galaxy_images",
+            search=mock.MockSearch(samples=samples),
+        )
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        shutil.rmtree(path.dirname(result.galaxy_images_path), ignore_errors=True)
+
+        image_galaxy_dict = result.image_galaxy_dict
+
+        for galaxy_path in image_galaxy_dict:
+            assert path.isfile(result.galaxy_image_file_path_from(galaxy_path))
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        loaded_image_galaxy_dict = result.image_galaxy_dict
+
+        assert "max_log_likelihood_fit" not in result.__dict__
+
+        for galaxy_path, galaxy_image in image_galaxy_dict.items():
+
+            loaded_galaxy_image = loaded_image_galaxy_dict[galaxy_path]
+
+            assert loaded_galaxy_image == pytest.approx(galaxy_image, 1.0e-8)
+            assert (loaded_galaxy_image.mask == galaxy_image.mask).all()
+            assert loaded_galaxy_image.mask.sub_size == galaxy_image.mask.sub_size
+
+        shutil.rmtree(path.dirname(result.galaxy_images_path), ignore_errors=True)
+
+    def test__galaxy_images_path__depends_on_mask_and_dataset(
+        self, imaging_7x7, mask_7x7, mask_7x7_1_pix
+    ):
+        lens = al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0))
+
+        instance = af.ModelInstance()
+        instance.galaxies = af.ModelInstance()
+        instance.galaxies.lens = lens
+
+        samples = mock.MockSamples(max_log_likelihood_instance=instance)
+        samples.parameters = [[0.0], [1.0], [2.0]]
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase_galaxy_images",
+            search=mock.MockSearch(samples=samples),
+        )
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        galaxy_images_path = result.galaxy_images_path
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert result.galaxy_images_path == galaxy_images_path
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7_1_pix, results=mock.MockResults()
+        )
+
+        assert result.galaxy_images_path != galaxy_images_path
+
+        imaging_7x7 = al.Imaging(
+            image=2.0 * imaging_7x7.image,
+            noise_map=imaging_7x7.noise_map,
+            psf=imaging_7x7.psf,
+        )
+
+        result = phase_imaging_7x7.run(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert result.galaxy_images_path != galaxy_images_path
@@ -0,0 +1,361 @@
+import autolens as al
+import numpy as np
+import os
+import pytest
+from autolens.dataset import shared
+from autolens.pipeline.phase.dataset import analysis as analysis_dataset
+from test_autolens import mock
+
+pytestmark = pytest.mark.filterwarnings(
+    "ignore:Using a non-tuple sequence for multidimensional indexing is deprecated; use `arr[tuple(seq)]` instead of "
+    "`arr[seq]`. In the future this will be interpreted as an arrays index, `arr[np.arrays(seq)]`, which will result "
+    "either in an error or a different result."
+)
+
+
+class TestLogLikelihoodFunctionBatch:
+    def test__batch_log_likelihoods_match_serial_log_likelihoods(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        unit_vectors = [
+            [0.5] * phase_imaging_7x7.model.prior_count,
+            [0.4] * phase_imaging_7x7.model.prior_count,
+            [0.6] * phase_imaging_7x7.model.prior_count,
+        ]
+
+        instances = [
+            phase_imaging_7x7.model.instance_from_unit_vector(unit_vector)
+            for unit_vector in unit_vectors
+        ]
+
+        log_likelihoods = [
+            analysis.log_likelihood_function(instance=instance)
+            for instance in instances
+        ]
+
+        try:
+            log_likelihoods_batch = analysis.log_likelihood_function_batch(
+                instances=instances, number_of_cores=2
+            )
+
+            assert log_likelihoods_batch == pytest.approx(log_likelihoods, 1.0e-8)
+
+            pool = analysis.batch_pool_from_number_of_cores(number_of_cores=2)
+
+            analysis.log_likelihood_function_batch(
+                instances=instances, number_of_cores=2
+            )
+
+            assert analysis.batch_pool_from_number_of_cores(number_of_cores=2) is pool
+        finally:
+            analysis.close_batch_pool()
+
+        log_likelihoods_serial = analysis.log_likelihood_function_batch(
+            instances=instances, number_of_cores=1
+        )
+
+        assert log_likelihoods_serial == pytest.approx(log_likelihoods, 1.0e-8)
+
+    def test__batch_pool_and_shared_dataset_closed_when_search_finishes_or_raises(
+        self, imaging_7x7, mask_7x7, monkeypatch
+    ):
+        monkeypatch.setattr(
+            analysis_dataset.mp, "get_all_start_methods", lambda: ["spawn"]
+        )
+
+        batch = {}
+
+        def _fit(search, model, analysis):
+
+            instance = model.instance_from_unit_vector([0.5] * model.prior_count)
+
+            analysis.log_likelihood_function_batch(
+                instances=[instance, instance], number_of_cores=2
+            )
+
+            batch["pool"] = analysis._batch_pool
+            batch["file_path"] = analysis._batch_shared_dataset.file_path
+
+            assert os.path.exists(batch["file_path"])
+
+            if batch["exception"] is not None:
+                raise batch["exception"]
+
+            return fit(search, model=model, analysis=analysis)
+
+        fit = mock.MockSearch._fit
+
+        monkeypatch.setattr(mock.MockSearch, "_fit", _fit)
+
+        for exception in [None, ValueError()]:
+
+            batch["exception"] = exception
+
+            search = mock.MockSearch()
+            search.skip_completed = False
+
+            phase_imaging_7x7 = al.PhaseImaging(
+                phase_name="test_phase",
+                galaxies=dict(
+                    lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic),
+                    source=al.Galaxy(redshift=1.0),
+                ),
+                search=search,
+            )
+
+            try:
+                phase_imaging_7x7.run(
+                    dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+                )
+            except ValueError:
+                assert exception is not None
+
+            assert not any(worker.is_alive() for worker in batch["pool"]._pool)
+            assert not os.path.exists(batch["file_path"])
+
+    def test__analysis_used_as_context_manager__batch_pool_closed_on_exit(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.GalaxyModel(redshift=0.5, light=al.lp.EllipticalSersic),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        with analysis:
+            pool = analysis.batch_pool_from_number_of_cores(number_of_cores=2)
+
+        assert analysis._batch_pool is None
+        assert not any(worker.is_alive() for worker in pool._pool)
+
+    def test__analysis_via_shared_dataset__workspace_is_writeable_and_fits_pixelization(
+        self, tmp_path
+    ):
+        imaging = al.Imaging(
+            image=al.Array.ones(shape_2d=(17, 17), pixel_scales=0.1),
+            psf=al.Kernel.ones(shape_2d=(3, 3), pixel_scales=0.1),
+            noise_map=al.Array.full(
+                fill_value=2.0, shape_2d=(17, 17), pixel_scales=0.1
+            ),
+        )
+
+        mask = al.Mask.circular(shape_2d=(17, 17), pixel_scales=0.1, radius=0.75)
+
+        assert mask.pixels_in_mask > 128
+
+        phase_imaging = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(
+                    redshift=1.0,
+                    pixelization=al.pix.Rectangular(shape=(3, 3)),
+                    regularization=al.reg.Constant(),
+                ),
+            ),
+            hyper_background_noise=al.hyper_data.HyperBackgroundNoise,
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging.make_analysis(
+            dataset=imaging, mask=mask, results=mock.MockResults()
+        )
+
+        instance = phase_imaging.model.instance_from_unit_vector(
+            [0.5] * phase_imaging.model.prior_count
+        )
+
+        log_evidence = analysis.log_likelihood_function(instance=instance)
+
+        shared_dataset = shared.SharedDataset.from_dataset(
+            dataset=analysis, directory=str(tmp_path)
+        )
+
+        try:
+            attached_analysis = shared_dataset.attach()
+
+            assert attached_analysis.masked_imaging.noise_map.flags.writeable is False
+            assert attached_analysis.fit_imaging_workspace.noise_map.flags.writeable
+            assert attached_analysis.fit_imaging_workspace.model_image.flags.writeable
+
+            assert attached_analysis.log_likelihood_function(
+                instance=instance
+            ) == pytest.approx(log_evidence, 1.0e-8)
+        finally:
+            shared_dataset.unlink()
+
+    def test__fit_exception__log_likelihood_is_minus_infinity(
+        self, imaging_7x7, mask_7x7
+    ):
+        imaging_7x7.positions = al.GridCoordinates([[(1.0, 100.0), (200.0, 2.0)]])
+
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(positions_threshold=0.01)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        log_likelihoods = analysis.log_likelihood_function_batch(
+            instances=[instance], number_of_cores=1
+        )
+
+        assert log_likelihoods == [-np.inf]
+
+
+class TestTracerForInstance:
+    def test__adaptive_tracing_tolerance_of_settings_lens_passed_to_tracer(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal()),
+                source=al.Galaxy(redshift=1.0),
+            ),
+            settings=al.SettingsPhaseImaging(
+                settings_lens=al.SettingsLens(adaptive_tracing_tolerance=0.01)
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+        instance = phase_imaging_7x7.model.instance_from_unit_vector([])
+
+        tracer = analysis.tracer_for_instance(instance=instance)
+
+        assert tracer.adaptive_tracing_tolerance == 0.01
+
+    def test__fixed_mass_model__traced_grids_cache_shared_between_tracers(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic,
+                    mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        instance_0 = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+        instance_1 = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.4] * phase_imaging_7x7.model.prior_count
+        )
+
+        assert analysis.mass_model_is_fixed is True
+
+        log_likelihood_0 = analysis.log_likelihood_function(instance=instance_0)
+
+        tracer_1 = analysis.tracer_for_instance(instance=instance_1)
+        analysis.share_traced_grids_cache_with_tracer(tracer=tracer_1)
+
+        assert tracer_1._traced_grids_cache is analysis._traced_grids_cache
+        assert len(tracer_1._traced_grids_cache) > 0
+
+        log_likelihood_1 = analysis.log_likelihood_function(instance=instance_1)
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert log_likelihood_0 == pytest.approx(
+            analysis.log_likelihood_function(instance=instance_0), 1.0e-8
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert log_likelihood_1 == pytest.approx(
+            analysis.log_likelihood_function(instance=instance_1), 1.0e-8
+        )
+
+        tracer_1 = analysis.tracer_for_instance(instance=instance_1)
+        analysis.share_traced_grids_cache_with_tracer(tracer=tracer_1)
+
+        assert len(tracer_1._traced_grids_cache) > 0
+
+        instance_1.galaxies.lens.mass.einstein_radius = 2.0
+
+        tracer_2 = analysis.tracer_for_instance(instance=instance_1)
+        analysis.share_traced_grids_cache_with_tracer(tracer=tracer_2)
+
+        assert tracer_2._traced_grids_cache is not tracer_1._traced_grids_cache
+        assert len(tracer_2._traced_grids_cache) == 0
+
+    def test__free_mass_model__traced_grids_cache_not_shared_or_hashed(
+        self, imaging_7x7, mask_7x7
+    ):
+        phase_imaging_7x7 = al.PhaseImaging(
+            phase_name="test_phase",
+            galaxies=dict(
+                lens=al.GalaxyModel(
+                    redshift=0.5,
+                    light=al.lp.EllipticalSersic(intensity=1.0),
+                    mass=al.mp.SphericalIsothermal,
+                ),
+                source=al.GalaxyModel(redshift=1.0, light=al.lp.EllipticalSersic),
+            ),
+            search=mock.MockSearch(),
+        )
+
+        analysis = phase_imaging_7x7.make_analysis(
+            dataset=imaging_7x7, mask=mask_7x7, results=mock.MockResults()
+        )
+
+        assert analysis.mass_model_is_fixed is False
+
+        instance = phase_imaging_7x7.model.instance_from_unit_vector(
+            [0.5] * phase_imaging_7x7.model.prior_count
+        )
+
+        analysis.log_likelihood_function(instance=instance)
+
+        tracer = analysis.tracer_for_instance(instance=instance)
+        analysis.share_traced_grids_cache_with_tracer(tracer=tracer)
+
+        assert len(tracer._traced_grids_cache) == 0
+        assert getattr(analysis, "_traced_grids_mass_model_hash", None) is None
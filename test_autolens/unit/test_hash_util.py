@@ -0,0 +1,34 @@
+import autolens as al
+from autolens import hash_util
+
+
+class TestHashFromObject:
+    def test__same_for_identical_mass_model_only(self):
+        def tracer_from(einstein_radius, intensity):
+
+            lens = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(0.0, 0.0), einstein_radius=einstein_radius
+                ),
+            )
+
+            source = al.Galaxy(
+                redshift=1.0, light=al.lp.SphericalSersic(intensity=intensity)
+            )
+
+            return al.Tracer.from_galaxies(galaxies=[lens, source])
+
+        tracer_hash = hash_util.hash_from_object(
+            obj=tracer_from(einstein_radius=1.0, intensity=1.0)
+        )
+
+        assert tracer_hash == hash_util.hash_from_object(
+            obj=tracer_from(einstein_radius=1.0, intensity=1.0)
+        )
+        assert tracer_hash == hash_util.hash_from_object(
+            obj=tracer_from(einstein_radius=1.0, intensity=2.0)
+        )
+        assert tracer_hash != hash_util.hash_from_object(
+            obj=tracer_from(einstein_radius=1.1, intensity=1.0)
+        )